@@ -34,6 +34,7 @@ class AgentState(TypedDict):
     final_analysis: Optional[CandidateAnalysis]
     weight_mode: Optional[str]
     custom_weights: Optional[Dict[str, float]]
+    linkedin_export_id: Optional[str]
     errors: List[str]
 
 def safe_analysis_wrapper(analysis_func, task_name):
@@ -100,7 +101,8 @@ class HiringAgentOrchestrator:
         job_description: JobDescription,
         weight_mode: Optional[str] = "professional",
         custom_weights: Optional[Dict[str, float]] = None,
-        progress_callback = None
+        progress_callback = None,
+        linkedin_export_id: Optional[str] = None
     ) -> AgentState:
         
         initial_state: AgentState = {
@@ -159,6 +161,7 @@ class HiringAgentOrchestrator:
             "final_analysis": None,
             "weight_mode": weight_mode,
             "custom_weights": custom_weights,
+            "linkedin_export_id": linkedin_export_id,
             "errors": []
         }
         
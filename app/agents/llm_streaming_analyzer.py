@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Dict, Any
 import asyncio
 from langchain_openai import ChatOpenAI
+from app.utils.resilience import llm_circuit_breaker
 from langchain.schema import HumanMessage, SystemMessage
 
 async def generate_llm_streaming_analysis(
@@ -25,7 +26,7 @@ async def generate_llm_streaming_analysis(
         
         # Initialize LLM
         from config.settings import settings
-        llm = ChatOpenAI(model=settings.get_model(), temperature=0.3)
+        llm = ChatOpenAI(model=settings.get_model(), temperature=0.3, callbacks=[llm_circuit_breaker])
         
         # Extract all available data for context
         resume = state['resume']
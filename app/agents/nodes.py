@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
+from app.utils.resilience import llm_circuit_breaker
 from langchain.schema import HumanMessage, SystemMessage
 
 load_dotenv()
@@ -15,15 +16,16 @@ from app.models.schemas import (
     CandidateAnalysis, TaskProgress, AnalysisStatus, Platform
 )
 from app.services.github_service import GitHubService
-from app.services.linkedin_service import LinkedInService
+from app.services.linkedin_service import LinkedInService, linkedin_export_store
 from app.services.twitter_service import TwitterService
 from app.services.medium_service import MediumService
+from app.utils.snapshot_store import platform_snapshots, profile_username
 from app.services.project_service import ProjectService
 from app.services.company_service import CompanyService
 from config.settings import settings
 from app.agents.llm_streaming_analyzer import generate_llm_streaming_analysis
 
-llm = ChatOpenAI(model=settings.get_model(), temperature=0.1)
+llm = ChatOpenAI(model=settings.get_model(), temperature=0.1, callbacks=[llm_circuit_breaker])
 
 async def send_thinking_update(state: Dict[str, Any], content: str):
     """Send thinking update to WebSocket if available"""
@@ -49,6 +51,19 @@ def update_task_progress(state: Dict[str, Any], task_id: str, status: AnalysisSt
                 task.progress_percentage = 100.0
             break
 
+def project_score(analysis) -> float:
+    """Average of the scores that apply to the project's kind"""
+    if getattr(analysis, 'repository', None):
+        # Repository links have no live site to measure
+        return (getattr(analysis, 'complexity_score', 0) + (getattr(analysis, 'code_quality_score', 0) or 0)) / 2
+    # Average of complexity, performance, responsiveness, and SEO scores
+    return (
+        getattr(analysis, 'complexity_score', 0) +
+        getattr(analysis, 'performance_score', 0) + 
+        getattr(analysis, 'responsiveness_score', 0) +
+        getattr(analysis, 'seo_score', 0)
+    ) / 4
+
 async def resume_jd_matcher(state: Dict[str, Any]) -> Dict[str, Any]:
     update_task_progress(state, "resume_jd_match", AnalysisStatus.IN_PROGRESS, "Analyzing resume and job description match")
     
@@ -208,7 +223,7 @@ async def github_analyzer(state: Dict[str, Any]) -> Dict[str, Any]:
             return state
         
         github_url = str(github_profiles[0].url)
-        username = github_url.split('/')[-1]
+        username = profile_username(github_profiles[0])
         
         # Send initial thinking update
         thinking_content = f"""### GitHub Analysis
@@ -225,7 +240,10 @@ async def github_analyzer(state: Dict[str, Any]) -> Dict[str, Any]:
         
         # Create GitHub service and analyze
         github_service = GitHubService()
-        analysis = await github_service.analyze_profile(username, state["job_description"].domain)
+        domain = state["job_description"].domain
+        analysis = await platform_snapshots.get_or_fetch(
+            "github", username, domain, lambda: github_service.analyze_profile(username, domain), GitHubAnalysis
+        )
         
         if not analysis:
             await send_thinking_update(state, "❌ **GitHub service returned no data**")
@@ -234,6 +252,11 @@ async def github_analyzer(state: Dict[str, Any]) -> Dict[str, Any]:
         
         state["github_analysis"] = analysis
         
+        if analysis.unavailable_reason == "not_found":
+            await send_thinking_update(state, f"❌ **GitHub user @{username} does not exist** - skipping repository analysis")
+            update_task_progress(state, "github_analyze", AnalysisStatus.COMPLETED, f"GitHub user {username} not found", score=0)
+            return state
+        
         # Send detailed results with safe access
         result_thinking = f"""✅ **GitHub Analysis Complete for @{username}**
 
@@ -299,25 +322,35 @@ async def linkedin_analyzer(state: Dict[str, Any]) -> Dict[str, Any]:
     try:
         resume = state["resume"]
         linkedin_profiles = [p for p in resume.social_profiles if p.platform == Platform.LINKEDIN]
+        export_id = state.get("linkedin_export_id")
+        export = linkedin_export_store.get(export_id) if export_id else None
         
-        if not linkedin_profiles:
+        if not linkedin_profiles and export is None:
             update_task_progress(state, "linkedin_analyze", AnalysisStatus.COMPLETED, "No LinkedIn profile found", score=0)
             return state
         
         linkedin_service = LinkedInService()
-        linkedin_url = str(linkedin_profiles[0].url)
+        linkedin_url = str(linkedin_profiles[0].url) if linkedin_profiles else ""
         
-        analysis = await linkedin_service.analyze_profile(linkedin_url, state["job_description"].domain)
+        if export is not None:
+            # The uploaded export is read locally; the public page is usually a login wall
+            analysis = linkedin_service.analyze_export(export, state["job_description"].domain, linkedin_url)
+        else:
+            analysis = await linkedin_service.analyze_profile(linkedin_url, state["job_description"].domain)
         state["linkedin_analysis"] = analysis
         
         # Use domain relevance score as the main LinkedIn score, but ensure it's reasonable
         linkedin_score = getattr(analysis, 'domain_relevance_score', 0)
         
-        # If no technical posts found, set score to 0
+        # If no technical posts found on a scraped profile, set score to 0
         technical_posts = getattr(analysis, 'technical_posts_count', 0)
-        if technical_posts == 0:
+        if technical_posts == 0 and not analysis.source:
             linkedin_score = 0
         
+        if analysis.unavailable_reason:
+            update_task_progress(state, "linkedin_analyze", AnalysisStatus.COMPLETED, f"LinkedIn profile unavailable ({analysis.unavailable_reason})", score=0)
+            return state
+        
         update_task_progress(state, "linkedin_analyze", AnalysisStatus.COMPLETED, "LinkedIn analysis completed", score=linkedin_score)
         
     except Exception as e:
@@ -338,10 +371,12 @@ async def twitter_analyzer(state: Dict[str, Any]) -> Dict[str, Any]:
             return state
         
         twitter_service = TwitterService()
-        twitter_url = str(twitter_profiles[0].url)
-        username = twitter_url.split('/')[-1]
+        username = profile_username(twitter_profiles[0])
+        domain = state["job_description"].domain
         
-        analysis = await twitter_service.analyze_profile(username, state["job_description"].domain)
+        analysis = await platform_snapshots.get_or_fetch(
+            "twitter", username, domain, lambda: twitter_service.analyze_profile(username, domain), TwitterAnalysis
+        )
         
         # Check if analysis is valid and has meaningful content
         if not analysis:
@@ -359,6 +394,10 @@ async def twitter_analyzer(state: Dict[str, Any]) -> Dict[str, Any]:
             if technical_tweets == 0 or followers == 0:
                 twitter_score = 0
         
+        if analysis and analysis.unavailable_reason:
+            update_task_progress(state, "twitter_analyze", AnalysisStatus.COMPLETED, f"Twitter profile @{username} unavailable ({analysis.unavailable_reason})", score=0)
+            return state
+        
         update_task_progress(state, "twitter_analyze", AnalysisStatus.COMPLETED, f"Twitter analysis completed for @{username}", score=twitter_score)
         
     except Exception as e:
@@ -379,10 +418,12 @@ async def medium_analyzer(state: Dict[str, Any]) -> Dict[str, Any]:
             return state
         
         medium_service = MediumService()
-        medium_url = str(medium_profiles[0].url)
-        username = medium_url.split('@')[-1] if '@' in medium_url else medium_url.split('/')[-1]
+        username = profile_username(medium_profiles[0])
+        domain = state["job_description"].domain
         
-        analysis = await medium_service.analyze_profile(username, state["job_description"].domain)
+        analysis = await platform_snapshots.get_or_fetch(
+            "medium", username, domain, lambda: medium_service.analyze_profile(username, domain), MediumAnalysis
+        )
         
         # Check if analysis is valid and has meaningful content
         if not analysis:
@@ -400,6 +441,10 @@ async def medium_analyzer(state: Dict[str, Any]) -> Dict[str, Any]:
             if articles_count == 0 or domain_relevant_articles == 0:
                 medium_score = 0
         
+        if analysis and analysis.unavailable_reason:
+            update_task_progress(state, "medium_analyze", AnalysisStatus.COMPLETED, f"Medium feed unavailable for {username} ({analysis.unavailable_reason})", score=0)
+            return state
+        
         update_task_progress(state, "medium_analyze", AnalysisStatus.COMPLETED, f"Medium analysis completed for {username}", score=medium_score)
         
     except Exception as e:
@@ -415,15 +460,13 @@ async def project_evaluator(state: Dict[str, Any]) -> Dict[str, Any]:
         resume = state["resume"]
         project_service = ProjectService()
         
-        project_analyses = []
-        projects_with_urls = 0
         total_projects = len(resume.projects)
         
-        for project in resume.projects:
-            if project.get("url"):
-                analysis = await project_service.evaluate_project(project)
-                project_analyses.append(analysis)
-                projects_with_urls += 1
+        # Projects that miss the stage deadline are scored like projects without URLs
+        project_analyses = await project_service.evaluate_projects(
+            [project for project in resume.projects if project.get("url")]
+        )
+        projects_with_urls = len(project_analyses)
         
         state["project_analyses"] = project_analyses
         
@@ -431,14 +474,7 @@ async def project_evaluator(state: Dict[str, Any]) -> Dict[str, Any]:
         if project_analyses:
             project_scores = []
             for analysis in project_analyses:
-                # Average of complexity, performance, responsiveness, and SEO scores
-                avg_score = (
-                    getattr(analysis, 'complexity_score', 0) +
-                    getattr(analysis, 'performance_score', 0) + 
-                    getattr(analysis, 'responsiveness_score', 0) +
-                    getattr(analysis, 'seo_score', 0)
-                ) / 4
-                project_scores.append(avg_score)
+                project_scores.append(project_score(analysis))
             overall_project_score = sum(project_scores) / len(project_scores)
             
             # Give partial credit for projects without URLs (assume they're 50% as valuable)
@@ -597,14 +633,8 @@ async def final_scorer(state: Dict[str, Any]) -> Dict[str, Any]:
             try:
                 project_scores = []
                 for analysis in state["project_analyses"]:
-                    # Use the same logic as project_evaluator: average of all scores
-                    avg_score = (
-                        getattr(analysis, 'complexity_score', 0) +
-                        getattr(analysis, 'performance_score', 0) + 
-                        getattr(analysis, 'responsiveness_score', 0) +
-                        getattr(analysis, 'seo_score', 0)
-                    ) / 4
-                    project_scores.append(avg_score)
+                    # Use the same logic as project_evaluator
+                    project_scores.append(project_score(analysis))
                 
                 avg_project_score = sum(project_scores) / len(project_scores)
                 project_contribution = avg_project_score * weights.get("project_quality", 0.15)
@@ -11,7 +11,7 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, UploadFile, File
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, UploadFile, File, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, StreamingResponse
@@ -20,12 +20,23 @@ import uvicorn
 import uuid
 import json
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 import asyncio
 
-from app.models.schemas import AnalysisRequest, AnalysisResponse, AnalysisStatus
+from app.models.schemas import AnalysisRequest, AnalysisResponse, AnalysisStatus, Platform, ProfileRefreshRequest
 from app.agents.graph import orchestrator
 from app.api.websocket_manager import manager
+from app.utils.http_client import http_client_manager
+from app.utils.token_pool import github_token_pool
+from app.services.twitter_service import twitter_user_lookup
+from app.services.linkedin_service import linkedin_export_store
+from app.utils.block_detector import block_tracker
+from app.utils.resilience import resilience
+from app.utils.negative_cache import missing_github_users, missing_medium_users, missing_project_urls
+from app.utils.snapshot_store import SNAPSHOT_PLATFORMS, platform_snapshots, profile_username
+from app.utils.process_pool import get_process_pool_metrics, shutdown_process_pool
+from app.utils.prefetch import prefetch_key, prefetch_resume_profiles, profile_prefetch
+from app.utils.upload import SNIFF_BYTES, UploadLimitMiddleware, UploadTooLarge, sniff_document_type
 
 app = FastAPI(title="Hiring Agent API", version="1.0.0")
 
@@ -42,6 +53,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Uploads whose request body is size-limited while it is received
+UPLOAD_PATHS = {"/api/parse-resume", "/api/linkedin-export"}
+app.add_middleware(UploadLimitMiddleware, paths=UPLOAD_PATHS)
+
+@app.on_event("startup")
+async def startup_event():
+    # Shared keep-alive pool for all outbound HTTP made by the services
+    await http_client_manager.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await http_client_manager.close()
+    shutdown_process_pool()
+
 app.mount("/static", StaticFiles(directory="frontend"), name="static")
 
 # Serve individual frontend files directly
@@ -73,7 +98,8 @@ async def start_analysis(request: AnalysisRequest):
             job_description=request.job_description,
             weight_mode=request.weight_mode,
             custom_weights=request.custom_weights,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            linkedin_export_id=request.linkedin_export_id
         )
     )
     
@@ -107,27 +133,47 @@ async def websocket_endpoint(websocket: WebSocket, analysis_id: str):
         manager.disconnect(websocket, analysis_id)
 
 @app.post("/api/parse-resume")
-async def parse_resume(file: UploadFile = File(...)):
-    """Parse uploaded resume file and extract text content"""
+async def parse_resume(file: UploadFile = File(...), prefetch: Optional[bool] = Query(None)):
+    """Parse uploaded resume file and extract text content.
+
+    With ``prefetch`` (default from PREFETCH_ON_UPLOAD), platform data for the
+    links on the resume starts loading in the background so a following
+    analysis finds it warm.
+    """
+    from config.settings import settings
+    if prefetch is None:
+        prefetch = settings.get_prefetch_config()["enabled"]
+    parse_timeout = settings.get_process_pool_config()["document_parse_timeout"]
+    max_bytes = settings.get_upload_config()["max_bytes"]
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(status_code=413, detail=str(UploadTooLarge(max_bytes)))
     try:
-        # Read file content
+        # Parse based on the file's leading bytes, not its name; parsing is
+        # CPU-bound and runs off the event loop
+        from app.utils.process_pool import run_in_process
         content = await file.read()
-        
-        # Parse based on file type
-        if file.filename.lower().endswith('.pdf'):
+        document_type = sniff_document_type(content[:SNIFF_BYTES])
+        if document_type == "pdf":
             from app.utils.resume_parser import parse_pdf_resume
-            resume_text = parse_pdf_resume(content)
-        elif file.filename.lower().endswith(('.doc', '.docx')):
+            resume_text = await run_in_process(parse_pdf_resume, content, pool="documents", timeout=parse_timeout)
+        elif document_type == "docx":
             from app.utils.resume_parser import parse_docx_resume
-            resume_text = parse_docx_resume(content)
-        elif file.filename.lower().endswith('.txt'):
-            resume_text = content.decode('utf-8')
+            resume_text = await run_in_process(parse_docx_resume, content, pool="documents", timeout=parse_timeout)
+        elif document_type == "txt":
+            resume_text = content.decode("utf-8")
+        elif document_type == "doc":
+            raise HTTPException(status_code=400, detail="Legacy .doc files are not supported. Please save the resume as DOCX or PDF.")
         else:
-            raise HTTPException(status_code=400, detail="Unsupported file format. Please upload PDF, DOC, DOCX, or TXT files.")
+            raise HTTPException(status_code=400, detail="Unsupported file format. Please upload PDF, DOCX, or TXT files.")
+        # Release the upload before the model call, which can take a while
+        del content
+        await file.close()
         
         # Extract structured data from resume text using AI
         from app.utils.resume_parser import extract_resume_data
         structured_data = await extract_resume_data(resume_text)
+        if prefetch:
+            prefetch_resume_profiles(structured_data.get("social_profiles", []), structured_data.get("projects", []))
         
         return {
             "filename": file.filename,
@@ -135,9 +181,68 @@ async def parse_resume(file: UploadFile = File(...)):
             "structured_data": structured_data
         }
     
+    except HTTPException:
+        raise
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=422, detail=f"Resume could not be parsed within {parse_timeout:g} seconds")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error parsing resume: {str(e)}")
 
+@app.post("/api/linkedin-export")
+async def upload_linkedin_export(file: UploadFile = File(...)):
+    """Parse a LinkedIn data export (ZIP) or "Save to PDF" profile for use in an analysis"""
+    from config.settings import settings
+    max_bytes = settings.get_upload_config()["max_bytes"]
+    parse_timeout = settings.get_process_pool_config()["document_parse_timeout"]
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(status_code=413, detail=str(UploadTooLarge(max_bytes)))
+    try:
+        from app.utils.linkedin_export import parse_linkedin_export
+        from app.utils.process_pool import run_in_process
+        export = await run_in_process(parse_linkedin_export, await file.read(), pool="documents", timeout=parse_timeout)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=422, detail=f"LinkedIn export could not be parsed within {parse_timeout:g} seconds")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error parsing LinkedIn export: {str(e)}")
+    
+    export_id = str(uuid.uuid4())
+    linkedin_export_store.set(export_id, export)
+    return {
+        "export_id": export_id,
+        "source": export["source"],
+        "positions": len(export["positions"]),
+        "certifications": len(export["certifications"]),
+        "posts": len(export["posts"])
+    }
+
+@app.post("/api/profiles/refresh")
+async def refresh_profiles(request: ProfileRefreshRequest):
+    """Drop stored platform snapshots for one candidate so the next analysis fetches fresh data"""
+    missing_caches = {
+        Platform.GITHUB: missing_github_users,
+        Platform.TWITTER: twitter_user_lookup.missing_cache,
+        Platform.MEDIUM: missing_medium_users
+    }
+    refreshed = []
+    for profile in request.social_profiles:
+        if profile.platform not in SNAPSHOT_PLATFORMS:
+            continue
+        username = profile_username(profile)
+        # A profile created since the last run should not stay marked as missing
+        missing_caches[profile.platform].set(username.lower(), False)
+        # Neither the cached Twitter user nor a prefetch from the last upload may answer for it
+        if profile.platform == Platform.TWITTER:
+            twitter_user_lookup.invalidate(username)
+        profile_prefetch.invalidate(prefetch_key(profile.platform.value, username))
+        refreshed.append({
+            "platform": profile.platform.value,
+            "username": username,
+            "had_snapshot": platform_snapshots.invalidate(profile.platform.value, username)
+        })
+    return {"refreshed": refreshed}
+
 @app.get("/api/health")
 async def health_check():
     """Enhanced health check for production monitoring"""
@@ -155,6 +260,19 @@ async def health_check():
                 "websockets": True,  # WebSocket manager is always available
                 "file_upload": True  # File upload is always available
             },
+            "http_pool": http_client_manager.get_stats(),
+            "github_tokens": github_token_pool.get_metrics(),
+            "twitter_lookup": twitter_user_lookup.get_metrics(),
+            "scraper_blocks": block_tracker.get_summary(),
+            "circuits": resilience.get_summary(),
+            "platform_snapshots": platform_snapshots.get_metrics(),
+            "prefetch": profile_prefetch.get_metrics(),
+            "process_pools": get_process_pool_metrics(),
+            "negative_cache": {
+                "github": missing_github_users.get_metrics(),
+                "medium": missing_medium_users.get_metrics(),
+                "projects": missing_project_urls.get_metrics()
+            },
             "version": "1.0.0"
         }
         
@@ -163,6 +281,11 @@ async def health_check():
             health_status["status"] = "degraded"
             health_status["warnings"] = ["OpenAI API key not configured"]
         
+        open_circuits = resilience.open_circuits()
+        if open_circuits:
+            health_status["status"] = "degraded"
+            health_status.setdefault("warnings", []).append(f"Circuit open for: {', '.join(sorted(open_circuits))}")
+        
         return health_status
         
     except Exception as e:
@@ -65,6 +65,7 @@ class GitHubAnalysis(BaseModel):
     code_quality_score: float
     project_complexity_score: float
     domain_relevance_score: float
+    unavailable_reason: Optional[str] = None  # "not_found", or "error" when the fetch failed
 
 class LinkedInAnalysis(BaseModel):
     profile_url: str
@@ -74,6 +75,10 @@ class LinkedInAnalysis(BaseModel):
     endorsements: List[str] = []
     certifications: List[str] = []
     domain_relevance_score: float
+    positions: List[Dict[str, Any]] = []
+    skills: List[str] = []
+    source: Optional[str] = None  # "data_export" or "profile_pdf" when read from an upload
+    unavailable_reason: Optional[str] = None  # login_wall, bot_block, rate_limited, empty, backoff or not_found
 
 class TwitterAnalysis(BaseModel):
     username: str
@@ -82,6 +87,8 @@ class TwitterAnalysis(BaseModel):
     domain_relevant_tweets: int
     engagement_rate: float
     domain_relevance_score: float
+    activity: Optional[Dict[str, Any]] = None
+    unavailable_reason: Optional[str] = None
 
 class MediumAnalysis(BaseModel):
     username: str
@@ -90,6 +97,7 @@ class MediumAnalysis(BaseModel):
     total_claps: int
     followers: int
     domain_relevance_score: float
+    unavailable_reason: Optional[str] = None
 
 class ProjectAnalysis(BaseModel):
     project_name: str
@@ -101,6 +109,9 @@ class ProjectAnalysis(BaseModel):
     seo_score: float
     performance_score: float
     error_count: int
+    page_weight: Optional[Dict[str, Any]] = None
+    code_quality_score: Optional[float] = None
+    repository: Optional[Dict[str, Any]] = None
 
 class CompanyAnalysis(BaseModel):
     company_name: str
@@ -129,6 +140,10 @@ class AnalysisRequest(BaseModel):
     resume: Resume
     weight_mode: Optional[str] = "professional"  # "professional" or "fresher"
     custom_weights: Optional[Dict[str, float]] = None
+    linkedin_export_id: Optional[str] = None  # From /api/linkedin-export
+
+class ProfileRefreshRequest(BaseModel):
+    social_profiles: List[SocialProfile]
 
 class AnalysisResponse(BaseModel):
     analysis_id: str
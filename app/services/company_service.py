@@ -2,13 +2,14 @@ import httpx
 from typing import Dict
 from app.models.schemas import CompanyAnalysis
 from langchain_openai import ChatOpenAI
+from app.utils.resilience import llm_circuit_breaker
 from langchain.schema import HumanMessage, SystemMessage
 import json
 
 class CompanyService:
     def __init__(self):
         from config.settings import settings
-        self.llm = ChatOpenAI(model=settings.get_model(), temperature=0.1)
+        self.llm = ChatOpenAI(model=settings.get_model(), temperature=0.1, callbacks=[llm_circuit_breaker])
     
     async def research_company(self, company_name: str, role: str) -> CompanyAnalysis:
         try:
@@ -1,90 +1,276 @@
 import httpx
-import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from app.models.schemas import GitHubAnalysis
 from langchain_openai import ChatOpenAI
+from app.utils.resilience import llm_circuit_breaker
 from langchain.schema import HumanMessage, SystemMessage
+from app.utils.http_client import http_client_manager
+from app.utils.cache import ConditionalHTTPCache, PersistentCache, http_cache
+from app.utils.token_pool import TokenPool, github_token_pool
+from app.utils.negative_cache import NegativeCache, missing_github_users
+from app.utils.github_scoring import score_code_quality, score_domain_relevance
+from app.utils.code_sampler import sample_repository_code
+from app.utils.prefetch import MISS, PrefetchCache, prefetch_key, profile_prefetch
+import asyncio
+import heapq
 import json
+import re
+import time
+from urllib.parse import urlsplit
+
+CI_CONFIG_FILES = {".travis.yml", ".gitlab-ci.yml", "Jenkinsfile", ".circleci", "azure-pipelines.yml", "bitbucket-pipelines.yml"}
+TEST_DIRECTORIES = {"test", "tests", "spec", "specs", "__tests__", "testing"}
+
+# Deep inspection results only change when the repository is pushed to, except
+# for the 52-week commit window, which is shifted on reuse and refetched weekly
+repo_inspection_cache = PersistentCache("repo_inspection", max_age=7 * 24 * 3600)
+WEEK_SECONDS = 7 * 24 * 3600
+
+# First path segments on github.com that are site pages, not user or org names
+RESERVED_OWNERS = {
+    "about", "apps", "collections", "customer-stories", "enterprise", "explore", "features", "issues",
+    "login", "marketplace", "new", "notifications", "orgs", "pricing", "pulls", "readme", "search",
+    "security", "settings", "site", "sponsors", "topics", "trending"
+}
+OWNER_PATTERN = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9-]{0,38})$")
+REPO_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,100}$")
+
+def parse_repository_url(url: str) -> Optional[Tuple[str, str]]:
+    """Return (owner, repo) for github.com repository links, including deep links into them"""
+    parts = urlsplit(url.strip() if "://" in url else f"https://{url.strip()}")
+    if (parts.hostname or "").lower() not in ("github.com", "www.github.com"):
+        return None
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if len(segments) < 2:
+        return None
+    owner, repo = segments[0], segments[1]
+    if repo.endswith(".git"):
+        repo = repo[:-4]
+    if owner.lower() in RESERVED_OWNERS or not OWNER_PATTERN.match(owner) or not REPO_PATTERN.match(repo):
+        return None
+    return owner, repo
+
+def shift_weekly_commits(weekly_commits: List[int], inspected_at: float, now: Optional[float] = None) -> List[int]:
+    """Move a participation window forward by the whole weeks elapsed since it was fetched"""
+    elapsed = int(((now if now is not None else time.time()) - inspected_at) // WEEK_SECONDS)
+    if elapsed <= 0 or not weekly_commits:
+        return weekly_commits
+    return (list(weekly_commits) + [0] * elapsed)[-len(weekly_commits):]
+
+class RepoAggregator:
+    """Folds repository pages into running totals as they arrive.
+
+    Only the ``keep`` most recently updated repositories are retained, so
+    memory stays bounded no matter how many pages a user has.
+    """
+
+    def __init__(self, keep: int = 20):
+        self.keep = keep
+        self.count = 0
+        self.total_size = 0
+        self.total_stars = 0
+        self.total_forks = 0
+        self.languages: Dict[str, int] = {}
+        self.last_pushed_at = ""
+        self.pages = 0
+        self.truncated = False
+        self.failed = False
+        self._recent: List = []
+
+    def add_page(self, page: List[Dict]):
+        self.pages += 1
+        for repo in page:
+            if not isinstance(repo, dict):
+                continue
+            self.count += 1
+            self.total_size += repo.get("size", 0) or 0
+            self.total_stars += repo.get("stargazers_count", 0) or 0
+            self.total_forks += repo.get("forks_count", 0) or 0
+            if repo.get("language"):
+                self.languages[repo["language"]] = self.languages.get(repo["language"], 0) + 1
+            pushed_at = repo.get("pushed_at") or ""
+            if pushed_at > self.last_pushed_at:
+                self.last_pushed_at = pushed_at
+
+            # Min-heap on updated_at keeps the newest `keep` repositories
+            entry = (repo.get("updated_at") or "", self.count, repo)
+            if len(self._recent) < self.keep:
+                heapq.heappush(self._recent, entry)
+            elif entry[0] > self._recent[0][0]:
+                heapq.heapreplace(self._recent, entry)
+
+    @property
+    def recent_repos(self) -> List[Dict]:
+        """Retained repositories, most recently updated first"""
+        return [repo for _, _, repo in sorted(self._recent, key=lambda e: (e[0], -e[1]), reverse=True)]
 
 class GitHubService:
-    def __init__(self):
-        self.token = os.getenv("GITHUB_TOKEN")
-        self.headers = {"Authorization": f"token {self.token}"} if self.token else {}
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[ConditionalHTTPCache] = None,
+        token_pool: Optional[TokenPool] = None,
+        inspection_cache: Optional[PersistentCache] = None,
+        missing_users: Optional[NegativeCache] = None,
+        prefetch: Optional[PrefetchCache] = None
+    ):
+        self.client = client
+        self.cache = cache or http_cache
+        self.token_pool = token_pool or github_token_pool
+        self.inspection_cache = inspection_cache or repo_inspection_cache
+        self.missing_users = missing_users or missing_github_users
+        self.prefetch = prefetch or profile_prefetch
         from config.settings import settings
-        self.llm = ChatOpenAI(model=settings.get_model(), temperature=0.1)
+        self.config = settings.get_github_config()
+        self.llm = ChatOpenAI(model=settings.get_model(), temperature=0.1, callbacks=[llm_circuit_breaker])
+    
+    async def collect_profile(self, username: str) -> Optional[Dict]:
+        """Fetch everything scoring needs that does not depend on the job domain.
+
+        Returns None when the user does not exist and raises when the
+        lookup failed, so a failure is never scored as an empty profile.
+        This is the part a prefetch at resume upload runs ahead of the
+        analysis.
+        """
+        if self.missing_users.is_missing(username):
+            return None
+        client = self.client or http_client_manager.get_client()
+        # The user lookup doubles as the existence check; repositories load alongside it
+        repositories = asyncio.create_task(self._get_repositories(client, username))
+        user_data = await self._get_user_data(client, username)
+        if user_data is None:
+            repositories.cancel()
+            self.missing_users.mark_missing(username)
+            print(f"GitHub user not found: {username}")
+            return None
+        if not user_data:
+            repositories.cancel()
+            raise RuntimeError(f"GitHub user lookup failed for {username}")
+        aggregate = await repositories
+        if aggregate.failed:
+            raise RuntimeError(f"GitHub repository listing failed for {username}")
+        repos_data = aggregate.recent_repos
+        
+        if self.config["deep_inspection"]:
+            await self._inspect_repositories(client, repos_data[:self.config["deep_inspection_repos"]])
+        if self.config["code_sampling"]:
+            await self._sample_top_repositories(client, repos_data)
+        
+        return {
+            "user_data": user_data,
+            "aggregate": aggregate,
+            "contribution_streak": await self._calculate_contribution_streak(client, username, repos_data)
+        }
     
     async def analyze_profile(self, username: str, domain: str) -> GitHubAnalysis:
+        if self.missing_users.is_missing(username):
+            return self._empty_analysis(username, "not_found")
         try:
-            async with httpx.AsyncClient() as client:
-                user_data = await self._get_user_data(client, username)
-                repos_data = await self._get_repositories(client, username)
-                
-                # Ensure repos_data is a list and not None
-                if not isinstance(repos_data, list):
-                    repos_data = []
+            collected = await self.prefetch.get(prefetch_key("github", username))
+            if collected is MISS:
+                collected = await self.collect_profile(username)
+            if collected is None:
+                return self._empty_analysis(username, "not_found")
+            user_data = collected["user_data"]
+            aggregate = collected["aggregate"]
+            repos_data = aggregate.recent_repos
                 
-                # Filter out None repos
-                repos_data = [repo for repo in repos_data if repo is not None and isinstance(repo, dict)]
-                
-                total_commits = sum(repo.get("size", 0) for repo in repos_data if repo)
-                
-                languages = {}
-                for repo in repos_data:
-                    if repo and repo.get("language"):
-                        lang = repo["language"]
-                        languages[lang] = languages.get(lang, 0) + 1
-                
-                code_quality_score = await self._analyze_code_quality(repos_data[:5])
+            if self.config["llm_scoring"]:
+                code_quality_score, complexity_score, domain_relevance = await asyncio.gather(
+                    self._analyze_code_quality(repos_data[:5]),
+                    self._analyze_project_complexity(repos_data[:5]),
+                    self._analyze_domain_relevance(repos_data, domain)
+                )
+            else:
+                # Local metadata model, no LLM round-trips
+                code_quality_score = score_code_quality(repos_data[:5])
                 complexity_score = await self._analyze_project_complexity(repos_data[:5])
-                domain_relevance = await self._analyze_domain_relevance(repos_data, domain)
+                domain_relevance = score_domain_relevance(repos_data, domain)
                 
-                return GitHubAnalysis(
-                    username=username,
-                    public_repos_count=user_data.get("public_repos", 0),
-                    followers=user_data.get("followers", 0),
-                    following=user_data.get("following", 0),
-                    total_commits=total_commits,
-                    repositories=[{
-                        "name": repo.get("name", "Unknown"),
-                        "description": repo.get("description", ""),
-                        "stars": repo.get("stargazers_count", 0),
-                        "forks": repo.get("forks_count", 0),
-                        "language": repo.get("language", ""),
-                        "updated_at": repo.get("updated_at", "")
-                    } for repo in repos_data[:10] if repo and isinstance(repo, dict)],
-                    languages=languages,
-                    contribution_streak=await self._calculate_contribution_streak(client, username),
-                    code_quality_score=code_quality_score,
-                    project_complexity_score=complexity_score,
-                    domain_relevance_score=domain_relevance
-                )
-        except Exception as e:
-            print(f"GitHub service error: {e}")
-            # Return a basic analysis with minimal data
             return GitHubAnalysis(
                 username=username,
-                public_repos_count=0,
-                followers=0,
-                following=0,
-                total_commits=0,
-                repositories=[],
-                languages={},
-                contribution_streak=0,
-                code_quality_score=0.0,
-                project_complexity_score=0.0,
-                domain_relevance_score=0.0
+                public_repos_count=user_data.get("public_repos", 0),
+                followers=user_data.get("followers", 0),
+                following=user_data.get("following", 0),
+                total_commits=aggregate.total_size,
+                repositories=[{
+                    "name": repo.get("name", "Unknown"),
+                    "description": repo.get("description", ""),
+                    "stars": repo.get("stargazers_count", 0),
+                    "forks": repo.get("forks_count", 0),
+                    "language": repo.get("language", ""),
+                    "updated_at": repo.get("updated_at", ""),
+                    **({"inspection": repo["inspection"]} if repo.get("inspection") else {}),
+                    **({"code_sample": repo["code_sample"]} if repo.get("code_sample") else {})
+                } for repo in repos_data[:10] if repo and isinstance(repo, dict)],
+                languages=aggregate.languages,
+                contribution_streak=collected["contribution_streak"],
+                code_quality_score=code_quality_score,
+                project_complexity_score=complexity_score,
+                domain_relevance_score=domain_relevance
             )
+        except Exception as e:
+            print(f"GitHub service error: {e}")
+            # Return a basic analysis with minimal data
+            return self._empty_analysis(username, "error")
+    
+    def _empty_analysis(self, username: str, unavailable_reason: Optional[str] = None) -> GitHubAnalysis:
+        return GitHubAnalysis(
+            username=username,
+            public_repos_count=0,
+            followers=0,
+            following=0,
+            total_commits=0,
+            repositories=[],
+            languages={},
+            contribution_streak=0,
+            code_quality_score=0.0,
+            project_complexity_score=0.0,
+            domain_relevance_score=0.0,
+            unavailable_reason=unavailable_reason
+        )
+    
+    async def get_repository(self, owner: str, repo: str) -> Optional[Dict]:
+        """Repository metadata with deep-inspection signals, or None if it does not exist.
+
+        Goes through the same pooled, cached and token-scheduled API path as
+        profile analysis, so a repo linked from a resume costs a conditional
+        request at most.
+        """
+        client = self.client or http_client_manager.get_client()
+        response = await self._api_get(client, f"https://api.github.com/repos/{owner}/{repo}")
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        repo_data = response.json()
+        await self._inspect_repositories(client, [repo_data])
+        return repo_data
+    
+    async def _api_get(self, client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+        """GET a GitHub API URL using the pooled token with the most quota left"""
+        kwargs.setdefault("timeout", 10.0)
+        for attempt in range(2):
+            token_state = await self.token_pool.acquire()
+            headers = {"Authorization": f"token {token_state.token}"} if token_state.token else {}
+            try:
+                response = await self.cache.get(client, url, headers=headers, **kwargs)
+            except Exception:
+                self.token_pool.release(token_state)
+                raise
+            if not self.token_pool.release(token_state, response):
+                break
+            print(f"GitHub rate limit hit on token {token_state.token[-4:] or 'anonymous'}, rescheduling")
+        return response
     
-    async def _get_user_data(self, client: httpx.AsyncClient, username: str) -> Dict:
+    async def _get_user_data(self, client: httpx.AsyncClient, username: str) -> Optional[Dict]:
+        """User profile, None if the user does not exist, or {} if the lookup failed"""
         try:
-            response = await client.get(
-                f"https://api.github.com/users/{username}",
-                headers=self.headers,
-                timeout=10.0
-            )
+            response = await self._api_get(client, f"https://api.github.com/users/{username}")
             if response.status_code == 200:
                 data = response.json()
                 return data if isinstance(data, dict) else {}
+            elif response.status_code == 404:
+                return None
             else:
                 print(f"GitHub user API error: {response.status_code}")
                 return {}
@@ -92,25 +278,180 @@ class GitHubService:
             print(f"GitHub user API exception: {e}")
             return {}
     
-    async def _get_repositories(self, client: httpx.AsyncClient, username: str) -> List[Dict]:
+    async def _get_repositories(self, client: httpx.AsyncClient, username: str) -> RepoAggregator:
+        aggregate = RepoAggregator()
         try:
-            response = await client.get(
-                f"https://api.github.com/users/{username}/repos?sort=updated&per_page=20",
-                headers=self.headers,
-                timeout=10.0
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return data if isinstance(data, list) else []
-            else:
-                print(f"GitHub repos API error: {response.status_code}")
-                return []
+            async for page in self._iter_repository_pages(client, username, aggregate):
+                aggregate.add_page(page)
         except Exception as e:
             print(f"GitHub repos API exception: {e}")
-            return []
+            aggregate.failed = aggregate.pages == 0
+        return aggregate
+    
+    async def _iter_repository_pages(self, client: httpx.AsyncClient, username: str, aggregate: RepoAggregator):
+        """Yield repository pages as they arrive, following the Link header.
+
+        The first page tells us the last page number; the remaining pages
+        (up to the configured cap) are then fetched concurrently.
+        """
+        url = f"https://api.github.com/users/{username}/repos"
+        params = {"sort": "updated", "per_page": 100}
+        
+        response = await self._api_get(client, url, params={**params, "page": 1})
+        if response.status_code != 200:
+            print(f"GitHub repos API error: {response.status_code}")
+            aggregate.failed = True
+            return
+        first_page = response.json()
+        yield first_page if isinstance(first_page, list) else []
+        
+        last_link = response.links.get("last", {}).get("url")
+        if not last_link:
+            return
+        try:
+            last_page = int(httpx.URL(last_link).params.get("page", 1))
+        except ValueError:
+            return
+        max_pages = self.config["max_repo_pages"]
+        if last_page > max_pages:
+            aggregate.truncated = True
+            last_page = max_pages
+        
+        semaphore = asyncio.Semaphore(self.config["page_concurrency"])
+        
+        async def fetch_page(page_number: int) -> List[Dict]:
+            async with semaphore:
+                page_response = await self._api_get(client, url, params={**params, "page": page_number})
+            if page_response.status_code != 200:
+                print(f"GitHub repos API error on page {page_number}: {page_response.status_code}")
+                return []
+            data = page_response.json()
+            return data if isinstance(data, list) else []
+        
+        tasks = [asyncio.create_task(fetch_page(n)) for n in range(2, last_page + 1)]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                yield await next_page
+        finally:
+            for task in tasks:
+                task.cancel()
     
-    async def _calculate_contribution_streak(self, client: httpx.AsyncClient, username: str) -> int:
-        return 30
+    async def _inspect_repositories(self, client: httpx.AsyncClient, repos: List[Dict]):
+        """Attach README, language byte, test/CI and commit activity signals to repos.
+
+        All requests of one analysis share a semaphore; results are cached per
+        repository and keyed by ``pushed_at`` so untouched repos cost nothing.
+        An inspection with a sub-request that got neither 200 nor 404 (202
+        while stats are computed, 403, 5xx) is used but not cached.
+        """
+        semaphore = asyncio.Semaphore(self.config["deep_inspection_concurrency"])
+        
+        async def inspect(repo: Dict):
+            full_name = repo.get("full_name")
+            if not full_name:
+                return
+            cache_key = f"{full_name}@{repo.get('pushed_at', '')}"
+            entry = self.inspection_cache.get_entry(cache_key)
+            if entry is not None:
+                cached, inspected_at = entry
+                weekly_commits = shift_weekly_commits(cached.get("weekly_commits") or [], inspected_at)
+                repo["inspection"] = {**cached, "weekly_commits": weekly_commits, "commits_last_year": sum(weekly_commits)}
+                return
+            try:
+                repo["inspection"], complete = await self._inspect_repository(client, full_name, semaphore)
+                if complete:
+                    self.inspection_cache.set(cache_key, repo["inspection"])
+            except Exception as e:
+                print(f"GitHub repo inspection error for {full_name}: {e}")
+        
+        await asyncio.gather(*[inspect(repo) for repo in repos])
+    
+    async def _inspect_repository(self, client: httpx.AsyncClient, full_name: str, semaphore: asyncio.Semaphore) -> Tuple[Dict, bool]:
+        """Inspection signals of one repository and whether every answer was definitive"""
+        base_url = f"https://api.github.com/repos/{full_name}"
+        incomplete = []
+        
+        async def fetch_json(path: str):
+            async with semaphore:
+                response = await self._api_get(client, f"{base_url}{path}")
+            # stats endpoints answer 202 while GitHub computes them
+            if response.status_code not in (200, 404):
+                incomplete.append(path)
+            return response.json() if response.status_code == 200 else None
+        
+        readme, language_bytes, root_contents, participation = await asyncio.gather(
+            fetch_json("/readme"),
+            fetch_json("/languages"),
+            fetch_json("/contents"),
+            fetch_json("/stats/participation")
+        )
+        
+        root_names = {item.get("name", "") for item in root_contents or [] if isinstance(item, dict)}
+        has_ci = bool(root_names & CI_CONFIG_FILES)
+        if not has_ci and ".github" in root_names:
+            workflows = await fetch_json("/contents/.github/workflows")
+            has_ci = bool(workflows)
+        
+        weekly_commits = (participation or {}).get("owner") or []
+        inspection = {
+            "has_readme": bool(readme),
+            "readme_size": (readme or {}).get("size", 0),
+            "language_bytes": language_bytes if isinstance(language_bytes, dict) else {},
+            "has_tests": bool({name.lower() for name in root_names} & TEST_DIRECTORIES),
+            "has_ci": has_ci,
+            "weekly_commits": weekly_commits,
+            "commits_last_year": sum(weekly_commits)
+        }
+        return inspection, not incomplete
+    
+    async def _sample_top_repositories(self, client: httpx.AsyncClient, repos: List[Dict]):
+        """Stream the tarball of the most starred original repos and attach static code metrics"""
+        candidates = sorted(
+            [repo for repo in repos if not repo.get("fork") and repo.get("full_name")],
+            key=lambda repo: repo.get("stargazers_count", 0),
+            reverse=True
+        )[:self.config["code_sampling_repos"]]
+        
+        async def sample(repo: Dict):
+            full_name = repo["full_name"]
+            cache_key = f"code:{full_name}@{repo.get('pushed_at', '')}"
+            cached = self.inspection_cache.get(cache_key)
+            if cached is not None:
+                repo["code_sample"] = cached
+                return
+            try:
+                repo["code_sample"] = await sample_repository_code(
+                    client,
+                    f"https://codeload.github.com/{full_name}/tar.gz/{repo.get('default_branch') or 'HEAD'}",
+                    max_bytes=self.config["code_sampling_max_bytes"],
+                    seed=full_name
+                )
+                self.inspection_cache.set(cache_key, repo["code_sample"])
+            except Exception as e:
+                print(f"GitHub code sampling error for {full_name}: {e}")
+        
+        await asyncio.gather(*[sample(repo) for repo in candidates])
+    
+    async def _calculate_contribution_streak(self, client: httpx.AsyncClient, username: str, repos: Optional[List[Dict]] = None) -> int:
+        # Totals indexed from the most recent week back, so windows of any length line up
+        weekly_totals: List[int] = []
+        for repo in repos or []:
+            weeks = (repo.get("inspection") or {}).get("weekly_commits") or []
+            for index, commits in enumerate(reversed(weeks)):
+                if index >= len(weekly_totals):
+                    weekly_totals.append(0)
+                weekly_totals[index] += commits
+        
+        if not weekly_totals:
+            return 30
+        
+        # Consecutive active weeks counting back from the most recent one, in days
+        streak_weeks = 0
+        for commits in weekly_totals:
+            if not commits:
+                break
+            streak_weeks += 1
+        return streak_weeks * 7
     
     async def _analyze_code_quality(self, repos: List[Dict]) -> float:
         if not repos:
@@ -118,10 +459,12 @@ class GitHubService:
         
         system_message = SystemMessage(content="""Analyze the GitHub repositories and rate the code quality from 0-100.
 Consider: README quality, documentation, project structure, naming conventions.
+Where inspection data is given, also weigh tests, CI configuration and recent commit activity.
 Return only a numeric score.""")
         
         repo_summary = "\n".join([
             f"- {repo['name']}: {repo.get('description', 'No description')} (Language: {repo.get('language', 'Unknown')})"
+            + self._format_inspection(repo.get("inspection"))
             for repo in repos
         ])
         
@@ -133,6 +476,19 @@ Return only a numeric score.""")
         except:
             return 50.0
     
+    def _format_inspection(self, inspection: Optional[Dict]) -> str:
+        if not inspection:
+            return ""
+        languages = ", ".join(
+            f"{lang} {size // 1024}KB"
+            for lang, size in sorted(inspection["language_bytes"].items(), key=lambda item: -item[1])[:3]
+        )
+        return (
+            f" [README: {inspection['readme_size']} bytes, tests: {'yes' if inspection['has_tests'] else 'no'}, "
+            f"CI: {'yes' if inspection['has_ci'] else 'no'}, commits last year: {inspection['commits_last_year']}, "
+            f"code: {languages or 'unknown'}]"
+        )
+    
     async def _analyze_project_complexity(self, repos: List[Dict]) -> float:
         if not repos:
             return 0.0
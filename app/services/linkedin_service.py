@@ -1,43 +1,129 @@
 import httpx
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional
 from app.models.schemas import LinkedInAnalysis
 from langchain_openai import ChatOpenAI
+from app.utils.resilience import llm_circuit_breaker
 from langchain.schema import HumanMessage, SystemMessage
+from app.utils.http_client import http_client_manager
+from app.utils.page_fetcher import fetch_page
+from app.utils.block_detector import BlockTracker, block_tracker, classify_response, retry_after_seconds
+from app.utils.cache import PersistentCache
+from app.utils.github_scoring import DOMAIN_KEYWORDS, domain_keywords, tokenize
 from bs4 import BeautifulSoup
 
+# Parsed LinkedIn exports by upload id, referenced from analysis requests
+linkedin_export_store = PersistentCache("linkedin_export", max_age=7 * 24 * 3600)
+
+TECHNICAL_TERMS = set().union(*DOMAIN_KEYWORDS.values()) | {
+    "python", "code", "coding", "programming", "software", "engineering", "developer", "algorithm",
+    "architecture", "open-source", "opensource", "github", "sql", "testing", "deployment", "performance"
+}
+
+# Share of the relevance score per export section
+EXPORT_SECTION_WEIGHTS = {"posts": 40, "positions": 30, "certifications": 15, "skills": 15}
+
 class LinkedInService:
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, tracker: Optional[BlockTracker] = None):
+        self.client = client
+        self.block_tracker = tracker or block_tracker
         self.token = os.getenv("LINKEDIN_TOKEN")
         from config.settings import settings
-        self.llm = ChatOpenAI(model=settings.get_model(), temperature=0.1)
+        self.llm = ChatOpenAI(model=settings.get_model(), temperature=0.1, callbacks=[llm_circuit_breaker])
+        self.max_page_bytes = settings.get_http_config()["page_max_bytes"]
     
     async def analyze_profile(self, profile_url: str, domain: str) -> LinkedInAnalysis:
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(profile_url, follow_redirects=True)
-                soup = BeautifulSoup(response.text, 'html.parser')
+        client = self.client or http_client_manager.get_client()
+        try:
+            if self.block_tracker.backoff_remaining(profile_url):
+                return self._unavailable(profile_url, "backoff")
+            
+            response = await fetch_page(client, profile_url, max_bytes=self.max_page_bytes, error_head_only=True)
+            reason = classify_response(response.status_code, response.headers, response.content, response.url)
+            self.block_tracker.record(profile_url, reason, retry_after_seconds(response.headers))
+            if reason:
+                # Nothing to parse or send to the model on an auth wall or captcha page
+                return self._unavailable(profile_url, reason)
+            
+            soup = BeautifulSoup(response.text, 'html.parser')
                 
-                profile_data = await self._extract_profile_data(soup)
-                posts_data = await self._analyze_posts(profile_data.get("posts", []), domain)
+            profile_data = await self._extract_profile_data(soup)
+            posts_data = await self._analyze_posts(profile_data.get("posts", []), domain)
                 
-                return LinkedInAnalysis(
-                    profile_url=profile_url,
-                    technical_posts_count=posts_data.get("technical_count", 0),
-                    domain_relevant_posts=posts_data.get("domain_relevant", 0),
-                    connections=profile_data.get("connections"),
-                    endorsements=profile_data.get("endorsements", []),
-                    certifications=profile_data.get("certifications", []),
-                    domain_relevance_score=posts_data.get("relevance_score", 0.0)
-                )
+            return LinkedInAnalysis(
+                profile_url=profile_url,
+                technical_posts_count=posts_data.get("technical_count", 0),
+                domain_relevant_posts=posts_data.get("domain_relevant", 0),
+                connections=profile_data.get("connections"),
+                endorsements=profile_data.get("endorsements", []),
+                certifications=profile_data.get("certifications", []),
+                domain_relevance_score=posts_data.get("relevance_score", 0.0)
+            )
             
-            except Exception as e:
-                return LinkedInAnalysis(
-                    profile_url=profile_url,
-                    technical_posts_count=0,
-                    domain_relevant_posts=0,
-                    domain_relevance_score=0.0
-                )
+        except Exception as e:
+            return LinkedInAnalysis(
+                profile_url=profile_url,
+                technical_posts_count=0,
+                domain_relevant_posts=0,
+                domain_relevance_score=0.0
+            )
+    
+    def _unavailable(self, profile_url: str, reason: str) -> LinkedInAnalysis:
+        print(f"LinkedIn profile unavailable ({reason}): {profile_url}")
+        return LinkedInAnalysis(
+            profile_url=profile_url,
+            technical_posts_count=0,
+            domain_relevant_posts=0,
+            domain_relevance_score=0.0,
+            unavailable_reason=reason
+        )
+    
+    def analyze_export(self, export: Dict, domain: str, profile_url: str = "") -> LinkedInAnalysis:
+        """Score a parsed data export or profile PDF locally, without any request.
+        
+        Posts and positions count by the share that mention the domain;
+        certifications and skills saturate after a few matches. Sections the
+        export does not contain are left out of the weighting.
+        """
+        keywords = domain_keywords(domain)
+        post_tokens = [tokenize(post) for post in export.get("posts", [])]
+        technical_count = sum(1 for tokens in post_tokens if tokens & TECHNICAL_TERMS)
+        domain_relevant = sum(1 for tokens in post_tokens if tokens & keywords)
+        
+        sections = {
+            "posts": post_tokens,
+            "positions": [
+                tokenize(f"{position.get('title', '')} {position.get('description', '')}")
+                for position in export.get("positions", [])
+            ],
+            "certifications": [tokenize(certification) for certification in export.get("certifications", [])],
+            "skills": [tokenize(skill) for skill in dict.fromkeys(export.get("skills", []) + export.get("endorsements", []))]
+        }
+        weighted = 0.0
+        total_weight = 0
+        for name, items in sections.items():
+            if not items:
+                continue
+            matches = sum(1 for tokens in items if tokens & keywords)
+            if name in ("posts", "positions"):
+                relevance = matches / len(items)
+            else:
+                relevance = min(1.0, matches / min(3, len(items)))
+            weighted += EXPORT_SECTION_WEIGHTS[name] * relevance
+            total_weight += EXPORT_SECTION_WEIGHTS[name]
+        
+        return LinkedInAnalysis(
+            profile_url=profile_url,
+            technical_posts_count=technical_count,
+            domain_relevant_posts=domain_relevant,
+            connections=export.get("connections"),
+            endorsements=export.get("endorsements", [])[:20],
+            certifications=export.get("certifications", []),
+            domain_relevance_score=round(100 * weighted / total_weight, 1) if total_weight and keywords else 0.0,
+            positions=export.get("positions", []),
+            skills=export.get("skills", []),
+            source=export.get("source")
+        )
     
     async def _extract_profile_data(self, soup: BeautifulSoup) -> Dict:
         posts = []
@@ -1,78 +1,128 @@
 import httpx
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional
 from app.models.schemas import MediumAnalysis
 from langchain_openai import ChatOpenAI
+from app.utils.resilience import llm_circuit_breaker
 from langchain.schema import HumanMessage, SystemMessage
-from bs4 import BeautifulSoup
+from app.utils.http_client import http_client_manager
+from app.utils.cache import PersistentCache
+from app.utils.feed_parser import stream_feed_items
+from app.utils.block_detector import BlockTracker, block_tracker, retry_after_seconds
+from app.utils.negative_cache import NegativeCache, missing_medium_users
+from app.utils.prefetch import MISS, PrefetchCache, prefetch_key, profile_prefetch
 import json
 
+# Feed articles and relevance results per user, valid until the feed is rebuilt
+medium_feed_cache = PersistentCache("medium_feed", max_age=30 * 24 * 3600)
+
 class MediumService:
-    def __init__(self):
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[PersistentCache] = None,
+        tracker: Optional[BlockTracker] = None,
+        missing_users: Optional[NegativeCache] = None,
+        prefetch: Optional[PrefetchCache] = None
+    ):
+        self.client = client
+        self.cache = cache or medium_feed_cache
+        self.block_tracker = tracker or block_tracker
+        self.missing_users = missing_users or missing_medium_users
+        self.prefetch = prefetch or profile_prefetch
         self.token = os.getenv("MEDIUM_TOKEN")
         from config.settings import settings
-        self.llm = ChatOpenAI(model=settings.get_model(), temperature=0.1)
-    
-    async def analyze_profile(self, username: str, domain: str) -> MediumAnalysis:
-        async with httpx.AsyncClient() as client:
-            try:
-                profile_url = f"https://medium.com/@{username}"
-                response = await client.get(profile_url, follow_redirects=True)
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                articles_data = await self._extract_articles(soup)
-                analysis = await self._analyze_articles(articles_data, domain)
-                
-                return MediumAnalysis(
-                    username=username,
-                    articles_count=len(articles_data),
-                    domain_relevant_articles=analysis.get("domain_relevant", 0),
-                    total_claps=analysis.get("total_claps", 0),
-                    followers=analysis.get("followers", 0),
-                    domain_relevance_score=analysis.get("relevance_score", 0.0)
-                )
-            
-            except Exception as e:
-                return MediumAnalysis(
-                    username=username,
-                    articles_count=0,
-                    domain_relevant_articles=0,
-                    total_claps=0,
-                    followers=0,
-                    domain_relevance_score=0.0
-                )
+        self.llm = ChatOpenAI(model=settings.get_model(), temperature=0.1, callbacks=[llm_circuit_breaker])
+        self.max_page_bytes = settings.get_http_config()["page_max_bytes"]
+        self.config = settings.get_medium_config()
     
-    async def _extract_articles(self, soup: BeautifulSoup) -> List[Dict]:
-        articles = []
+    async def collect_profile(self, username: str) -> Dict:
+        """Read the feed; returns ``{"unavailable": reason}`` or the feed cache entry to score"""
+        client = self.client or http_client_manager.get_client()
+        username = username.lstrip("@")
+        cached = self.cache.get(username)
+        feed_url = f"https://medium.com/feed/@{username}"
+        if self.missing_users.is_missing(username):
+            return {"unavailable": "not_found"}
+        if self.block_tracker.backoff_remaining(feed_url):
+            return {"unavailable": "backoff"}
         
-        article_elements = soup.find_all('article') or soup.find_all('div', class_=['postArticle', 'streamItem'])
+        # The profile page is rendered client-side; the RSS feed carries the articles
+        feed = await stream_feed_items(
+            client,
+            feed_url,
+            max_items=self.config["feed_max_items"],
+            max_bytes=self.max_page_bytes,
+            known_build_date=(cached or {}).get("last_build_date")
+        )
+        self.block_tracker.record(feed_url, feed["blocked"], retry_after_seconds(feed["headers"]))
+        if feed["blocked"]:
+            return {"unavailable": feed["blocked"]}
+        if feed["status_code"] == 404:
+            self.missing_users.mark_missing(username)
+            return {"unavailable": "not_found"}
         
-        for article in article_elements[:10]:
-            title_elem = article.find('h1') or article.find('h2') or article.find('h3')
-            title = title_elem.get_text(strip=True) if title_elem else ""
-            
-            content_elem = article.find('div', class_=['postArticle-content', 'graf'])
-            content = content_elem.get_text(strip=True)[:500] if content_elem else ""
+        if feed["unchanged"]:
+            entry = cached
+        else:
+            entry = {"last_build_date": feed["last_build_date"], "articles": feed["items"], "analyses": {}}
+        return {"entry": entry, "cacheable": feed["status_code"] == 200 and bool(entry["last_build_date"])}
+    
+    async def analyze_profile(self, username: str, domain: str) -> MediumAnalysis:
+        try:
+            username = username.lstrip("@")
+            collected = await self.prefetch.get(prefetch_key("medium", username))
+            if collected is MISS:
+                collected = await self.collect_profile(username)
+            if collected.get("unavailable"):
+                return self._unavailable(username, collected["unavailable"])
+            entry = collected["entry"]
             
-            claps_elem = article.find('button', {'data-action': 'show-recommends'})
-            claps = 0
-            if claps_elem:
-                claps_text = claps_elem.get_text(strip=True)
-                try:
-                    claps = int(''.join(filter(str.isdigit, claps_text)))
-                except:
-                    claps = 0
+            articles_data = entry["articles"]
+            analysis = entry["analyses"].get(domain)
+            if analysis is None:
+                analysis = await self._analyze_articles(articles_data, domain)
+                # A failed relevance call is retried next time instead of being cached
+                if not analysis.get("error"):
+                    entry["analyses"][domain] = analysis
+            if collected["cacheable"]:
+                self.cache.set(username, entry)
             
-            if title or content:
-                articles.append({
-                    "title": title,
-                    "content": content,
-                    "claps": claps
-                })
+            return MediumAnalysis(
+                username=username,
+                articles_count=len(articles_data),
+                domain_relevant_articles=analysis.get("domain_relevant", 0),
+                total_claps=analysis.get("total_claps", 0),
+                followers=analysis.get("followers", 0),
+                domain_relevance_score=analysis.get("relevance_score", 0.0)
+            )
         
-        return articles
+        except Exception as e:
+            print(f"Medium service error: {e}")
+            return MediumAnalysis(
+                username=username,
+                articles_count=0,
+                domain_relevant_articles=0,
+                total_claps=0,
+                followers=0,
+                domain_relevance_score=0.0,
+                unavailable_reason="error"
+            )
+    
+    def _unavailable(self, username: str, reason: str) -> MediumAnalysis:
+        print(f"Medium feed unavailable ({reason}): {username}")
+        return MediumAnalysis(
+            username=username,
+            articles_count=0,
+            domain_relevant_articles=0,
+            total_claps=0,
+            followers=0,
+            domain_relevance_score=0.0,
+            unavailable_reason=reason
+        )
     
     async def _analyze_articles(self, articles: List[Dict], domain: str) -> Dict:
+        # The feed carries neither claps nor follower counts
         if not articles:
             return {
                 "domain_relevant": 0,
@@ -85,12 +135,12 @@ class MediumService:
         Analyze these Medium articles for relevance to {domain}.
         Return JSON with:
         - domain_relevant: number of articles relevant to {domain}
-        - total_claps: sum of all claps
         - relevance_score: overall domain relevance (0-100)
         """)
         
         articles_text = "\n\n---\n\n".join([
-            f"Title: {article.get('title', '')}\nContent: {article.get('content', '')[:200]}..."
+            f"Title: {article.get('title', '')}\nTags: {', '.join(article.get('categories', []))}\n"
+            f"Excerpt: {article.get('excerpt', '')[:300]}..."
             for article in articles
         ])
         
@@ -99,12 +149,17 @@ class MediumService:
         try:
             response = await self.llm.ainvoke([system_message, human_message])
             result = json.loads(response.content)
-            result["total_claps"] = sum(article.get("claps", 0) for article in articles)
-            return result
+            return {
+                "domain_relevant": result.get("domain_relevant", 0),
+                "total_claps": 0,
+                "followers": 0,
+                "relevance_score": result.get("relevance_score", 0.0)
+            }
         except:
             return {
                 "domain_relevant": 0,
-                "total_claps": sum(article.get("claps", 0) for article in articles),
+                "total_claps": 0,
                 "followers": 0,
-                "relevance_score": 0.0
+                "relevance_score": 0.0,
+                "error": True
             }
\ No newline at end of file
@@ -1,16 +1,82 @@
 import httpx
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 from app.models.schemas import ProjectAnalysis
 from langchain_openai import ChatOpenAI
+from app.utils.resilience import llm_circuit_breaker
 from langchain.schema import HumanMessage, SystemMessage
-from bs4 import BeautifulSoup
+from app.utils.http_client import http_client_manager
+from app.utils.html_analyzer import TECHNOLOGY_SCRIPTS, analyze_html
+from app.utils.page_fetcher import FetchedPage, fetch_page
+from app.utils.page_weight import measure_page_weight, subresource_cache
+from app.utils.cache import PersistentCache, normalize_url
+from app.utils.process_pool import run_in_process
+from app.utils.github_scoring import score_code_quality
+from app.utils.negative_cache import NegativeCache, missing_project_urls
+from app.utils.prefetch import MISS, PrefetchCache, profile_prefetch, project_prefetch_key
+from app.services.github_service import GitHubService, parse_repository_url
 import json
+import time
 import asyncio
+from urllib.parse import urlparse
+
+# Hard limit for entries that keep being revalidated; see analysis_cache_ttl for the soft one
+project_analysis_cache = PersistentCache("project_analysis", max_age=30 * 24 * 3600)
+
+# Pages that are gone rather than temporarily failing
+MISSING_STATUSES = {404, 410}
 
 class ProjectService:
-    def __init__(self):
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        probe_cache: Optional[PersistentCache] = None,
+        analysis_cache: Optional[PersistentCache] = None,
+        github_service: Optional[GitHubService] = None,
+        missing_urls: Optional[NegativeCache] = None,
+        prefetch: Optional[PrefetchCache] = None
+    ):
+        self.client = client
+        self.github_service = github_service
+        self.missing_urls = missing_urls or missing_project_urls
+        self.prefetch = prefetch or profile_prefetch
+        self.probe_cache = probe_cache or subresource_cache
+        self.analysis_cache = analysis_cache or project_analysis_cache
+        self.cache_stats = {"hits": 0, "revalidated": 0, "misses": 0}
         from config.settings import settings
-        self.llm = ChatOpenAI(model=settings.get_model(), temperature=0.1)
+        self.config = settings.get_project_config()
+        self.max_page_bytes = settings.get_http_config()["page_max_bytes"]
+        self.llm = ChatOpenAI(model=settings.get_model(), temperature=0.1, callbacks=[llm_circuit_breaker])
+    
+    async def evaluate_projects(self, projects: List[Dict], deadline: Optional[float] = None) -> List[ProjectAnalysis]:
+        """Evaluate projects concurrently, keeping whatever finished before the deadline.
+
+        A global semaphore bounds the number of projects in flight and a
+        per-host semaphore keeps us polite towards shared hosting (e.g. many
+        projects on the same github.io or vercel.app domain).
+        """
+        if not projects:
+            return []
+        deadline = deadline if deadline is not None else self.config["stage_deadline"]
+        semaphore = asyncio.Semaphore(self.config["concurrency"])
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        
+        async def evaluate(project: Dict) -> ProjectAnalysis:
+            host = urlparse(str(project.get("url", ""))).netloc.lower()
+            if host not in host_semaphores:
+                host_semaphores[host] = asyncio.Semaphore(self.config["per_host_concurrency"])
+            # Wait for the host slot first so a busy host does not hold global slots
+            async with host_semaphores[host], semaphore:
+                return await self.evaluate_project(project)
+        
+        tasks = [asyncio.create_task(evaluate(project)) for project in projects]
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in pending:
+            task.cancel()
+        if pending:
+            print(f"Project evaluation deadline hit: {len(pending)} of {len(tasks)} projects dropped")
+        
+        # Preserve resume order for the completed ones
+        return [task.result() for task in tasks if task in done and task.exception() is None]
     
     async def evaluate_project(self, project: Dict) -> ProjectAnalysis:
         project_url = project.get("url", "")
@@ -28,83 +94,236 @@ class ProjectService:
                 error_count=0
             )
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(project_url, follow_redirects=True)
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                is_live = response.status_code == 200
-                technologies = await self._detect_technologies(soup, response.text)
-                complexity_score = await self._analyze_complexity(project, soup)
-                responsiveness_score = await self._check_responsiveness(soup)
-                seo_score = await self._analyze_seo(soup)
-                performance_score = await self._analyze_performance(response, soup)
-                error_count = await self._count_errors(soup)
-                
-                return ProjectAnalysis(
-                    project_name=project_name,
-                    is_live=is_live,
-                    url=project_url,
-                    technologies=technologies,
-                    complexity_score=complexity_score,
-                    responsiveness_score=responsiveness_score,
-                    seo_score=seo_score,
-                    performance_score=performance_score,
-                    error_count=error_count
-                )
+        try:
+            collected = await self.prefetch.get(project_prefetch_key(project_url))
+            if collected is MISS:
+                collected = await self.collect_project(project_url)
+            if collected["status"] == "cached":
+                return self._cached_analysis(collected["cached"], project_name, project_url)
+            if collected["status"] == "missing":
+                return self._missing_project(project_name, project_url)
+            if "repo_data" in collected:
+                return await self._score_repository(project, collected)
+            return await self._score_page(project, collected)
             
-            except Exception as e:
-                return ProjectAnalysis(
-                    project_name=project_name,
-                    is_live=False,
-                    url=project_url,
-                    technologies=[],
-                    complexity_score=0.0,
-                    responsiveness_score=0.0,
-                    seo_score=0.0,
-                    performance_score=0.0,
-                    error_count=1
-                )
-    
-    async def _detect_technologies(self, soup: BeautifulSoup, html_content: str) -> List[str]:
+        except Exception as e:
+            print(f"Project evaluation error for {project_url}: {e}")
+            return ProjectAnalysis(
+                project_name=project_name,
+                is_live=False,
+                url=project_url,
+                technologies=[],
+                complexity_score=0.0,
+                responsiveness_score=0.0,
+                seo_score=0.0,
+                performance_score=0.0,
+                error_count=1
+            )
+    
+    async def collect_project(self, project_url: str) -> Dict:
+        """Fetch and parse a project link: everything scoring needs short of the model call.
+
+        Returns ``{"status": "cached"}`` with a fresh or revalidated cache
+        entry, ``{"status": "missing"}`` for a page or repository that is
+        gone, or ``{"status": "fetched"}`` with the page (or the repository
+        metadata) to score. This is the part a prefetch at resume upload
+        runs ahead of the analysis.
+        """
+        # GitHub's own markup says nothing about the candidate; use the API instead
+        repository = parse_repository_url(project_url)
+        if repository:
+            return await self._collect_repository(*repository)
+        
+        client = self.client or http_client_manager.get_client()
+        cache_key = normalize_url(project_url)
+        if self.missing_urls.is_missing(cache_key):
+            return {"status": "missing"}
+        entry = self.analysis_cache.get_entry(cache_key)
+        request_headers = {}
+        if entry:
+            cached, validated_at = entry
+            if time.time() - validated_at < self.config["analysis_cache_ttl"]:
+                self.cache_stats["hits"] += 1
+                return {"status": "cached", "cached": cached}
+            if cached.get("etag"):
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                request_headers["If-Modified-Since"] = cached["last_modified"]
+        
+        # Error pages are only read up to the end of their head
+        response = await fetch_page(
+            client, project_url, max_bytes=self.max_page_bytes, error_head_only=True,
+            headers=request_headers or None, timeout=30.0
+        )
+        if response.status_code == 304 and entry:
+            self.analysis_cache.touch(cache_key)
+            self.cache_stats["revalidated"] += 1
+            return {"status": "cached", "cached": entry[0]}
+        self.cache_stats["misses"] += 1
+        if response.status_code in MISSING_STATUSES:
+            self.missing_urls.mark_missing(cache_key)
+            return {"status": "missing"}
+        # One parse for every heuristic, off the event loop; non-HTML bodies are never downloaded
+        page = await run_in_process(analyze_html, response.text) if response.content else analyze_html("")
+        page_weight = None
+        if self.config["page_weight"] and response.status_code == 200 and page["resources"]:
+            page_weight = await measure_page_weight(
+                client, response.url, page["resources"], len(response.content),
+                concurrency=self.config["page_weight_concurrency"],
+                max_resources=self.config["page_weight_max_resources"],
+                cache=self.probe_cache
+            )
+        return {"status": "fetched", "cache_key": cache_key, "response": response, "page": page, "page_weight": page_weight}
+    
+    async def _score_page(self, project: Dict, collected: Dict) -> ProjectAnalysis:
+        response, page, page_weight = collected["response"], collected["page"], collected["page_weight"]
+        is_live = response.status_code == 200
+        analysis = ProjectAnalysis(
+            project_name=project.get("name", "Unknown Project"),
+            is_live=is_live,
+            url=project.get("url", ""),
+            technologies=await self._detect_technologies(page),
+            complexity_score=await self._analyze_complexity(project, page["text_preview"]),
+            responsiveness_score=await self._check_responsiveness(page),
+            seo_score=await self._analyze_seo(page),
+            performance_score=await self._analyze_performance(response, page, page_weight),
+            error_count=await self._count_errors(page),
+            page_weight=page_weight
+        )
+        # Only live pages are worth sharing; outages should be rechecked next time
+        if is_live:
+            self.analysis_cache.set(collected["cache_key"], {
+                "analysis": analysis.model_dump(mode="json"),
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified")
+            })
+        return analysis
+    
+    async def _collect_repository(self, owner: str, repo: str) -> Dict:
+        """API metrics of a github.com repository link; no live-site heuristics.
+
+        Cached entries are revalidated against the repository's ``pushed_at``
+        instead of an ETag, since nothing changes until the next push.
+        """
+        cache_key = normalize_url(f"https://github.com/{owner}/{repo}")
+        entry = self.analysis_cache.get_entry(cache_key)
+        if entry and time.time() - entry[1] < self.config["analysis_cache_ttl"]:
+            self.cache_stats["hits"] += 1
+            return {"status": "cached", "cached": entry[0]}
+        
+        if self.missing_urls.is_missing(cache_key):
+            return {"status": "missing"}
+        
+        github_service = self.github_service or GitHubService(client=self.client)
+        repo_data = await github_service.get_repository(owner, repo)
+        if repo_data is None:
+            print(f"GitHub repository not found: {owner}/{repo}")
+            self.missing_urls.mark_missing(cache_key)
+            return {"status": "missing"}
+        if entry and entry[0].get("pushed_at") == repo_data.get("pushed_at"):
+            self.analysis_cache.touch(cache_key)
+            self.cache_stats["revalidated"] += 1
+            return {"status": "cached", "cached": entry[0]}
+        self.cache_stats["misses"] += 1
+        return {"status": "fetched", "cache_key": cache_key, "full_name": f"{owner}/{repo}", "repo_data": repo_data}
+    
+    async def _score_repository(self, project: Dict, collected: Dict) -> ProjectAnalysis:
+        repo_data = collected["repo_data"]
+        inspection = repo_data.get("inspection") or {}
+        language_bytes = inspection.get("language_bytes") or {}
+        technologies = sorted(language_bytes, key=language_bytes.get, reverse=True)[:5]
+        if not technologies and repo_data.get("language"):
+            technologies = [repo_data["language"]]
+        
+        analysis = ProjectAnalysis(
+            project_name=project.get("name", "Unknown Project"),
+            is_live=True,
+            url=project.get("url", ""),
+            technologies=technologies,
+            complexity_score=await self._analyze_complexity(project, self._repository_preview(repo_data)),
+            responsiveness_score=0.0,
+            seo_score=0.0,
+            performance_score=0.0,
+            error_count=0,
+            code_quality_score=score_code_quality([repo_data]),
+            repository={
+                "full_name": repo_data.get("full_name", collected["full_name"]),
+                "description": repo_data.get("description") or "",
+                "stars": repo_data.get("stargazers_count", 0),
+                "forks": repo_data.get("forks_count", 0),
+                "open_issues": repo_data.get("open_issues_count", 0),
+                "topics": repo_data.get("topics") or [],
+                "license": (repo_data.get("license") or {}).get("spdx_id"),
+                "homepage": repo_data.get("homepage") or None,
+                "fork": bool(repo_data.get("fork")),
+                "archived": bool(repo_data.get("archived")),
+                "pushed_at": repo_data.get("pushed_at", ""),
+                **({"inspection": inspection} if inspection else {})
+            }
+        )
+        self.analysis_cache.set(collected["cache_key"], {
+            "analysis": analysis.model_dump(mode="json"),
+            "pushed_at": repo_data.get("pushed_at")
+        })
+        return analysis
+    
+    def _repository_preview(self, repo_data: Dict) -> str:
+        inspection = repo_data.get("inspection") or {}
+        languages = ", ".join(f"{name}: {size} bytes" for name, size in (inspection.get("language_bytes") or {}).items())
+        return (
+            f"GitHub repository {repo_data.get('full_name', '')}: {repo_data.get('description') or 'no description'}. "
+            f"Topics: {', '.join(repo_data.get('topics') or []) or 'none'}. Languages: {languages or repo_data.get('language') or 'unknown'}. "
+            f"Stars: {repo_data.get('stargazers_count', 0)}, forks: {repo_data.get('forks_count', 0)}, size: {repo_data.get('size', 0)} KB. "
+            f"README: {inspection.get('readme_size', 'unknown')} bytes, tests: {inspection.get('has_tests', 'unknown')}, "
+            f"CI: {inspection.get('has_ci', 'unknown')}, commits last year: {inspection.get('commits_last_year', 'unknown')}."
+        )
+    
+    def _missing_project(self, project_name: str, project_url: str) -> ProjectAnalysis:
+        return ProjectAnalysis(
+            project_name=project_name,
+            is_live=False,
+            url=project_url,
+            technologies=[],
+            complexity_score=0.0,
+            responsiveness_score=0.0,
+            seo_score=0.0,
+            performance_score=0.0,
+            error_count=1
+        )
+    
+    def _cached_analysis(self, cached: Dict, project_name: str, project_url: str) -> ProjectAnalysis:
+        # The same URL shows up on many resumes under different project names
+        return ProjectAnalysis(**{**cached["analysis"], "project_name": project_name, "url": project_url})
+    
+    async def _detect_technologies(self, page: Dict[str, Any]) -> List[str]:
         technologies = []
         
-        script_tags = soup.find_all('script', src=True)
-        for script in script_tags:
-            src = script.get('src', '').lower()
-            if 'react' in src:
-                technologies.append('React')
-            elif 'angular' in src:
-                technologies.append('Angular')
-            elif 'vue' in src:
-                technologies.append('Vue.js')
-            elif 'jquery' in src:
-                technologies.append('jQuery')
-            elif 'bootstrap' in src:
-                technologies.append('Bootstrap')
-        
-        if 'next.js' in html_content.lower() or '_next' in html_content:
+        for src in page["script_srcs"]:
+            for marker, technology in TECHNOLOGY_SCRIPTS:
+                if marker in src:
+                    technologies.append(technology)
+                    break
+        
+        if page["mentions"]["next.js"]:
             technologies.append('Next.js')
-        if 'nuxt' in html_content.lower():
+        if page["mentions"]["nuxt"]:
             technologies.append('Nuxt.js')
-        if 'tailwind' in html_content.lower():
+        if page["mentions"]["tailwind"]:
             technologies.append('TailwindCSS')
         
-        meta_generator = soup.find('meta', attrs={'name': 'generator'})
-        if meta_generator:
-            generator = meta_generator.get('content', '').lower()
-            if 'wordpress' in generator:
-                technologies.append('WordPress')
-            elif 'django' in generator:
-                technologies.append('Django')
-            elif 'flask' in generator:
-                technologies.append('Flask')
+        generator = page["generator"]
+        if 'wordpress' in generator:
+            technologies.append('WordPress')
+        elif 'django' in generator:
+            technologies.append('Django')
+        elif 'flask' in generator:
+            technologies.append('Flask')
         
         return list(set(technologies))
     
-    async def _analyze_complexity(self, project: Dict, soup: BeautifulSoup) -> float:
+    async def _analyze_complexity(self, project: Dict, content_preview: str) -> float:
         system_message = SystemMessage(content="""
-        Analyze the project complexity based on description and webpage content.
+        Analyze the project complexity based on description and webpage or repository content.
         Rate from 0-100 considering features, functionality, and technical implementation.
         Return only a numeric score.
         """)
@@ -113,7 +332,7 @@ class ProjectService:
         Project: {project.get('name', 'Unknown')}
         Description: {project.get('description', 'No description')}
         Technologies: {project.get('technologies', [])}
-        Webpage content preview: {soup.get_text()[:1000]}
+        Content preview: {content_preview}
         """
         
         human_message = HumanMessage(content=project_info)
@@ -124,72 +343,53 @@ class ProjectService:
         except:
             return 50.0
     
-    async def _check_responsiveness(self, soup: BeautifulSoup) -> float:
+    async def _check_responsiveness(self, page: Dict[str, Any]) -> float:
         score = 0.0
         
-        viewport_meta = soup.find('meta', attrs={'name': 'viewport'})
-        if viewport_meta:
+        if page["has_viewport"]:
             score += 30
         
-        media_queries = soup.find_all('style')
-        for style in media_queries:
-            if '@media' in style.get_text():
-                score += 20
-                break
+        if page["style_has_media_query"]:
+            score += 20
         
-        responsive_classes = ['responsive', 'mobile', 'tablet', 'desktop', 'col-', 'row-']
-        html_content = str(soup).lower()
-        for cls in responsive_classes:
-            if cls in html_content:
-                score += 10
-                break
+        if page["has_responsive_markers"]:
+            score += 10
         
-        if soup.find_all('img', {'class': lambda x: x and 'responsive' in x}):
+        if page["responsive_images"]:
             score += 20
         
-        bootstrap_grid = soup.find_all(class_=lambda x: x and any(
-            grid_class in x for grid_class in ['col-', 'row', 'container']
-        ))
-        if bootstrap_grid:
+        if page["grid_classes"]:
             score += 20
         
         return min(100, score)
     
-    async def _analyze_seo(self, soup: BeautifulSoup) -> float:
+    async def _analyze_seo(self, page: Dict[str, Any]) -> float:
         score = 0.0
         
-        title = soup.find('title')
-        if title and title.get_text().strip():
+        if page["title"].strip():
             score += 20
         
-        meta_description = soup.find('meta', attrs={'name': 'description'})
-        if meta_description and meta_description.get('content'):
+        if page["meta_description"]:
             score += 20
         
-        h1_tags = soup.find_all('h1')
-        if h1_tags:
+        if page["h1_count"]:
             score += 15
         
-        alt_images = soup.find_all('img', alt=True)
-        total_images = soup.find_all('img')
-        if total_images and len(alt_images) / len(total_images) > 0.5:
+        if page["img_count"] and page["img_with_alt"] / page["img_count"] > 0.5:
             score += 15
         
-        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-        if meta_keywords:
+        if page["has_meta_keywords"]:
             score += 10
         
-        canonical = soup.find('link', attrs={'rel': 'canonical'})
-        if canonical:
+        if page["has_canonical"]:
             score += 10
         
-        structured_data = soup.find_all('script', type='application/ld+json')
-        if structured_data:
+        if page["ld_json_count"]:
             score += 10
         
         return min(100, score)
     
-    async def _analyze_performance(self, response: httpx.Response, soup: BeautifulSoup) -> float:
+    async def _analyze_performance(self, response: FetchedPage, page: Dict[str, Any], page_weight: Optional[Dict] = None) -> float:
         score = 100.0
         
         if response.elapsed.total_seconds() > 3:
@@ -197,37 +397,48 @@ class ProjectService:
         elif response.elapsed.total_seconds() > 1:
             score -= 15
         
-        script_tags = soup.find_all('script')
-        if len(script_tags) > 10:
+        if page_weight:
+            return max(0, score - self._page_weight_penalty(page_weight))
+        
+        if page["script_count"] > 10:
             score -= 20
         
-        css_links = soup.find_all('link', rel='stylesheet')
-        if len(css_links) > 5:
+        if page["stylesheet_count"] > 5:
             score -= 10
         
-        images = soup.find_all('img')
-        large_images = [img for img in images if img.get('src') and not any(
-            size in img.get('src', '') for size in ['thumb', 'small', 'compressed']
-        )]
-        if len(large_images) > 10:
+        if page["large_images"] > 10:
             score -= 15
         
-        inline_styles = soup.find_all(style=True)
-        if len(inline_styles) > 20:
+        if page["inline_styles"] > 20:
             score -= 10
         
         return max(0, score)
     
-    async def _count_errors(self, soup: BeautifulSoup) -> int:
-        errors = 0
+    def _page_weight_penalty(self, page_weight: Dict) -> float:
+        """Penalties from measured subresources, replacing the tag-count guesses"""
+        penalty = 0.0
+        
+        total_mb = page_weight["total_bytes"] / (1024 * 1024)
+        if total_mb > 5:
+            penalty += 30
+        elif total_mb > 2:
+            penalty += 15
         
-        broken_images = soup.find_all('img', src=lambda x: not x or x.startswith('data:') == False)
-        errors += len([img for img in broken_images if not img.get('src')])
+        if page_weight["render_blocking"] > 5:
+            penalty += 15
+        elif page_weight["render_blocking"] > 2:
+            penalty += 5
         
-        broken_links = soup.find_all('a', href=lambda x: not x or x == '#')
-        errors += len(broken_links)
+        if page_weight["uncompressed_text_resources"]:
+            penalty += 10
         
-        missing_alt = soup.find_all('img', alt=lambda x: not x)
-        errors += len(missing_alt)
+        if page_weight["max_ttfb"] and page_weight["max_ttfb"] > 1:
+            penalty += 10
         
-        return errors
\ No newline at end of file
+        if page_weight["failed"]:
+            penalty += 5
+        
+        return penalty
+    
+    async def _count_errors(self, page: Dict[str, Any]) -> int:
+        return page["img_missing_src"] + page["broken_links"] + page["img_missing_alt"]
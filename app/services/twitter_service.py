@@ -1,95 +1,368 @@
 import httpx
 import os
-from typing import Dict, List
+import re
+import asyncio
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 from app.models.schemas import TwitterAnalysis
 from langchain_openai import ChatOpenAI
+from app.utils.resilience import llm_circuit_breaker
 from langchain.schema import HumanMessage, SystemMessage
+from app.utils.http_client import http_client_manager
+from app.utils.cache import PersistentCache
+from app.utils.negative_cache import NegativeCache
+from app.utils.prefetch import MISS, PrefetchCache, prefetch_key, profile_prefetch
 import json
 
+TIMELINE_PAGE_SIZE = 100
+TWEET_FIELDS = "public_metrics,created_at,in_reply_to_user_id,referenced_tweets"
+# Names /2/users/by accepts; a single other one makes it reject the whole batch with 400
+USERNAME_PATTERN = re.compile(r"^[A-Za-z0-9_]{1,15}$")
+
+class TimelineAggregator:
+    """Folds timeline pages into engagement and cadence metrics as they arrive.
+
+    Per-tweet values live in compact typed arrays; only a bounded sample of
+    original tweet texts is kept for classification.
+    """
+
+    def __init__(self, sample_size: int = 50):
+        self.sample_size = sample_size
+        self.timestamps = array("d")
+        self.interactions = array("q")
+        self.impressions = array("q")
+        self.replies = 0
+        self.retweets = 0
+        self.quotes = 0
+        self.count = 0
+        self.pages = 0
+        self.texts: List[str] = []
+
+    def add_page(self, tweets: List[Dict]):
+        self.pages += 1
+        for tweet in tweets:
+            if not isinstance(tweet, dict):
+                continue
+            self.count += 1
+            kinds = {ref.get("type") for ref in tweet.get("referenced_tweets") or []}
+            if "retweeted" in kinds:
+                # Retweets carry the original author's metrics
+                self.retweets += 1
+            else:
+                metrics = tweet.get("public_metrics") or {}
+                self.interactions.append(
+                    (metrics.get("like_count") or 0) + (metrics.get("retweet_count") or 0)
+                    + (metrics.get("reply_count") or 0) + (metrics.get("quote_count") or 0)
+                )
+                self.impressions.append(metrics.get("impression_count") or 0)
+                if len(self.texts) < self.sample_size and tweet.get("text"):
+                    self.texts.append(tweet["text"])
+            if "replied_to" in kinds or tweet.get("in_reply_to_user_id"):
+                self.replies += 1
+            if "quoted" in kinds:
+                self.quotes += 1
+            try:
+                created = datetime.fromisoformat(tweet.get("created_at", "").replace("Z", "+00:00"))
+                self.timestamps.append(created.timestamp())
+            except ValueError:
+                continue
+
+    def metrics(self, followers: int) -> Dict:
+        """Engagement, cadence and reply ratios over everything added so far"""
+        total = self.count
+        originals = len(self.interactions)
+        interactions = sum(self.interactions)
+        impressions = sum(self.impressions)
+        if impressions:
+            engagement_rate = 100 * interactions / impressions
+        elif followers and originals:
+            # Older or restricted timelines lack impression counts
+            engagement_rate = 100 * interactions / originals / followers
+        else:
+            engagement_rate = 0.0
+
+        ordered = sorted(self.timestamps)
+        gaps = sorted(later - earlier for earlier, later in zip(ordered, ordered[1:]))
+        span_weeks = (ordered[-1] - ordered[0]) / (7 * 86400) if len(ordered) > 1 else 0.0
+        return {
+            "tweets_analyzed": total,
+            "pages": self.pages,
+            "engagement_rate": round(min(engagement_rate, 100.0), 2),
+            "avg_interactions": round(interactions / originals, 2) if originals else 0.0,
+            "tweets_per_week": round(total / max(span_weeks, 1.0), 2) if total else 0.0,
+            "median_gap_hours": round(gaps[len(gaps) // 2] / 3600, 1) if gaps else None,
+            "reply_ratio": round(self.replies / total, 3) if total else 0.0,
+            "retweet_ratio": round(self.retweets / total, 3) if total else 0.0,
+            "quote_ratio": round(self.quotes / total, 3) if total else 0.0
+        }
+
+class TwitterUserLookup:
+    """Resolves usernames for concurrent analyses with shared multi-user requests.
+
+    Lookups arriving within ``window`` seconds are collected and resolved
+    with one ``/2/users/by?usernames=`` call (up to ``batch_size`` names);
+    each caller gets its own user back. Found users and confirmed misses are
+    cached separately so a typo in one resume does not cost a request per run.
+    Names that cannot be Twitter handles resolve as missing without a request.
+    """
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        window: float = 0.05,
+        batch_size: int = 100,
+        cache: Optional[PersistentCache] = None,
+        missing_cache: Optional[PersistentCache] = None
+    ):
+        self.client = client
+        self.window = window
+        self.batch_size = batch_size
+        self.cache = cache or PersistentCache("twitter_users", max_age=24 * 3600)
+        self.missing_cache = missing_cache or PersistentCache("twitter_users_missing", max_age=3600)
+        self.metrics = {"lookups": 0, "requests": 0, "cache_hits": 0, "negative_hits": 0, "not_found": 0, "errors": 0}
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._timer: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def from_settings(cls) -> "TwitterUserLookup":
+        from config.settings import settings
+        config = settings.get_twitter_config()
+        return cls(
+            window=config["lookup_window"],
+            batch_size=config["lookup_batch_size"],
+            cache=PersistentCache("twitter_users", max_age=config["user_cache_ttl"]),
+            missing_cache=NegativeCache.from_settings("twitter_users_missing", max_age=config["missing_user_cache_ttl"])
+        )
+
+    async def lookup(self, username: str) -> Optional[Dict]:
+        """User object with public metrics, or None if it does not exist or the lookup failed"""
+        key = username.strip().lstrip("@").lower()
+        self.metrics["lookups"] += 1
+        if not USERNAME_PATTERN.match(key):
+            self.metrics["not_found"] += 1
+            return None
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.metrics["cache_hits"] += 1
+            return cached
+        if self.missing_cache.get(key):
+            self.metrics["negative_hits"] += 1
+            return None
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Pending futures belong to the loop that created them
+            self._pending = {}
+            self._timer = None
+            self._loop = loop
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+        if len(self._pending) >= self.batch_size:
+            asyncio.create_task(self._flush())
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(self.window)
+        self._timer = None
+        await self._flush()
+
+    async def _flush(self):
+        batch = dict(list(self._pending.items())[:self.batch_size])
+        if not batch:
+            return
+        for key in batch:
+            del self._pending[key]
+        if len(self._pending) >= self.batch_size:
+            asyncio.create_task(self._flush())
+
+        status, found = await self._request(list(batch))
+        if status == 400 and len(batch) > 1:
+            # The API rejects the whole batch for one name it does not accept; ask for each on its own
+            results = await asyncio.gather(*[self._request([key]) for key in batch])
+            resolved = dict(zip(batch, results))
+        else:
+            resolved = {key: (status, found) for key in batch}
+
+        for key, futures in batch.items():
+            status, found = resolved[key]
+            user = found.get(key)
+            if user:
+                self.cache.set(key, user)
+            elif status == 200:
+                # Only a successful response proves the user does not exist
+                self.missing_cache.set(key, True)
+                self.metrics["not_found"] += 1
+            for future in futures:
+                if not future.done():
+                    future.set_result(user)
+
+    async def _request(self, usernames: List[str]) -> Tuple[int, Dict[str, Dict]]:
+        """Status of one /2/users/by call (0 if it did not complete) and the users it returned by lower-cased name"""
+        bearer_token = os.getenv("TWITTER_BEARER_TOKEN")
+        try:
+            client = self.client or http_client_manager.get_client()
+            self.metrics["requests"] += 1
+            response = await client.get(
+                "https://api.twitter.com/2/users/by",
+                headers={"Authorization": f"Bearer {bearer_token}"} if bearer_token else {},
+                params={"usernames": ",".join(usernames), "user.fields": "public_metrics"}
+            )
+            if response.status_code != 200:
+                self.metrics["errors"] += 1
+                print(f"Twitter user lookup error: {response.status_code}")
+                return response.status_code, {}
+            return 200, {user["username"].lower(): user for user in response.json().get("data") or [] if user.get("username")}
+        except Exception as e:
+            self.metrics["errors"] += 1
+            print(f"Twitter user lookup exception: {e}")
+            return 0, {}
+
+    def invalidate(self, username: str):
+        """Forget the cached user object so the next lookup fetches current metrics"""
+        self.cache.delete(username.strip().lstrip("@").lower())
+
+    def is_known_missing(self, username: str) -> bool:
+        key = username.strip().lstrip("@").lower()
+        return not USERNAME_PATTERN.match(key) or bool(self.missing_cache.get(key))
+
+    def get_metrics(self) -> Dict:
+        return {**self.metrics, "pending": len(self._pending)}
+
+twitter_user_lookup = TwitterUserLookup.from_settings()
+
 class TwitterService:
-    def __init__(self):
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        user_lookup: Optional[TwitterUserLookup] = None,
+        prefetch: Optional[PrefetchCache] = None
+    ):
+        self.client = client
+        self.user_lookup = user_lookup or twitter_user_lookup
+        self.prefetch = prefetch or profile_prefetch
         self.bearer_token = os.getenv("TWITTER_BEARER_TOKEN")
         self.headers = {"Authorization": f"Bearer {self.bearer_token}"} if self.bearer_token else {}
         from config.settings import settings
-        self.llm = ChatOpenAI(model=settings.get_model(), temperature=0.1)
+        self.config = settings.get_twitter_config()
+        self.llm = ChatOpenAI(model=settings.get_model(), temperature=0.1, callbacks=[llm_circuit_breaker])
+    
+    async def collect_profile(self, username: str) -> Optional[Dict]:
+        """Fetch the user and timeline; None when the user is confirmed missing, raises if the lookup failed"""
+        client = self.client or http_client_manager.get_client()
+        user_data = await self._get_user_data(client, username)
+        if not user_data and self.bearer_token:
+            if self.user_lookup.is_known_missing(username):
+                return None
+            raise RuntimeError(f"Twitter user lookup failed for {username}")
+        return {"user_data": user_data, "timeline": await self._get_recent_tweets(client, user_data.get("id", ""))}
     
     async def analyze_profile(self, username: str, domain: str) -> TwitterAnalysis:
-        async with httpx.AsyncClient() as client:
-            try:
-                user_data = await self._get_user_data(client, username)
-                tweets_data = await self._get_recent_tweets(client, user_data.get("id", ""))
-                
-                analysis = await self._analyze_tweets(tweets_data, domain)
-                
-                return TwitterAnalysis(
-                    username=username,
-                    followers=user_data.get("public_metrics", {}).get("followers_count", 0),
-                    technical_tweets_count=analysis.get("technical_count", 0),
-                    domain_relevant_tweets=analysis.get("domain_relevant", 0),
-                    engagement_rate=analysis.get("engagement_rate", 0.0),
-                    domain_relevance_score=analysis.get("relevance_score", 0.0)
-                )
-            
-            except Exception as e:
+        try:
+            collected = await self.prefetch.get(prefetch_key("twitter", username))
+            if collected is MISS:
+                collected = await self.collect_profile(username)
+            if collected is None:
+                # Confirmed missing (now or on an earlier run): skip the timeline and the model
                 return TwitterAnalysis(
                     username=username,
                     followers=0,
                     technical_tweets_count=0,
                     domain_relevant_tweets=0,
                     engagement_rate=0.0,
-                    domain_relevance_score=0.0
+                    domain_relevance_score=0.0,
+                    unavailable_reason="not_found"
                 )
+            user_data = collected["user_data"]
+            timeline = collected["timeline"]
+            followers = user_data.get("public_metrics", {}).get("followers_count", 0)
+            activity = timeline.metrics(followers)
+            
+            analysis = await self._analyze_tweets(timeline.texts, domain)
+            
+            return TwitterAnalysis(
+                username=username,
+                followers=followers,
+                technical_tweets_count=analysis.get("technical_count", 0),
+                domain_relevant_tweets=analysis.get("domain_relevant", 0),
+                engagement_rate=activity["engagement_rate"],
+                domain_relevance_score=analysis.get("relevance_score", 0.0),
+                activity=activity
+            )
+        
+        except Exception as e:
+            print(f"Twitter service error: {e}")
+            return TwitterAnalysis(
+                username=username,
+                followers=0,
+                technical_tweets_count=0,
+                domain_relevant_tweets=0,
+                engagement_rate=0.0,
+                domain_relevance_score=0.0,
+                unavailable_reason="error"
+            )
     
     async def _get_user_data(self, client: httpx.AsyncClient, username: str) -> Dict:
         if not self.bearer_token:
             return {}
         
-        response = await client.get(
-            f"https://api.twitter.com/2/users/by/username/{username}",
-            headers=self.headers,
-            params={"user.fields": "public_metrics"}
-        )
-        
-        if response.status_code == 200:
-            return response.json().get("data", {})
-        return {}
+        # Batched with lookups from other analyses running at the same time
+        return await self.user_lookup.lookup(username) or {}
     
-    async def _get_recent_tweets(self, client: httpx.AsyncClient, user_id: str) -> List[Dict]:
+    async def _get_recent_tweets(self, client: httpx.AsyncClient, user_id: str) -> TimelineAggregator:
+        """Page through the timeline with ``pagination_token`` up to the configured window"""
+        timeline = TimelineAggregator(self.config["classification_sample"])
         if not self.bearer_token or not user_id:
-            return []
+            return timeline
         
-        response = await client.get(
-            f"https://api.twitter.com/2/users/{user_id}/tweets",
-            headers=self.headers,
-            params={
-                "max_results": 20,
-                "tweet.fields": "public_metrics,created_at"
-            }
-        )
+        start_time = datetime.now(timezone.utc) - timedelta(days=self.config["timeline_days"])
+        params = {
+            "max_results": TIMELINE_PAGE_SIZE,
+            "tweet.fields": TWEET_FIELDS,
+            "start_time": start_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+        }
+        
+        while timeline.count < self.config["timeline_max_tweets"]:
+            response = await client.get(
+                f"https://api.twitter.com/2/users/{user_id}/tweets",
+                headers=self.headers,
+                params=params
+            )
+            if response.status_code != 200:
+                print(f"Twitter timeline API error: {response.status_code}")
+                break
+            
+            body = response.json()
+            remaining = self.config["timeline_max_tweets"] - timeline.count
+            timeline.add_page((body.get("data") or [])[:remaining])
+            next_token = (body.get("meta") or {}).get("next_token")
+            if not next_token:
+                break
+            params = {**params, "pagination_token": next_token}
         
-        if response.status_code == 200:
-            return response.json().get("data", [])
-        return []
+        return timeline
     
-    async def _analyze_tweets(self, tweets: List[Dict], domain: str) -> Dict:
+    async def _analyze_tweets(self, tweets: List[str], domain: str) -> Dict:
+        """Classify a sample of tweet texts in one model call; metrics are computed locally"""
         if not tweets:
             return {
                 "technical_count": 0,
                 "domain_relevant": 0,
-                "engagement_rate": 0.0,
                 "relevance_score": 0.0
             }
         
         system_message = SystemMessage(content=f"""
-        Analyze these tweets for technical content relevance to {domain}.
+        Classify these tweets for technical content relevance to {domain}.
         Return JSON with:
         - technical_count: number of technical tweets
         - domain_relevant: tweets relevant to {domain}
-        - engagement_rate: average engagement rate (0-100)
         - relevance_score: overall relevance to {domain} (0-100)
         """)
         
-        tweets_text = "\n\n---\n\n".join([tweet.get("text", "") for tweet in tweets])
+        tweets_text = "\n\n---\n\n".join(tweets)
         human_message = HumanMessage(content=f"Tweets:\n{tweets_text}")
         
         try:
@@ -100,6 +373,5 @@ class TwitterService:
             return {
                 "technical_count": 0,
                 "domain_relevant": 0,
-                "engagement_rate": 0.0,
                 "relevance_score": 0.0
             }
\ No newline at end of file
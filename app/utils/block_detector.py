@@ -0,0 +1,174 @@
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import httpx
+
+# How much of the body the classifier looks at
+CLASSIFY_BYTES = 1024
+
+# Final URL paths of login walls after redirects
+LOGIN_PATHS = ("/authwall", "/login", "/signin", "/uas/login", "/checkpoint", "/m/signin")
+
+LOGIN_MARKERS = (b"authwall", b"sign in to view", b"join linkedin", b"sign in to continue", b"login-form")
+BOT_MARKERS = (
+    b"captcha", b"cf-challenge", b"challenge-platform", b"just a moment...", b"px-captcha",
+    b"verify you are a human", b"unusual traffic", b"access denied"
+)
+
+BLOCK_STATUSES = {999: "bot_block", 429: "rate_limited"}
+
+
+def classify_response(status_code: int, headers: httpx.Headers, body_head: bytes, url: str = "") -> Optional[str]:
+    """Why a response cannot contain profile data, or None if it looks usable.
+
+    Looks only at the status, headers, final URL and the first
+    ``CLASSIFY_BYTES`` of the body. Reasons are ``rate_limited``,
+    ``bot_block``, ``login_wall`` and ``empty``. A plain 404 is not a block.
+    """
+    if status_code in BLOCK_STATUSES:
+        return BLOCK_STATUSES[status_code]
+    if headers.get("cf-mitigated") == "challenge":
+        return "bot_block"
+
+    path = urlparse(url).path.lower()
+    if any(path.startswith(prefix) for prefix in LOGIN_PATHS):
+        return "login_wall"
+
+    head = body_head[:CLASSIFY_BYTES].lower()
+    if "html" in headers.get("content-type", "").lower():
+        if any(marker in head for marker in BOT_MARKERS):
+            return "bot_block"
+        if any(marker in head for marker in LOGIN_MARKERS):
+            return "login_wall"
+    if status_code == 403:
+        return "bot_block"
+    if status_code == 200 and not head.strip():
+        return "empty"
+    return None
+
+
+def retry_after_seconds(headers: httpx.Headers) -> Optional[float]:
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostState:
+    def __init__(self):
+        self.requests = 0
+        self.blocked = 0
+        self.consecutive = 0
+        self.blocked_until = 0.0
+        self.skipped = 0
+        self.reasons: Dict[str, int] = {}
+
+
+class BlockTracker:
+    """Per-host block rate and backoff for scraped sites.
+
+    Each blocked response doubles the host's backoff (from ``base_backoff``
+    up to ``max_backoff``, or the server's Retry-After when longer); any
+    usable response resets it. While a host is backing off, callers skip it
+    without sending a request. Past ``max_hosts`` the least recently used
+    hosts that are neither blocked nor backing off are forgotten.
+    """
+
+    def __init__(self, base_backoff: float = 60.0, max_backoff: float = 3600.0, max_hosts: int = 1000):
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_hosts = max_hosts
+        self.hosts: "OrderedDict[str, HostState]" = OrderedDict()
+        self.evicted = 0
+
+    @classmethod
+    def from_settings(cls) -> "BlockTracker":
+        from config.settings import settings
+        config = settings.get_scraper_config()
+        return cls(base_backoff=config["block_backoff"], max_backoff=config["block_backoff_max"])
+
+    def _state(self, url: str) -> HostState:
+        host = urlparse(url).hostname or url
+        state = self.hosts.get(host)
+        if state is None:
+            state = self.hosts[host] = HostState()
+            self._evict_idle()
+        else:
+            self.hosts.move_to_end(host)
+        return state
+
+    def _evict_idle(self):
+        excess = len(self.hosts) - self.max_hosts
+        if excess <= 0:
+            return
+        now = time.time()
+        # Oldest first; the host just added stays
+        for host in list(self.hosts)[:-1]:
+            state = self.hosts[host]
+            # A backoff that ended longer ago than the longest one is history
+            if (state.consecutive == 0 and state.blocked_until <= now) or state.blocked_until + self.max_backoff < now:
+                del self.hosts[host]
+                self.evicted += 1
+                excess -= 1
+                if excess == 0:
+                    return
+
+    def backoff_remaining(self, url: str) -> float:
+        """Seconds until the host may be tried again; counts the skip when positive"""
+        state = self._state(url)
+        remaining = state.blocked_until - time.time()
+        if remaining > 0:
+            state.skipped += 1
+            return remaining
+        return 0.0
+
+    def record(self, url: str, reason: Optional[str], retry_after: Optional[float] = None):
+        state = self._state(url)
+        state.requests += 1
+        if reason is None:
+            state.consecutive = 0
+            return
+        state.blocked += 1
+        state.consecutive += 1
+        state.reasons[reason] = state.reasons.get(reason, 0) + 1
+        backoff = min(self.max_backoff, self.base_backoff * 2 ** (state.consecutive - 1))
+        state.blocked_until = time.time() + max(backoff, retry_after or 0.0)
+
+    def _host_metrics(self, state: HostState, now: float) -> Dict:
+        return {
+            "requests": state.requests,
+            "blocked": state.blocked,
+            "block_rate": round(state.blocked / state.requests, 3) if state.requests else 0.0,
+            "reasons": dict(state.reasons),
+            "skipped": state.skipped,
+            "backoff_remaining": round(max(0.0, state.blocked_until - now), 1)
+        }
+
+    def get_metrics(self) -> Dict:
+        now = time.time()
+        return {host: self._host_metrics(state, now) for host, state in self.hosts.items()}
+
+    def get_summary(self) -> Dict:
+        """Host counts and only the hosts backing off, for the health check"""
+        now = time.time()
+        return {
+            "hosts": len(self.hosts),
+            "evicted": self.evicted,
+            "backing_off": {
+                host: self._host_metrics(state, now)
+                for host, state in self.hosts.items()
+                if state.blocked_until > now
+            }
+        }
+
+
+block_tracker = BlockTracker.from_settings()
@@ -0,0 +1,203 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import httpx
+from config.settings import settings
+
+
+class PersistentCache:
+    """Small SQLite-backed key/value store for JSON-serializable values.
+
+    Entries are grouped by namespace so several caches can share one file.
+    The database is opened lazily, so importing a module that defines a
+    cache does not touch the disk.
+    """
+
+    def __init__(self, namespace: str, path: Optional[str] = None, max_age: Optional[float] = None):
+        self.namespace = namespace
+        self._path = path
+        self.max_age = max_age
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            path = self._path
+            if path is None:
+                path = settings.get_cache_config()["path"]
+            if path != ":memory:":
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "namespace TEXT, key TEXT, value TEXT, stored_at REAL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            if self.max_age:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND stored_at < ?",
+                    (self.namespace, time.time() - self.max_age)
+                )
+            self._conn.commit()
+        return self._conn
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return (value, stored_at) or None if the key is missing or expired"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value, stored_at FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+        if row is None:
+            return None
+        value, stored_at = row
+        if self.max_age and time.time() - stored_at > self.max_age:
+            self.delete(key)
+            return None
+        return json.loads(value), stored_at
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, stored_at) VALUES (?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value, default=str), time.time())
+            )
+            conn.commit()
+
+    def touch(self, key: str):
+        """Reset the stored_at timestamp of an entry without rewriting it"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "UPDATE cache SET stored_at = ? WHERE namespace = ? AND key = ?",
+                (time.time(), self.namespace, key)
+            )
+            conn.commit()
+
+    def keys(self) -> List[str]:
+        """Keys of all unexpired entries"""
+        oldest = time.time() - self.max_age if self.max_age else 0.0
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT key FROM cache WHERE namespace = ? AND stored_at >= ?",
+                (self.namespace, oldest)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def delete(self, key: str):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (self.namespace, key))
+            conn.commit()
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM cache WHERE namespace = ?", (self.namespace,))
+            conn.commit()
+
+
+TRACKING_PARAMS = {"fbclid", "gclid", "ref", "source"}
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a URL for use as a cache key.
+
+    Lower-cases scheme and host, drops default ports, fragments, tracking
+    parameters and trailing slashes, and sorts the query, so links that
+    differ only cosmetically share one entry.
+    """
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or "https").lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and not (scheme == "http" and parts.port == 80 or scheme == "https" and parts.port == 443):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith("utm_") and name.lower() not in TRACKING_PARAMS
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+class ConditionalHTTPCache:
+    """Replays GET requests with If-None-Match / If-Modified-Since.
+
+    A 304 is turned back into a 200 response carrying the stored body, so
+    callers keep checking ``status_code == 200`` and calling ``.json()``.
+    Headers of the 304 (e.g. rate-limit counters) are kept as they are
+    fresher than the stored ones.
+    """
+
+    STORED_HEADERS = ["content-type", "link"]
+
+    def __init__(self, store: PersistentCache):
+        self.store = store
+        self.stats = {"hits": 0, "misses": 0, "stored": 0}
+
+    async def get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> httpx.Response:
+        key = str(httpx.URL(url, params=params))
+        cached = self.store.get(key)
+
+        request_headers = dict(headers or {})
+        if cached:
+            if cached.get("etag"):
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                request_headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = await client.get(url, headers=request_headers, params=params, **kwargs)
+
+        if response.status_code == 304 and cached:
+            self.stats["hits"] += 1
+            self.store.touch(key)
+            replay_headers = {
+                name: value for name, value in response.headers.items()
+                if name not in ("content-length", "content-encoding", "transfer-encoding")
+            }
+            replay_headers.update(cached.get("headers", {}))
+            replay_headers["x-cache"] = "HIT"
+            return httpx.Response(
+                200,
+                headers=replay_headers,
+                content=cached["body"].encode("utf-8"),
+                request=response.request
+            )
+
+        self.stats["misses"] += 1
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if response.status_code == 200 and (etag or last_modified):
+            self.store.set(key, {
+                "etag": etag,
+                "last_modified": last_modified,
+                "headers": {
+                    name: response.headers[name]
+                    for name in self.STORED_HEADERS
+                    if name in response.headers
+                },
+                "body": response.text
+            })
+            self.stats["stored"] += 1
+        return response
+
+
+http_cache = ConditionalHTTPCache(
+    PersistentCache("http", max_age=settings.get_cache_config()["http_max_age"])
+)
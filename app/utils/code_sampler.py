@@ -0,0 +1,225 @@
+import asyncio
+import io
+import queue
+import random
+import re
+import tarfile
+import zlib
+from typing import Dict, List, Optional, Tuple
+import httpx
+from app.utils.process_pool import run_in_process
+
+SOURCE_EXTENSIONS = {
+    ".py": "#", ".rb": "#", ".sh": "#",
+    ".js": "//", ".jsx": "//", ".ts": "//", ".tsx": "//", ".go": "//", ".rs": "//",
+    ".java": "//", ".kt": "//", ".scala": "//", ".swift": "//", ".c": "//", ".h": "//",
+    ".cpp": "//", ".cc": "//", ".hpp": "//", ".cs": "//", ".php": "//", ".dart": "//"
+}
+
+SKIP_DIRECTORIES = {"node_modules", "vendor", "dist", "build", "third_party", ".git", "__pycache__", "venv", ".venv"}
+
+FUNCTION_PATTERNS = {
+    "#": re.compile(r"^\s*(?:async\s+)?def\s+\w+|^\s*def\s+\w+|^\s*function\s+\w+", re.MULTILINE),
+    "//": re.compile(
+        r"\bfunction\b\s*\w*\s*\(|=>\s*[{(]|^\s*func\s+|^\s*(?:pub\s+)?fn\s+\w+"
+        r"|^\s*(?:public|private|protected|static|\s)+[\w<>\[\],\s]+\s+\w+\s*\([^;]*\)\s*\{",
+        re.MULTILINE
+    )
+}
+
+_EOF = object()
+
+
+class _QueueReader(io.RawIOBase):
+    """Blocking file object fed with byte chunks from the event loop"""
+
+    def __init__(self, chunks: "queue.Queue"):
+        self._chunks = chunks
+        self._buffer = b""
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        while not self._buffer and not self._eof:
+            chunk = self._chunks.get()
+            if chunk is _EOF:
+                self._eof = True
+            else:
+                self._buffer = chunk
+        size = min(len(target), len(self._buffer))
+        target[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def _is_source(path: str) -> Optional[str]:
+    parts = path.split("/")
+    if any(part in SKIP_DIRECTORIES for part in parts[:-1]):
+        return None
+    name = parts[-1]
+    if ".min." in name:
+        return None
+    extension = name[name.rfind("."):] if "." in name else ""
+    return extension if extension in SOURCE_EXTENSIONS else None
+
+
+def _is_test_file(path: str) -> bool:
+    lowered = path.lower()
+    name = lowered.rsplit("/", 1)[-1]
+    return (
+        "/test/" in f"/{lowered}" or "/tests/" in f"/{lowered}" or "/__tests__/" in f"/{lowered}"
+        or name.startswith("test_") or "_test." in name or ".test." in name or ".spec." in name
+    )
+
+
+def sample_tar_stream(fileobj, max_files: int, max_file_bytes: int, seed: str = "") -> Dict:
+    """Reservoir-sample source files from a tar stream read strictly front to back.
+
+    A truncated stream (byte cap reached) simply ends the scan; whatever was
+    sampled up to that point is returned.
+    """
+    rng = random.Random(seed)
+    samples: List[Tuple[str, str]] = []
+    seen_sources = 0
+    test_files = 0
+    truncated = False
+
+    try:
+        with tarfile.open(fileobj=fileobj, mode="r|*") as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                # codeload archives wrap everything in "<repo>-<ref>/"
+                path = member.name.split("/", 1)[-1]
+                extension = _is_source(path)
+                if not extension:
+                    continue
+                seen_sources += 1
+                if _is_test_file(path):
+                    test_files += 1
+                if member.size > max_file_bytes:
+                    continue
+
+                if len(samples) < max_files:
+                    slot = len(samples)
+                    samples.append(None)
+                else:
+                    slot = rng.randrange(seen_sources)
+                    if slot >= max_files:
+                        continue
+                handle = archive.extractfile(member)
+                if handle is None:
+                    continue
+                samples[slot] = (path, handle.read().decode("utf-8", errors="replace"))
+    except (tarfile.TarError, EOFError, OSError, zlib.error):
+        truncated = True
+
+    return {
+        "files": [sample for sample in samples if sample],
+        "source_files_seen": seen_sources,
+        "test_files_seen": test_files,
+        "truncated": truncated
+    }
+
+
+def compute_source_metrics(files: List[Tuple[str, str]]) -> Dict:
+    """Static metrics over sampled files; runs in the process pool"""
+    total_lines = 0
+    code_lines = 0
+    comment_lines = 0
+    functions = 0
+    file_lines = []
+
+    for path, content in files:
+        marker = SOURCE_EXTENSIONS.get(path[path.rfind("."):], "//")
+        lines = content.splitlines()
+        file_lines.append(len(lines))
+        in_block = False
+        for line in lines:
+            stripped = line.strip()
+            if not stripped:
+                continue
+            total_lines += 1
+            if in_block:
+                comment_lines += 1
+                if "*/" in stripped or stripped.endswith('"""'):
+                    in_block = False
+                continue
+            if stripped.startswith(marker) or stripped.startswith("*"):
+                comment_lines += 1
+            elif stripped.startswith("/*") or (marker == "#" and stripped.startswith('"""')):
+                comment_lines += 1
+                closer = "*/" if stripped.startswith("/*") else '"""'
+                in_block = stripped.count(closer) < (2 if closer == '"""' else 1)
+            else:
+                code_lines += 1
+        functions += len(FUNCTION_PATTERNS["#" if marker == "#" else "//"].findall(content))
+
+    files_count = len(files)
+    return {
+        "files_sampled": files_count,
+        "avg_file_lines": round(sum(file_lines) / files_count, 1) if files_count else 0.0,
+        "max_file_lines": max(file_lines) if file_lines else 0,
+        "functions_per_file": round(functions / files_count, 2) if files_count else 0.0,
+        "avg_function_length": round(code_lines / functions, 1) if functions else 0.0,
+        "comment_density": round(comment_lines / total_lines, 3) if total_lines else 0.0
+    }
+
+
+async def sample_repository_code(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    max_bytes: int = 20 * 1024 * 1024,
+    max_files: int = 40,
+    max_file_bytes: int = 100 * 1024,
+    seed: str = ""
+) -> Dict:
+    """Stream a repository tarball through ``tarfile`` with a hard byte cap.
+
+    Chunks are handed to a reader thread as they arrive, so nothing is
+    written to disk and at most a few chunks are buffered in memory.
+    """
+    chunks: "queue.Queue" = queue.Queue(maxsize=8)
+    reader = asyncio.create_task(asyncio.to_thread(
+        sample_tar_stream, io.BufferedReader(_QueueReader(chunks)), max_files, max_file_bytes, seed
+    ))
+    bytes_read = 0
+    capped = False
+
+    async def feed(chunk) -> bool:
+        # Non-blocking put so a finished reader can never stall the loop
+        while True:
+            try:
+                chunks.put_nowait(chunk)
+                return True
+            except queue.Full:
+                if reader.done():
+                    return False
+                await asyncio.sleep(0.005)
+
+    try:
+        async with client.stream("GET", url, headers=headers, follow_redirects=True, timeout=30.0) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_raw():
+                if bytes_read + len(chunk) > max_bytes:
+                    chunk = chunk[:max_bytes - bytes_read]
+                    capped = True
+                bytes_read += len(chunk)
+                if not await feed(chunk) or capped:
+                    break
+    finally:
+        await feed(_EOF)
+
+    sample = await reader
+    metrics = await run_in_process(compute_source_metrics, sample["files"])
+    seen = sample["source_files_seen"]
+    metrics.update({
+        "source_files_seen": seen,
+        "test_file_ratio": round(sample["test_files_seen"] / seen, 3) if seen else 0.0,
+        "bytes_read": bytes_read,
+        "truncated": capped or sample["truncated"]
+    })
+    return metrics
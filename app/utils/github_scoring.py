@@ -0,0 +1,129 @@
+import math
+import re
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+# Feature weights of the local repository quality model (sum to 100)
+QUALITY_WEIGHTS = {
+    "has_description": 10,
+    "has_readme": 15,
+    "has_license": 10,
+    "has_topics": 10,
+    "is_original": 15,
+    "is_active": 5,
+    "stars": 10,
+    "recency": 10,
+    "tests_and_ci": 10,
+    "has_language": 5
+}
+
+# Neutral value for signals that need deep inspection when it did not run
+UNKNOWN = 0.5
+
+STOPWORDS = {"and", "or", "the", "of", "for", "in", "development", "engineering", "developer", "engineer", "software"}
+
+# Related terms so "Machine Learning" also matches a "pytorch-classifier" repo
+DOMAIN_KEYWORDS = {
+    "machine learning": ["ml", "ai", "model", "tensorflow", "pytorch", "keras", "sklearn", "neural", "classifier", "nlp", "llm", "jupyter"],
+    "data science": ["data", "pandas", "numpy", "analysis", "jupyter", "notebook", "visualization", "ml"],
+    "web": ["react", "vue", "angular", "nextjs", "frontend", "backend", "api", "html", "css", "javascript", "typescript"],
+    "full stack": ["react", "node", "express", "django", "flask", "api", "frontend", "backend", "fullstack", "javascript", "typescript"],
+    "frontend": ["react", "vue", "angular", "css", "html", "ui", "javascript", "typescript", "nextjs"],
+    "backend": ["api", "server", "django", "flask", "fastapi", "express", "spring", "database", "microservice", "go", "java"],
+    "mobile": ["android", "ios", "swift", "kotlin", "flutter", "react-native", "dart", "app"],
+    "devops": ["docker", "kubernetes", "k8s", "terraform", "ansible", "ci", "cd", "helm", "aws", "infrastructure"],
+    "cloud": ["aws", "gcp", "azure", "serverless", "lambda", "terraform", "kubernetes"],
+    "security": ["security", "crypto", "auth", "vulnerability", "pentest", "ctf", "encryption"],
+    "blockchain": ["blockchain", "solidity", "ethereum", "web3", "smart-contract", "crypto"],
+    "game": ["game", "unity", "unreal", "godot", "engine", "csharp"]
+}
+
+def _words(text: str) -> List[str]:
+    return [word for word in re.split(r"[^a-z0-9+#]+", text.lower()) if word]
+
+def tokenize(text: str) -> set:
+    """Lower-case words plus hyphen-joined neighbours, so "React Native" matches the "react-native" keyword"""
+    words = _words(text)
+    return set(words) | {f"{first}-{second}" for first, second in zip(words, words[1:])}
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+def repository_features(repo: Dict, now: Optional[datetime] = None) -> Dict[str, float]:
+    """Map GitHub repository metadata to features in the range 0-1"""
+    now = now or datetime.now(timezone.utc)
+    inspection = repo.get("inspection") or {}
+
+    pushed_at = _parse_time(repo.get("pushed_at") or repo.get("updated_at"))
+    if pushed_at:
+        age_days = (now - pushed_at).days
+        # Full credit within 90 days, none after two years
+        recency = max(0.0, min(1.0, 1 - (age_days - 90) / (730 - 90)))
+    else:
+        recency = 0.0
+
+    if inspection:
+        has_readme = 1.0 if inspection.get("has_readme") else 0.0
+        tests_and_ci = (inspection.get("has_tests", False) + inspection.get("has_ci", False)) / 2
+    else:
+        has_readme = UNKNOWN
+        tests_and_ci = UNKNOWN
+
+    return {
+        "has_description": 1.0 if repo.get("description") else 0.0,
+        "has_readme": has_readme,
+        "has_license": 1.0 if repo.get("license") else 0.0,
+        "has_topics": min(len(repo.get("topics") or []) / 3, 1.0),
+        "is_original": 0.0 if repo.get("fork") else 1.0,
+        "is_active": 0.0 if repo.get("archived") else 1.0,
+        "stars": min(math.log10((repo.get("stargazers_count") or 0) + 1) / 3, 1.0),
+        "recency": recency,
+        "tests_and_ci": tests_and_ci,
+        "has_language": 1.0 if repo.get("language") else 0.0
+    }
+
+def score_code_quality(repos: List[Dict], now: Optional[datetime] = None) -> float:
+    """Average weighted feature score (0-100) of the given repositories"""
+    if not repos:
+        return 0.0
+    features = list(QUALITY_WEIGHTS)
+    weights = [QUALITY_WEIGHTS[name] for name in features]
+    scores = []
+    for repo in repos:
+        values = repository_features(repo, now)
+        scores.append(sum(weight * values[name] for name, weight in zip(features, weights)))
+    return round(sum(scores) / len(scores), 1)
+
+def domain_keywords(domain: str) -> set:
+    keywords = set(_words(domain)) - STOPWORDS
+    domain_lower = domain.lower()
+    for name, related in DOMAIN_KEYWORDS.items():
+        if name in domain_lower:
+            keywords.update(related)
+    return keywords
+
+def score_domain_relevance(repos: List[Dict], domain: str) -> float:
+    """Share of repositories whose name, description, topics or language overlap the domain"""
+    if not repos:
+        return 0.0
+    keywords = domain_keywords(domain)
+    if not keywords:
+        return 0.0
+
+    target_hits = min(3, len(keywords))
+    relevance = []
+    for repo in repos:
+        repo_tokens = tokenize(" ".join([
+            repo.get("name") or "",
+            repo.get("description") or "",
+            " ".join(repo.get("topics") or []),
+            repo.get("language") or ""
+        ]))
+        hits = len(keywords & repo_tokens)
+        relevance.append(min(1.0, hits / target_hits))
+    return round(100 * sum(relevance) / len(relevance), 1)
@@ -0,0 +1,187 @@
+from typing import Any, Dict, Optional
+from lxml import etree
+
+TECHNOLOGY_SCRIPTS = [
+    ("react", "React"),
+    ("angular", "Angular"),
+    ("vue", "Vue.js"),
+    ("jquery", "jQuery"),
+    ("bootstrap", "Bootstrap")
+]
+
+RESPONSIVE_MARKERS = ["responsive", "mobile", "tablet", "desktop", "col-", "row-"]
+GRID_CLASS_MARKERS = ["col-", "row", "container"]
+SMALL_IMAGE_MARKERS = ["thumb", "small", "compressed"]
+TEXT_PREVIEW_CHARS = 1000
+
+
+class _PageFeatureCollector:
+    """lxml parser target that gathers every page feature in one pass"""
+
+    def __init__(self):
+        self.features: Dict[str, Any] = {
+            "title": "",
+            "script_count": 0,
+            "script_srcs": [],
+            "ld_json_count": 0,
+            "generator": "",
+            "has_viewport": False,
+            "meta_description": "",
+            "has_meta_keywords": False,
+            "has_canonical": False,
+            "stylesheet_count": 0,
+            "style_has_media_query": False,
+            "h1_count": 0,
+            "img_count": 0,
+            "img_with_alt": 0,
+            "img_missing_alt": 0,
+            "img_missing_src": 0,
+            "large_images": 0,
+            "responsive_images": False,
+            "grid_classes": False,
+            "inline_styles": 0,
+            "broken_links": 0,
+            "text_preview": "",
+            "resources": []
+        }
+        self._stack = []
+        self._in_head = False
+        self._title_done = False
+        self._style_text = []
+        self._preview = []
+        self._preview_length = 0
+
+    def start(self, tag, attrib):
+        tag = tag.lower() if isinstance(tag, str) else ""
+        self._stack.append(tag)
+        features = self.features
+        classes = attrib.get("class", "").split()
+
+        if "style" in attrib:
+            features["inline_styles"] += 1
+        if classes and not features["grid_classes"]:
+            features["grid_classes"] = any(marker in cls for cls in classes for marker in GRID_CLASS_MARKERS)
+
+        if tag == "head":
+            self._in_head = True
+        elif tag == "body":
+            self._in_head = False
+
+        if tag == "script":
+            features["script_count"] += 1
+            src = attrib.get("src")
+            if src is not None:
+                features["script_srcs"].append(src.lower())
+                # Classic scripts in the head hold up the first render
+                blocking = (
+                    self._in_head and "async" not in attrib and "defer" not in attrib
+                    and attrib.get("type") != "module"
+                )
+                self._add_resource("script", src, blocking)
+            if attrib.get("type") == "application/ld+json":
+                features["ld_json_count"] += 1
+        elif tag == "meta":
+            name = attrib.get("name")
+            content = attrib.get("content", "")
+            if name == "generator" and not features["generator"]:
+                features["generator"] = content.lower()
+            elif name == "viewport":
+                features["has_viewport"] = True
+            elif name == "description" and not features["meta_description"]:
+                features["meta_description"] = content
+            elif name == "keywords":
+                features["has_meta_keywords"] = True
+        elif tag == "link":
+            rel = attrib.get("rel", "").split()
+            if "canonical" in rel:
+                features["has_canonical"] = True
+            if "stylesheet" in rel:
+                features["stylesheet_count"] += 1
+                media = attrib.get("media", "all").strip().lower()
+                self._add_resource("stylesheet", attrib.get("href"), media in ("", "all", "screen"))
+        elif tag == "h1":
+            features["h1_count"] += 1
+        elif tag == "img":
+            features["img_count"] += 1
+            alt = attrib.get("alt")
+            src = attrib.get("src")
+            if alt is not None:
+                features["img_with_alt"] += 1
+            if not alt:
+                features["img_missing_alt"] += 1
+            if not src:
+                features["img_missing_src"] += 1
+            elif not any(marker in src for marker in SMALL_IMAGE_MARKERS):
+                features["large_images"] += 1
+            self._add_resource("image", src, False)
+            if any("responsive" in cls for cls in classes):
+                features["responsive_images"] = True
+        elif tag == "a":
+            href = attrib.get("href")
+            if not href or href == "#":
+                features["broken_links"] += 1
+
+    def _add_resource(self, kind: str, url: Optional[str], render_blocking: bool):
+        url = (url or "").strip()
+        if url and not url.startswith("data:"):
+            self.features["resources"].append({"type": kind, "url": url, "render_blocking": render_blocking})
+
+    def end(self, tag):
+        tag = tag.lower() if isinstance(tag, str) else ""
+        if self._stack:
+            self._stack.pop()
+        if tag == "head":
+            self._in_head = False
+        elif tag == "title":
+            self._title_done = True
+        elif tag == "style" and self._style_text:
+            if "@media" in "".join(self._style_text):
+                self.features["style_has_media_query"] = True
+            self._style_text = []
+
+    def data(self, text):
+        current = self._stack[-1] if self._stack else ""
+        if current == "title" and not self._title_done:
+            self.features["title"] += text
+        if current == "style":
+            self._style_text.append(text)
+            return
+        if current == "script":
+            return
+        if self._preview_length < TEXT_PREVIEW_CHARS:
+            self._preview.append(text)
+            self._preview_length += len(text)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        self.features["text_preview"] = "".join(self._preview)[:TEXT_PREVIEW_CHARS]
+        return self.features
+
+
+def analyze_html(html: str) -> Dict[str, Any]:
+    """Collect all page features used by ProjectService in a single parse.
+
+    Replaces the separate BeautifulSoup ``find_all`` sweeps (and the
+    ``str(soup)`` re-serialization) with one event-driven lxml pass. Plain
+    substring checks run on the raw markup. Pure function so it can run in
+    the process pool.
+    """
+    collector = _PageFeatureCollector()
+    parser = etree.HTMLParser(target=collector, recover=True, no_network=True)
+    try:
+        if html:
+            parser.feed(html)
+        features = parser.close()
+    except etree.Error:
+        features = collector.close()
+
+    html_lower = html.lower()
+    features["mentions"] = {
+        "next.js": "next.js" in html_lower or "_next" in html,
+        "nuxt": "nuxt" in html_lower,
+        "tailwind": "tailwind" in html_lower
+    }
+    features["has_responsive_markers"] = any(marker in html_lower for marker in RESPONSIVE_MARKERS)
+    return features
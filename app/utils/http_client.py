@@ -0,0 +1,162 @@
+import asyncio
+from typing import Callable, Dict, Optional
+import httpx
+from app.utils.resilience import ResilienceRegistry, ResilientTransport, resilience
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (installed via httpx[http2])"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that releases the host slot once the body is closed"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that caps the number of in-flight requests per host.
+
+    httpx only supports a global connection limit, so a single slow host
+    (e.g. a candidate's portfolio) could otherwise take the whole pool.
+    Semaphores of idle hosts are dropped once more than ``max_hosts`` exist.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int, max_hosts: int = 1000):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._max_hosts = max_hosts
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_semaphore(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            if len(self._semaphores) >= self._max_hosts:
+                # A semaphore with every slot free holds no state worth keeping
+                self._semaphores = {
+                    name: held for name, held in self._semaphores.items() if held._value < self._max_per_host
+                }
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self._max_per_host)
+        return semaphore
+
+    def tracked_hosts(self) -> int:
+        return len(self._semaphores)
+
+    def in_flight(self) -> Dict[str, int]:
+        return {
+            host: self._max_per_host - semaphore._value
+            for host, semaphore in self._semaphores.items()
+            if semaphore._value < self._max_per_host
+        }
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._get_semaphore(request.url.host)
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        if response.is_closed:
+            # Body was already buffered by the inner transport
+            semaphore.release()
+        else:
+            response.stream = _ReleasingStream(response.stream, semaphore.release)
+        return response
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class HTTPClientManager:
+    """Owns the application-wide pooled httpx client shared by all services.
+
+    The client is opened on FastAPI startup and closed on shutdown. Outside
+    the app (scripts, tests) it is created lazily on first use.
+    """
+
+    def __init__(self, registry: Optional[ResilienceRegistry] = None):
+        self.registry = registry or resilience
+        self._client: Optional[httpx.AsyncClient] = None
+        self._transport: Optional[HostLimitedTransport] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _build_client(self) -> httpx.AsyncClient:
+        from config.settings import settings
+        config = settings.get_http_config()
+
+        limits = httpx.Limits(
+            max_connections=config["max_connections"],
+            max_keepalive_connections=config["max_keepalive_connections"],
+            keepalive_expiry=config["keepalive_expiry"]
+        )
+        transport = httpx.AsyncHTTPTransport(
+            http2=config["http2"] and _http2_available(),
+            limits=limits,
+            retries=config["connect_retries"]
+        )
+        self._transport = HostLimitedTransport(transport, config["max_connections_per_host"])
+
+        return httpx.AsyncClient(
+            # Breakers sit outside the host limit so an open circuit never waits for a slot
+            transport=ResilientTransport(self._transport, self.registry),
+            timeout=httpx.Timeout(
+                config["read_timeout"],
+                connect=config["connect_timeout"],
+                pool=config["pool_timeout"]
+            ),
+            headers={"User-Agent": config["user_agent"]}
+        )
+
+    async def start(self):
+        if self._client is None or self._client.is_closed:
+            self._client = self._build_client()
+            self._loop = asyncio.get_running_loop()
+
+    async def close(self):
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._transport = None
+        self._loop = None
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it for the running loop if needed"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            # Pooled connections are bound to the loop that opened them
+            self._client = self._build_client()
+            self._loop = loop
+        return self._client
+
+    def get_stats(self) -> Dict:
+        return {
+            "active": self._client is not None and not self._client.is_closed,
+            "http2": _http2_available(),
+            "in_flight_per_host": self._transport.in_flight() if self._transport else {},
+            "tracked_hosts": self._transport.tracked_hosts() if self._transport else 0,
+            "open_circuits": self.registry.open_circuits()
+        }
+
+
+http_client_manager = HTTPClientManager()
@@ -0,0 +1,160 @@
+import csv
+import io
+import re
+import zipfile
+from typing import IO, Dict, Iterator, List, Optional, Union
+
+MAX_POSTS = 100
+MAX_ROWS = 5000
+
+# Section headings of LinkedIn's "Save to PDF" profile
+PDF_SECTIONS = {
+    "contact", "top skills", "skills", "languages", "certifications", "licenses & certifications",
+    "honors-awards", "publications", "patents", "summary", "experience", "education"
+}
+MAIN_SECTIONS = {"summary", "experience", "education"}
+# The main column opens with name, headline and location, printed after the sidebar
+HEADER_LINES = 3
+DATE_RANGE = re.compile(
+    r"^(?:[A-Z][a-z]+ )?\d{4}\s+-\s+(?:Present|(?:[A-Z][a-z]+ )?\d{4})(?:\s*\(.*\))?$"
+)
+
+
+def _member(archive: zipfile.ZipFile, name: str) -> Optional[zipfile.ZipInfo]:
+    """Find an export CSV by file name, wherever the export nests it"""
+    for info in archive.infolist():
+        if info.filename.rsplit("/", 1)[-1].lower() == name.lower():
+            return info
+    return None
+
+
+def _csv_rows(archive: zipfile.ZipFile, name: str, header_column: str) -> Iterator[Dict[str, str]]:
+    """Stream rows of one CSV in the export without extracting it.
+
+    Some files (Connections.csv) start with a free-text preamble, so lines are
+    skipped until the header containing ``header_column`` appears.
+    """
+    info = _member(archive, name)
+    if info is None:
+        return
+    with archive.open(info) as raw:
+        handle = io.TextIOWrapper(raw, encoding="utf-8-sig", errors="replace", newline="")
+        for line in handle:
+            if header_column in line:
+                reader = csv.DictReader(handle, fieldnames=next(csv.reader([line])))
+                for count, row in enumerate(reader):
+                    if count >= MAX_ROWS:
+                        break
+                    yield {key.strip(): (value or "").strip() for key, value in row.items() if key}
+                return
+
+
+def parse_export_zip(fileobj: IO[bytes]) -> Dict:
+    """Positions, certifications, endorsements, skills and posts from a LinkedIn data export"""
+    with zipfile.ZipFile(fileobj) as archive:
+        profile = next(_csv_rows(archive, "Profile.csv", "First Name"), {})
+        positions = [
+            {
+                "title": row.get("Title", ""),
+                "company": row.get("Company Name", ""),
+                "description": row.get("Description", ""),
+                "started_on": row.get("Started On", ""),
+                "finished_on": row.get("Finished On", "")
+            }
+            for row in _csv_rows(archive, "Positions.csv", "Company Name")
+        ]
+        certifications = [
+            f"{row['Name']} ({row['Authority']})" if row.get("Authority") else row.get("Name", "")
+            for row in _csv_rows(archive, "Certifications.csv", "Name")
+            if row.get("Name")
+        ]
+        endorsement_counts: Dict[str, int] = {}
+        for row in _csv_rows(archive, "Endorsement_Received_Info.csv", "Skill Name"):
+            if row.get("Skill Name") and row.get("Endorsement Status", "ACCEPTED") != "REJECTED":
+                endorsement_counts[row["Skill Name"]] = endorsement_counts.get(row["Skill Name"], 0) + 1
+        skills = [row["Name"] for row in _csv_rows(archive, "Skills.csv", "Name") if row.get("Name")]
+        connections = sum(1 for _ in _csv_rows(archive, "Connections.csv", "First Name"))
+        posts = []
+        for row in _csv_rows(archive, "Shares.csv", "ShareCommentary"):
+            if row.get("ShareCommentary"):
+                posts.append(row["ShareCommentary"])
+                if len(posts) >= MAX_POSTS:
+                    break
+
+    return {
+        "source": "data_export",
+        "headline": profile.get("Headline", ""),
+        "summary": profile.get("Summary", ""),
+        "positions": positions,
+        "certifications": certifications,
+        "endorsements": sorted(endorsement_counts, key=endorsement_counts.get, reverse=True),
+        "skills": skills,
+        "connections": connections or None,
+        "posts": posts
+    }
+
+
+def parse_profile_pdf(fileobj: IO[bytes]) -> Dict:
+    """Sections of the "Save to PDF" profile, read page by page"""
+    import PyPDF2
+
+    sections: Dict[str, List[str]] = {}
+    current = "header"
+    for page in PyPDF2.PdfReader(fileobj).pages:
+        for line in (page.extract_text() or "").splitlines():
+            line = line.strip()
+            if not line or (line.startswith("Page ") and " of " in line):
+                continue
+            if line.lower() in PDF_SECTIONS:
+                if line.lower() in MAIN_SECTIONS and "header" not in sections and current != "header":
+                    sidebar = sections.get(current, [])
+                    sections["header"] = sidebar[-HEADER_LINES:]
+                    del sidebar[-HEADER_LINES:]
+                current = line.lower()
+                continue
+            sections.setdefault(current, []).append(line)
+
+    positions = []
+    experience = sections.get("experience", [])
+    for index, line in enumerate(experience):
+        # Company, title and date range are printed on consecutive lines
+        if DATE_RANGE.match(line) and index >= 1:
+            positions.append({
+                "title": experience[index - 1],
+                "company": experience[index - 2] if index >= 2 else "",
+                "description": "",
+                "started_on": line.split(" - ")[0],
+                "finished_on": line.split(" - ")[1].split("(")[0].strip()
+            })
+
+    header = sections.get("header", [])
+    return {
+        "source": "profile_pdf",
+        "headline": header[1] if len(header) > 1 else "",
+        "summary": " ".join(sections.get("summary", [])),
+        "positions": positions,
+        "certifications": sections.get("certifications", []) + sections.get("licenses & certifications", []),
+        "endorsements": [],
+        "skills": sections.get("top skills", []) + sections.get("skills", []),
+        "connections": None,
+        "posts": []
+    }
+
+
+def parse_linkedin_export(content: Union[bytes, bytearray, str, IO[bytes]]) -> Dict:
+    """Parse a LinkedIn data export ZIP or profile PDF; no network access.
+
+    Accepts bytes, a file path or a seekable binary
+    file. Runs in the process pool.
+    """
+    if isinstance(content, str):
+        with open(content, "rb") as handle:
+            return parse_linkedin_export(handle)
+    fileobj = io.BytesIO(content) if isinstance(content, (bytes, bytearray)) else content
+    magic = fileobj.read(4)
+    fileobj.seek(0)
+    if magic.startswith(b"PK"):
+        return parse_export_zip(fileobj)
+    if magic.startswith(b"%PDF"):
+        return parse_profile_pdf(fileobj)
+    raise ValueError("Unsupported LinkedIn export: expected the data export ZIP or the profile PDF")
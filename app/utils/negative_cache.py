@@ -0,0 +1,125 @@
+import hashlib
+import math
+from typing import Dict, Optional
+from app.utils.cache import PersistentCache
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+
+    Sized for ``capacity`` items at ``error_rate`` false positives. It never
+    yields false negatives, so a miss proves the key was never added.
+    """
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.01):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        # Double hashing: position i = h1 + i * h2
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class NegativeCache:
+    """TTL-bounded record of usernames and URLs known not to exist.
+
+    Entries live in the persistent cache, so expiry is handled there and a
+    profile that gets created is picked up after ``max_age``. With
+    ``bloom_capacity`` set, an in-memory Bloom filter answers the common
+    "not known missing" case without touching SQLite; only filter hits are
+    confirmed against the store. The interface matches ``PersistentCache``'s
+    ``get``/``set`` so it can back any existing miss cache. Usernames are
+    matched case-insensitively; with ``case_sensitive`` keys (e.g.
+    normalized URLs, whose paths are case-sensitive) are used as given.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_age: float = 24 * 3600,
+        bloom_capacity: int = 0,
+        error_rate: float = 0.01,
+        path: Optional[str] = None,
+        case_sensitive: bool = False
+    ):
+        self.store = PersistentCache(namespace, path=path, max_age=max_age)
+        self.case_sensitive = case_sensitive
+        self.bloom_capacity = bloom_capacity
+        self.error_rate = error_rate
+        self._bloom: Optional[BloomFilter] = None
+        self.metrics = {"checks": 0, "hits": 0, "bloom_skips": 0, "marked": 0}
+
+    @classmethod
+    def from_settings(cls, namespace: str, max_age: Optional[float] = None, case_sensitive: bool = False) -> "NegativeCache":
+        from config.settings import settings
+        config = settings.get_negative_cache_config()
+        return cls(
+            namespace,
+            max_age=max_age or config["ttl"],
+            bloom_capacity=config["bloom_capacity"] if config["bloom"] else 0,
+            error_rate=config["bloom_error_rate"],
+            case_sensitive=case_sensitive
+        )
+
+    def _key(self, identifier: str) -> str:
+        if self.case_sensitive:
+            return identifier.strip()
+        return identifier.strip().lstrip("@").lower()
+
+    def _filter(self) -> Optional[BloomFilter]:
+        if self.bloom_capacity and self._bloom is None:
+            self._bloom = BloomFilter(self.bloom_capacity, self.error_rate)
+            # Entries written by earlier processes
+            for key in self.store.keys():
+                self._bloom.add(key)
+        return self._bloom
+
+    def is_missing(self, identifier: str) -> bool:
+        key = self._key(identifier)
+        self.metrics["checks"] += 1
+        bloom = self._filter()
+        if bloom is not None and key not in bloom:
+            self.metrics["bloom_skips"] += 1
+            return False
+        if self.store.get(key):
+            self.metrics["hits"] += 1
+            return True
+        return False
+
+    def mark_missing(self, identifier: str):
+        key = self._key(identifier)
+        self.store.set(key, True)
+        self.metrics["marked"] += 1
+        bloom = self._filter()
+        if bloom is not None:
+            bloom.add(key)
+
+    def get(self, key: str) -> Optional[bool]:
+        return True if self.is_missing(key) else None
+
+    def set(self, key: str, value: bool = True):
+        if value:
+            self.mark_missing(key)
+        else:
+            self.store.delete(self._key(key))
+
+    def get_metrics(self) -> Dict:
+        return {**self.metrics, "bloom_items": self._bloom.count if self._bloom else None}
+
+
+missing_github_users = NegativeCache.from_settings("missing_github_users")
+missing_medium_users = NegativeCache.from_settings("missing_medium_users")
+missing_project_urls = NegativeCache.from_settings("missing_project_urls", case_sensitive=True)
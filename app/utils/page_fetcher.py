@@ -0,0 +1,116 @@
+import time
+from datetime import timedelta
+from typing import Dict, Iterable, Optional
+import httpx
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# End of the document head; seeing either means title/meta/viewport are complete
+HEAD_END_MARKERS = (b"</head", b"<body")
+
+
+class FetchedPage:
+    """Status, headers and a size-capped body of a streamed page fetch"""
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        headers: httpx.Headers,
+        content: bytes,
+        encoding: Optional[str],
+        elapsed: timedelta,
+        truncated: bool = False,
+        head_only: bool = False
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+        self.elapsed = elapsed
+        self.truncated = truncated
+        self.head_only = head_only
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("content-type", "").split(";")[0].strip().lower()
+
+    @property
+    def is_html(self) -> bool:
+        # A missing content type is common on static hosts; let the parser decide
+        return not self.content_type or self.content_type in HTML_CONTENT_TYPES
+
+    @property
+    def text(self) -> str:
+        # A capped body may end mid-character
+        return self.content.decode(self.encoding, errors="replace")
+
+
+async def fetch_page(
+    client: httpx.AsyncClient,
+    url: str,
+    max_bytes: int = 2 * 1024 * 1024,
+    head_only: bool = False,
+    error_head_only: bool = False,
+    content_types: Iterable[str] = HTML_CONTENT_TYPES,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None
+) -> FetchedPage:
+    """Stream a page, stopping as soon as we have what we need.
+
+    The download is aborted when the body exceeds ``max_bytes``, when the
+    content type is not one of ``content_types`` (videos, PDFs, archives),
+    or, with ``head_only``, once the end of the document head has arrived.
+    ``error_head_only`` applies the head fast path to error pages only.
+    Closing the stream early also frees the pooled connection.
+    """
+    allowed = tuple(content_types)
+    started = time.perf_counter()
+    kwargs = {"headers": headers, "follow_redirects": True}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+
+    async with client.stream("GET", url, **kwargs) as response:
+        chunks = []
+        size = 0
+        truncated = False
+        stopped_at_head = False
+        head_only = head_only or (error_head_only and response.status_code >= 400)
+
+        content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+        if not content_type or content_type in allowed:
+            async for chunk in response.aiter_bytes():
+                if size + len(chunk) > max_bytes:
+                    chunks.append(chunk[:max_bytes - size])
+                    size = max_bytes
+                    truncated = True
+                    break
+                # Look back a few bytes so a marker split across chunks is still found
+                window = (chunks[-1][-8:] if chunks else b"") + chunk
+                chunks.append(chunk)
+                size += len(chunk)
+                if head_only and any(marker in window.lower() for marker in HEAD_END_MARKERS):
+                    stopped_at_head = True
+                    break
+
+        if truncated:
+            print(f"Page fetch capped at {max_bytes} bytes: {url}")
+
+    try:
+        # Set by httpx when the stream closes, including after an early abort
+        elapsed = response.elapsed
+    except RuntimeError:
+        # Transports that hand back an already-read body never set it
+        elapsed = timedelta(seconds=time.perf_counter() - started)
+
+    return FetchedPage(
+        url=str(response.url),
+        status_code=response.status_code,
+        headers=response.headers,
+        content=b"".join(chunks),
+        encoding=response.charset_encoding,
+        elapsed=elapsed,
+        truncated=truncated,
+        head_only=stopped_at_head
+    )
@@ -0,0 +1,160 @@
+import asyncio
+import re
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlparse
+import httpx
+from app.utils.cache import PersistentCache
+
+TEXT_RESOURCE_TYPES = ("script", "stylesheet")
+
+# Text resources below this size gain little from compression
+COMPRESSION_MIN_BYTES = 1024
+
+CONTENT_RANGE_TOTAL = re.compile(r"/(\d+)\s*$")
+
+subresource_cache = PersistentCache("subresource_probe", max_age=24 * 3600)
+
+
+def _content_length(response: httpx.Response) -> Optional[int]:
+    try:
+        return int(response.headers["content-length"])
+    except (KeyError, ValueError):
+        return None
+
+
+async def _timed_request(client: httpx.AsyncClient, method: str, url: str, timeout: float, max_body_bytes: int, **kwargs) -> Dict:
+    """Issue one request and record time to headers plus the transfer size"""
+    started = time.perf_counter()
+    async with client.stream(method, url, follow_redirects=True, timeout=timeout, **kwargs) as response:
+        ttfb = time.perf_counter() - started
+        size = None
+        if response.status_code == 206:
+            match = CONTENT_RANGE_TOTAL.search(response.headers.get("content-range", ""))
+            size = int(match.group(1)) if match else None
+        elif method == "HEAD" or response.status_code >= 400:
+            size = _content_length(response)
+        else:
+            # Server ignored the range: use the declared length or count bytes on the wire
+            size = _content_length(response)
+            if size is None:
+                size = 0
+                async for chunk in response.aiter_raw():
+                    size += len(chunk)
+                    if size >= max_body_bytes:
+                        break
+        return {
+            "status": response.status_code,
+            "ttfb": round(ttfb, 4),
+            "bytes": size,
+            "encoding": response.headers.get("content-encoding", "").lower()
+        }
+
+
+async def probe_resource(client: httpx.AsyncClient, url: str, timeout: float = 10.0, max_body_bytes: int = 5 * 1024 * 1024) -> Dict:
+    """Measure a subresource without downloading it.
+
+    A HEAD request usually carries the transfer size and encoding. Servers
+    that reject HEAD or omit Content-Length get a one-byte ranged GET, whose
+    Content-Range reveals the full size.
+    """
+    result = {"url": url, "method": "HEAD", "status": 0, "ttfb": None, "bytes": None, "encoding": ""}
+    try:
+        result.update(await _timed_request(client, "HEAD", url, timeout, max_body_bytes))
+        if result["status"] in (405, 501) or (result["status"] < 400 and result["bytes"] is None):
+            encoding = result["encoding"]
+            result["method"] = "GET"
+            result.update(await _timed_request(client, "GET", url, timeout, max_body_bytes, headers={"Range": "bytes=0-0"}))
+            # A ranged reply is usually sent without compression; keep what HEAD reported
+            result["encoding"] = result["encoding"] or encoding
+    except httpx.HTTPError as e:
+        result["error"] = type(e).__name__
+    return result
+
+
+def summarize_page_weight(document_bytes: int, resources: List[Dict], skipped: int = 0) -> Dict:
+    """Aggregate subresource probes into page weight and render-blocking counts"""
+    bytes_by_type = {"script": 0, "stylesheet": 0, "image": 0}
+    failed = 0
+    unknown_size = 0
+    compressed = 0
+    uncompressed = 0
+    ttfbs = []
+
+    for resource in resources:
+        probe = resource["probe"]
+        if probe.get("error") or probe["status"] >= 400:
+            failed += 1
+            continue
+        if probe["ttfb"] is not None:
+            ttfbs.append(probe["ttfb"])
+        if probe["bytes"] is None:
+            unknown_size += 1
+            continue
+        bytes_by_type[resource["type"]] = bytes_by_type.get(resource["type"], 0) + probe["bytes"]
+        if resource["type"] in TEXT_RESOURCE_TYPES and probe["bytes"] >= COMPRESSION_MIN_BYTES:
+            if probe["encoding"] and probe["encoding"] != "identity":
+                compressed += 1
+            else:
+                uncompressed += 1
+
+    text_resources = compressed + uncompressed
+    return {
+        "document_bytes": document_bytes,
+        "total_bytes": document_bytes + sum(bytes_by_type.values()),
+        "bytes_by_type": bytes_by_type,
+        "resources_probed": len(resources),
+        "resources_skipped": skipped,
+        "failed": failed,
+        "unknown_size": unknown_size,
+        "render_blocking": sum(1 for resource in resources if resource["render_blocking"]),
+        "compressed_text_resources": compressed,
+        "uncompressed_text_resources": uncompressed,
+        "compression_ratio": round(compressed / text_resources, 2) if text_resources else 1.0,
+        "max_ttfb": max(ttfbs) if ttfbs else None,
+        "avg_ttfb": round(sum(ttfbs) / len(ttfbs), 4) if ttfbs else None,
+        "cache_hits": sum(1 for resource in resources if resource["cached"])
+    }
+
+
+async def measure_page_weight(
+    client: httpx.AsyncClient,
+    page_url: str,
+    resources: List[Dict],
+    document_bytes: int,
+    concurrency: int = 6,
+    max_resources: int = 40,
+    cache: Optional[PersistentCache] = None
+) -> Dict:
+    """Probe a page's scripts, stylesheets and images concurrently.
+
+    ``resources`` are the entries collected by ``analyze_html``. Relative
+    URLs are resolved against the final page URL and duplicates are probed
+    once. Successful probes are cached per resource URL, so shared CDN
+    assets (jQuery, Bootstrap, fonts) are measured once across candidates.
+    """
+    unique: Dict[str, Dict] = {}
+    for resource in resources:
+        url = urljoin(page_url, resource["url"])
+        if urlparse(url).scheme not in ("http", "https"):
+            continue
+        if url in unique:
+            unique[url]["render_blocking"] = unique[url]["render_blocking"] or resource["render_blocking"]
+        else:
+            unique[url] = {"type": resource["type"], "url": url, "render_blocking": resource["render_blocking"]}
+
+    selected = list(unique.values())[:max_resources]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def probe(resource: Dict) -> Dict:
+        cached = cache.get(resource["url"]) if cache else None
+        if cached is not None:
+            return {**resource, "probe": cached, "cached": True}
+        async with semaphore:
+            result = await probe_resource(client, resource["url"])
+        if cache and not result.get("error") and result["status"] < 400:
+            cache.set(resource["url"], result)
+        return {**resource, "probe": result, "cached": False}
+
+    probed = await asyncio.gather(*[probe(resource) for resource in selected])
+    return summarize_page_weight(document_bytes, probed, skipped=len(unique) - len(selected))
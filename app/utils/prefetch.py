@@ -0,0 +1,161 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Returned by ``PrefetchCache.get`` when there is nothing usable to reuse
+MISS = object()
+
+PrefetchKey = Tuple[str, str]
+
+
+def prefetch_key(platform: str, identifier: str) -> PrefetchKey:
+    return platform, identifier.strip().lstrip("@").lower()
+
+
+def project_prefetch_key(url: str) -> PrefetchKey:
+    # URL paths are case-sensitive, so only the cosmetic differences are folded
+    from app.utils.cache import normalize_url
+    return "project", normalize_url(url)
+
+
+class PrefetchCache:
+    """Short-lived, in-memory results of speculative fetches started at upload.
+
+    Entries are tasks keyed by (platform, identifier), so a platform stage
+    arriving while a prefetch is still running joins it instead of starting
+    its own. Only domain-independent collection (API calls, feeds, pages)
+    is prefetched; model calls wait for the real analysis. Entries older
+    than ``ttl`` are dropped on the next access and never awaited, so an
+    upload that is never analyzed costs nothing beyond its requests.
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 200):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.metrics = {"started": 0, "used": 0, "expired": 0, "failed": 0, "skipped": 0}
+        self._entries: Dict[PrefetchKey, Tuple[asyncio.Task, float]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def from_settings(cls) -> "PrefetchCache":
+        from config.settings import settings
+        config = settings.get_prefetch_config()
+        return cls(ttl=config["ttl"], max_entries=config["max_entries"])
+
+    def _sweep(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Tasks belong to the loop that created them
+            self._entries = {}
+            self._loop = loop
+        now = time.monotonic()
+        for key, (task, started_at) in list(self._entries.items()):
+            if now - started_at >= self.ttl:
+                del self._entries[key]
+                task.cancel()
+                self.metrics["expired"] += 1
+
+    def start(self, key: PrefetchKey, fetch: Callable[[], Awaitable[Any]]) -> bool:
+        """Schedule ``fetch`` under ``key``; returns False if already running or full"""
+        self._sweep()
+        if key in self._entries or len(self._entries) >= self.max_entries:
+            self.metrics["skipped"] += 1
+            return False
+        task = asyncio.create_task(fetch())
+        task.add_done_callback(self._record_failure)
+        self._entries[key] = (task, time.monotonic())
+        self.metrics["started"] += 1
+        return True
+
+    def invalidate(self, key: PrefetchKey) -> bool:
+        """Drop and cancel the prefetch under ``key``; returns whether there was one"""
+        self._sweep()
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry[0].cancel()
+        return True
+
+    def _record_failure(self, task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            self.metrics["failed"] += 1
+
+    async def get(self, key: PrefetchKey) -> Any:
+        """Result of a fresh prefetch (awaiting it if still running), else ``MISS``"""
+        self._sweep()
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISS
+        task = entry[0]
+        try:
+            # A stage giving up must not cancel the fetch for other consumers
+            result = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled():
+                return MISS
+            raise
+        except Exception:
+            # The stage fetches again itself and reports the error its own way
+            self._entries.pop(key, None)
+            return MISS
+        self.metrics["used"] += 1
+        return result
+
+    def get_metrics(self) -> Dict:
+        return {**self.metrics, "entries": len(self._entries)}
+
+
+profile_prefetch = PrefetchCache.from_settings()
+
+
+def prefetch_resume_profiles(
+    social_profiles: List[Dict],
+    projects: Optional[List[Dict]] = None,
+    cache: Optional[PrefetchCache] = None
+) -> List[PrefetchKey]:
+    """Start background collection for the profiles and project links on a parsed resume.
+
+    ``social_profiles`` are ``{"platform", "url"}`` dicts and ``projects``
+    ``{"name", "url", ...}`` dicts as produced by the resume parser. Project
+    links are fetched and parsed only; their complexity model call waits for
+    the analysis. Returns the keys that were newly scheduled.
+    """
+    from app.models.schemas import Platform, SocialProfile
+    from app.services.github_service import GitHubService, parse_repository_url
+    from app.services.medium_service import MediumService
+    from app.services.project_service import ProjectService
+    from app.services.twitter_service import TwitterService
+    from app.utils.snapshot_store import profile_username
+
+    cache = cache or profile_prefetch
+    collectors = {
+        Platform.GITHUB: lambda: GitHubService().collect_profile,
+        Platform.TWITTER: lambda: TwitterService().collect_profile,
+        Platform.MEDIUM: lambda: MediumService().collect_profile
+    }
+    scheduled = []
+    seen_platforms = set()
+    for item in social_profiles or []:
+        try:
+            profile = SocialProfile(platform=item.get("platform"), url=item.get("url"))
+        except Exception:
+            continue
+        # Platform stages analyze the first profile listed for each platform
+        if profile.platform not in collectors or profile.platform in seen_platforms:
+            continue
+        if profile.platform == Platform.GITHUB and parse_repository_url(str(profile.url)):
+            # A repository link names its owner's repo, not a profile to collect
+            continue
+        seen_platforms.add(profile.platform)
+        username = profile_username(profile)
+        key = prefetch_key(profile.platform.value, username)
+        if username and cache.start(key, lambda collect=collectors[profile.platform](), username=username: collect(username)):
+            scheduled.append(key)
+
+    for project in projects or []:
+        if not isinstance(project, dict) or not project.get("url"):
+            continue
+        key = project_prefetch_key(project["url"])
+        if cache.start(key, lambda url=project["url"]: ProjectService().collect_project(url)):
+            scheduled.append(key)
+    return scheduled
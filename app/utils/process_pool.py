@@ -0,0 +1,104 @@
+import asyncio
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Set
+
+# Separate pools so one kind of work (e.g. a pathological upload) cannot starve another
+_executors: Dict[str, ProcessPoolExecutor] = {}
+# Unfinished jobs per executor, and the stuck ones of executors waiting to be terminated
+_in_flight: Dict[ProcessPoolExecutor, Set[Future]] = {}
+_retiring: Dict[ProcessPoolExecutor, Set[Future]] = {}
+_metrics = {"timeouts": 0, "recycled": 0, "broken": 0}
+
+def get_process_pool(pool: str = "default") -> ProcessPoolExecutor:
+    """Shared pool for CPU-bound work that must not block the event loop"""
+    if pool not in _executors:
+        from config.settings import settings
+        config = settings.get_process_pool_config()
+        max_workers = config["document_workers"] if pool == "documents" else config["max_workers"]
+        _executors[pool] = ProcessPoolExecutor(max_workers=max_workers)
+    return _executors[pool]
+
+async def run_in_process(func: Callable, *args, pool: str = "default", timeout: Optional[float] = None) -> Any:
+    """Run a picklable top-level function in a shared process pool.
+
+    If a worker dies (segfault, OOM kill) the executor is broken for good:
+    it is replaced and the call retried once on the new pool.
+
+    On ``timeout`` the call raises ``asyncio.TimeoutError``. A job still
+    queued is cancelled; one already running cannot be interrupted, so new
+    work goes to a fresh pool and the old one is terminated once its other
+    jobs have finished. Until then the stuck job holds one worker of the
+    old pool, so jobs queued behind it on a single-worker pool only move
+    on when they time out themselves.
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in (1, 2):
+        executor = get_process_pool(pool)
+        try:
+            future = executor.submit(func, *args)
+            _track(executor, future, loop)
+            return await asyncio.wait_for(asyncio.wrap_future(future, loop=loop), timeout)
+        except BrokenProcessPool:
+            _metrics["broken"] += 1
+            _drop_pool(pool, executor)
+            if attempt == 2:
+                raise
+        except asyncio.TimeoutError:
+            _metrics["timeouts"] += 1
+            if not future.cancel():
+                _retire_pool(pool, executor, future)
+            raise
+
+def _track(executor: ProcessPoolExecutor, future: Future, loop: asyncio.AbstractEventLoop):
+    jobs = _in_flight.setdefault(executor, set())
+    jobs.add(future)
+
+    def finished(done: Future):
+        jobs.discard(done)
+        if executor in _retiring and not loop.is_closed():
+            # Done callbacks run on the executor's management thread
+            loop.call_soon_threadsafe(_terminate_when_idle, executor)
+
+    future.add_done_callback(finished)
+
+def _drop_pool(pool: str, executor: ProcessPoolExecutor):
+    if _executors.get(pool) is executor:
+        del _executors[pool]
+    _in_flight.pop(executor, None)
+    _retiring.pop(executor, None)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def _retire_pool(pool: str, executor: ProcessPoolExecutor, stuck: Future):
+    if _executors.get(pool) is executor:
+        del _executors[pool]
+    _retiring.setdefault(executor, set()).add(stuck)
+    _terminate_when_idle(executor)
+
+def _terminate_when_idle(executor: ProcessPoolExecutor):
+    stuck = _retiring.get(executor)
+    if stuck is None or _in_flight.get(executor, set()) - stuck:
+        return
+    del _retiring[executor]
+    _in_flight.pop(executor, None)
+    _terminate(executor)
+    _metrics["recycled"] += 1
+
+def _terminate(executor: ProcessPoolExecutor):
+    # Snapshot before shutdown, which clears the process table
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+def get_process_pool_metrics() -> Dict:
+    return {**_metrics, "pools": sorted(_executors), "retiring": len(_retiring)}
+
+def shutdown_process_pool():
+    for executor in _executors.values():
+        executor.shutdown(wait=False, cancel_futures=True)
+    for executor in list(_retiring):
+        _terminate(executor)
+    _executors.clear()
+    _in_flight.clear()
+    _retiring.clear()
@@ -0,0 +1,320 @@
+import asyncio
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Dict
+from uuid import UUID
+import httpx
+from langchain_core.callbacks import AsyncCallbackHandler
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Upstream trouble worth retrying and counting against the circuit; 429 is left to the callers' rate limiting
+RETRY_STATUSES = {500, 502, 503, 504}
+
+# Circuit key for model calls made through langchain
+LLM_HOST = "api.openai.com"
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request while the host's circuit is open"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"Circuit open for {host}; retry in {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for one upstream host.
+
+    ``failure_threshold`` consecutive failures open the circuit for
+    ``open_seconds``. Afterwards up to ``half_open_max`` trial calls are let
+    through: a success closes the circuit, a failure opens it again.
+    """
+
+    def __init__(self, host: str, failure_threshold: int = 5, open_seconds: float = 30.0, half_open_max: int = 1):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.half_open_max = half_open_max
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.consecutive_failures = 0
+        self.trials = 0
+        self.calls = 0
+        self.failures = 0
+        self.fast_failed = 0
+        self.opened = 0
+
+    def before_call(self):
+        """Admit a call or raise ``CircuitOpenError``"""
+        if self.state == OPEN:
+            retry_in = self.opened_at + self.open_seconds - time.time()
+            if retry_in > 0:
+                self.fast_failed += 1
+                raise CircuitOpenError(self.host, retry_in)
+            self.state = HALF_OPEN
+            self.trials = 0
+        if self.state == HALF_OPEN:
+            if self.trials >= self.half_open_max:
+                self.fast_failed += 1
+                raise CircuitOpenError(self.host, 0)
+            self.trials += 1
+        self.calls += 1
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        if self.state == HALF_OPEN:
+            self.state = CLOSED
+            self.trials = 0
+
+    def record_failure(self):
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.opened += 1
+            self.state = OPEN
+            self.opened_at = time.time()
+
+    def release(self):
+        """Forget an admitted call that ended without an outcome (cancelled)"""
+        if self.state == HALF_OPEN and self.trials > 0:
+            self.trials -= 1
+
+
+class RetryBudget:
+    """Token bucket limiting retries to a share of the traffic to a host.
+
+    Every call deposits ``ratio`` tokens and every retry spends one, so
+    retries cannot multiply load on a struggling upstream. ``min_per_second``
+    keeps a trickle of retries available for hosts with little traffic.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, capacity: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self.balance = capacity
+        self.updated_at = time.monotonic()
+        self.retries = 0
+        self.denied = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.balance = min(self.capacity, self.balance + (now - self.updated_at) * self.min_per_second)
+        self.updated_at = now
+
+    def deposit(self):
+        self._refill()
+        self.balance = min(self.capacity, self.balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        self._refill()
+        if self.balance >= 1:
+            self.balance -= 1
+            self.retries += 1
+            return True
+        self.denied += 1
+        return False
+
+
+class ResilienceRegistry:
+    """Circuit breaker and retry budget per upstream host, shared by all callers.
+
+    Candidate portfolios add a host per resume, so past ``max_hosts`` the
+    least recently used hosts whose circuit is closed and healthy (or whose
+    open window has long passed) are forgotten.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        open_seconds: float = 30.0,
+        half_open_max: int = 1,
+        max_retries: int = 2,
+        retry_ratio: float = 0.2,
+        retry_min_per_second: float = 1.0,
+        backoff_base: float = 0.2,
+        backoff_max: float = 2.0,
+        max_hosts: int = 1000
+    ):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.half_open_max = half_open_max
+        self.max_retries = max_retries
+        self.retry_ratio = retry_ratio
+        self.retry_min_per_second = retry_min_per_second
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_hosts = max_hosts
+        self.breakers: "OrderedDict[str, CircuitBreaker]" = OrderedDict()
+        self.budgets: Dict[str, RetryBudget] = {}
+        self.evicted = 0
+
+    @classmethod
+    def from_settings(cls) -> "ResilienceRegistry":
+        from config.settings import settings
+        return cls(**settings.get_resilience_config())
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        breaker = self.breakers.get(host)
+        if breaker is None:
+            breaker = self.breakers[host] = CircuitBreaker(host, self.failure_threshold, self.open_seconds, self.half_open_max)
+            self._evict_idle()
+        else:
+            self.breakers.move_to_end(host)
+        return breaker
+
+    def _evict_idle(self):
+        excess = len(self.breakers) - self.max_hosts
+        if excess <= 0:
+            return
+        now = time.time()
+        # Oldest first; the host just added stays
+        for host in list(self.breakers)[:-1]:
+            breaker = self.breakers[host]
+            closed = breaker.state == CLOSED and breaker.consecutive_failures == 0
+            expired = breaker.state == OPEN and now - breaker.opened_at > 2 * breaker.open_seconds
+            if closed or expired:
+                del self.breakers[host]
+                self.budgets.pop(host, None)
+                self.evicted += 1
+                excess -= 1
+                if excess == 0:
+                    return
+
+    def budget(self, host: str) -> RetryBudget:
+        if host not in self.budgets:
+            self.budgets[host] = RetryBudget(self.retry_ratio, self.retry_min_per_second)
+        return self.budgets[host]
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before retry ``attempt`` (1-based)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def open_circuits(self) -> Dict[str, float]:
+        now = time.time()
+        return {
+            host: round(max(0.0, breaker.opened_at + breaker.open_seconds - now), 1)
+            for host, breaker in self.breakers.items()
+            if breaker.state == OPEN
+        }
+
+    def _host_metrics(self, host: str, breaker: CircuitBreaker) -> Dict:
+        budget = self.budgets.get(host)
+        return {
+            "state": breaker.state,
+            "calls": breaker.calls,
+            "failures": breaker.failures,
+            "consecutive_failures": breaker.consecutive_failures,
+            "opened": breaker.opened,
+            "fast_failed": breaker.fast_failed,
+            "retries": budget.retries if budget else 0,
+            "retries_denied": budget.denied if budget else 0
+        }
+
+    def get_metrics(self) -> Dict:
+        return {host: self._host_metrics(host, breaker) for host, breaker in self.breakers.items()}
+
+    def get_summary(self) -> Dict:
+        """Host counts and only the circuits that are not closed, for the health check"""
+        return {
+            "hosts": len(self.breakers),
+            "evicted": self.evicted,
+            "not_closed": {
+                host: self._host_metrics(host, breaker)
+                for host, breaker in self.breakers.items()
+                if breaker.state != CLOSED
+            }
+        }
+
+
+class ResilientTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper applying the host's circuit breaker and retry budget.
+
+    Requests to an open circuit fail immediately with ``CircuitOpenError``.
+    Idempotent requests that hit a transport error or a 5xx are retried with
+    jittered backoff while the host's retry budget allows. Timeouts count
+    against the breaker but are not retried: the caller has already waited
+    out its full timeout once.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, registry: "ResilienceRegistry"):
+        self._transport = transport
+        self._registry = registry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        breaker = self._registry.breaker(host)
+        budget = self._registry.budget(host)
+        retryable = request.method in IDEMPOTENT_METHODS
+        budget.deposit()
+        attempt = 0
+
+        while True:
+            breaker.before_call()
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                breaker.record_failure()
+                if isinstance(e, httpx.TimeoutException):
+                    raise
+                if not (retryable and attempt < self._registry.max_retries and budget.withdraw()):
+                    raise
+            except BaseException:
+                breaker.release()
+                raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                if not (retryable and attempt < self._registry.max_retries and budget.withdraw()):
+                    return response
+                await response.aclose()
+            attempt += 1
+            await asyncio.sleep(self._registry.backoff(attempt))
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class LLMCircuitCallback(AsyncCallbackHandler):
+    """Applies the model endpoint's circuit breaker to langchain chat calls.
+
+    ``raise_error`` makes the ``CircuitOpenError`` raised on start abort the
+    call before any request is sent. Retries stay with the OpenAI client.
+    """
+
+    raise_error = True
+
+    def __init__(self, registry: "ResilienceRegistry", host: str = LLM_HOST):
+        self.registry = registry
+        self.host = host
+
+    async def on_chat_model_start(self, serialized: Dict[str, Any], messages: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self.registry.breaker(self.host).before_call()
+
+    async def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self.registry.breaker(self.host).record_success()
+
+    async def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        import openai
+        breaker = self.registry.breaker(self.host)
+        if isinstance(error, (openai.APIConnectionError, openai.InternalServerError, httpx.TransportError)):
+            breaker.record_failure()
+        elif isinstance(error, asyncio.CancelledError):
+            breaker.release()
+        else:
+            # Bad requests and refusals mean the endpoint itself is up
+            breaker.record_success()
+
+
+resilience = ResilienceRegistry.from_settings()
+llm_circuit_breaker = LLMCircuitCallback(resilience)
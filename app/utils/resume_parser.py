@@ -1,39 +1,142 @@
 import io
 import re
-from typing import Dict, List, Any
+from contextlib import closing, contextmanager
+from typing import BinaryIO, Dict, Iterator, List, Any, Optional, Tuple, Union
 from langchain_openai import ChatOpenAI
+from app.utils.resilience import llm_circuit_breaker
 from langchain.schema import HumanMessage, SystemMessage
 import json
 
-def parse_pdf_resume(content: bytes) -> str:
-    """Parse PDF resume content and extract text"""
-    try:
-        import PyPDF2
-        pdf_file = io.BytesIO(content)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        
-        return text.strip()
-    except ImportError:
-        # Fallback if PyPDF2 is not available
+@contextmanager
+def open_document(source: Union[bytes, bytearray, str]) -> Iterator[BinaryIO]:
+    """Binary stream over upload bytes, or over a document's file path"""
+    if isinstance(source, str):
+        with open(source, "rb") as handle:
+            yield handle
+    else:
+        yield io.BytesIO(source)
+
+# Glyph ids pdfminer emits for fonts without a usable character map
+CID_PATTERN = re.compile(r"\(cid:\d+\)")
+# Longer tokens that are not links are usually words run together by the extractor
+GLUED_TOKEN_LENGTH = 25
+
+def score_text_quality(text: str) -> float:
+    """0-1 plausibility of extracted page text: readable characters in space-separated words"""
+    text = text.strip()
+    if not text:
+        return 0.0
+    unreadable = sum(len(match) for match in CID_PATTERN.findall(text)) + text.count("\ufffd")
+    glued = sum(
+        len(token) for token in text.split()
+        if len(token) > GLUED_TOKEN_LENGTH and not any(mark in token for mark in ("/", "@", "."))
+    )
+    controls = sum(1 for char in text if not char.isprintable() and not char.isspace())
+    return max(0.0, 1.0 - (unreadable + glued + controls) / len(text))
+
+def _pypdf2_pages(content: Union[bytes, bytearray, str]) -> Iterator[str]:
+    import PyPDF2
+    with open_document(content) as pdf_file:
+        for page in PyPDF2.PdfReader(pdf_file).pages:
+            yield page.extract_text() or ""
+
+def _pdfplumber_pages(content: Union[bytes, bytearray, str]) -> Iterator[str]:
+    import pdfplumber
+    with open_document(content) as pdf_file, pdfplumber.open(pdf_file) as pdf:
+        for page in pdf.pages:
+            yield page.extract_text() or ""
+            # Layout objects are cached per page until closed
+            page.close()
+
+# Cheapest first: the probe stops at the first extractor whose first page reads well
+PDF_EXTRACTORS = {"pypdf2": _pypdf2_pages, "pdfplumber": _pdfplumber_pages}
+
+def available_pdf_extractors() -> List[str]:
+    available = []
+    for name, module in (("pypdf2", "PyPDF2"), ("pdfplumber", "pdfplumber")):
         try:
-            import pdfplumber
-            with pdfplumber.open(io.BytesIO(content)) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
+            __import__(module)
+            available.append(name)
         except ImportError:
-            raise Exception("PDF parsing libraries not available. Please install PyPDF2 or pdfplumber.")
+            pass
+    return available
+
+def select_pdf_extractor(content: Union[bytes, bytearray, str], extractors: Optional[List[str]] = None) -> Tuple[str, Iterator[str]]:
+    """Pick the extractor for this document from the quality of its first page.
+
+    Returns the extractor name and an iterator over all page texts; the
+    probed first page is not extracted twice.
+    """
+    from config.settings import settings
+    threshold = settings.get_resume_parser_config()["pdf_quality_threshold"]
+    extractors = extractors or available_pdf_extractors()
+    if not extractors:
+        raise Exception("PDF parsing libraries not available. Please install PyPDF2 or pdfplumber.")
+    
+    best = None
+    error = None
+    for name in extractors:
+        pages = PDF_EXTRACTORS[name](content)
+        try:
+            first_page = next(pages, "")
+        except Exception as e:
+            # A malformed file one library rejects may still open in the other
+            pages.close()
+            error = e
+            continue
+        quality = score_text_quality(first_page)
+        if best is None or quality > best[0]:
+            if best is not None:
+                best[3].close()
+            best = (quality, name, first_page, pages)
+        else:
+            pages.close()
+        if quality >= threshold:
+            break
+    if best is None:
+        raise error
+    
+    _, name, first_page, pages = best
+    
+    def chosen_pages() -> Iterator[str]:
+        with closing(pages):
+            yield first_page
+            yield from pages
+    return name, chosen_pages()
+
+def iter_pdf_pages(content: Union[bytes, bytearray, str]) -> Iterator[str]:
+    """Page texts of a PDF, one page at a time, from the extractor that reads it best"""
+    _, pages = select_pdf_extractor(content)
+    with closing(pages):
+        yield from pages
+
+def parse_pdf_resume(content: Union[bytes, bytearray, str], char_budget: Optional[int] = None) -> str:
+    """Parse PDF resume content (bytes or a file path) and extract text.
+
+    Pages are extracted one at a time and extraction stops after the page
+    that reaches ``char_budget`` characters; what follows on long resumes is
+    usually appendices.
+    """
+    if char_budget is None:
+        from config.settings import settings
+        char_budget = settings.get_resume_parser_config()["pdf_char_budget"]
+    
+    texts = []
+    total = 0
+    with closing(iter_pdf_pages(content)) as pages:
+        for text in pages:
+            texts.append(text)
+            total += len(text)
+            if total >= char_budget:
+                break
+    return "\n".join(texts).strip()
 
-def parse_docx_resume(content: bytes) -> str:
-    """Parse DOCX resume content and extract text"""
+def parse_docx_resume(content: Union[bytes, bytearray, str]) -> str:
+    """Parse DOCX resume content (bytes or a file path) and extract text"""
     try:
         from docx import Document
-        doc = Document(io.BytesIO(content))
+        with open_document(content) as docx_file:
+            doc = Document(docx_file)
         
         text = ""
         for paragraph in doc.paragraphs:
@@ -46,7 +149,7 @@ def parse_docx_resume(content: bytes) -> str:
 async def extract_resume_data(resume_text: str) -> Dict[str, Any]:
     """Extract structured data from resume text using AI"""
     from config.settings import settings
-    llm = ChatOpenAI(model=settings.get_model(), temperature=0.1)
+    llm = ChatOpenAI(model=settings.get_model(), temperature=0.1, callbacks=[llm_circuit_breaker])
     
     system_message = SystemMessage(content="""You are an expert resume parser. Extract structured information from resume text and return it as valid JSON.
 
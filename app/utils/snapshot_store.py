@@ -0,0 +1,102 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+from pydantic import BaseModel
+from app.models.schemas import Platform, SocialProfile
+from app.utils.cache import PersistentCache
+
+SNAPSHOT_PLATFORMS = (Platform.GITHUB, Platform.TWITTER, Platform.MEDIUM)
+
+AnalysisModel = TypeVar("AnalysisModel", bound=BaseModel)
+
+
+def profile_username(profile: SocialProfile) -> str:
+    """Username from a social profile link, as the platform stages use it"""
+    url = str(profile.url).split("?")[0].rstrip("/")
+    if profile.platform == Platform.MEDIUM and "@" in url:
+        return url.split("@")[-1]
+    return url.split("/")[-1]
+
+
+class PlatformSnapshotStore:
+    """Platform analyses shared across analyses, keyed by (platform, username).
+
+    Each profile entry holds one result per job domain (the domain changes
+    the relevance score), each with its own fetch time checked against the
+    platform's freshness TTL. Concurrent requests for the same profile and
+    domain share one in-flight fetch. Results carrying an
+    ``unavailable_reason`` are returned but never stored.
+    """
+
+    def __init__(self, cache: PersistentCache, ttls: Dict[str, float]):
+        self.cache = cache
+        self.ttls = ttls
+        self.metrics = {"hits": 0, "misses": 0, "coalesced": 0, "refreshed": 0}
+        self._in_flight: Dict[Tuple[str, str, str], asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def from_settings(cls) -> "PlatformSnapshotStore":
+        from config.settings import settings
+        ttls = settings.get_snapshot_config()
+        return cls(PersistentCache("platform_snapshots", max_age=max(ttls.values())), ttls)
+
+    @staticmethod
+    def _key(platform: str, username: str) -> str:
+        return f"{platform}:{username.strip().lstrip('@').lower()}"
+
+    async def get_or_fetch(
+        self,
+        platform: str,
+        username: str,
+        domain: str,
+        fetch: Callable[[], Awaitable[AnalysisModel]],
+        model: Type[AnalysisModel]
+    ) -> AnalysisModel:
+        key = self._key(platform, username)
+        domain_key = domain.strip().lower()
+        entry = self.cache.get(key) or {}
+        snapshot = entry.get(domain_key)
+        if snapshot and time.time() - snapshot["fetched_at"] < self.ttls.get(platform, 0):
+            self.metrics["hits"] += 1
+            return model(**snapshot["analysis"])
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # In-flight tasks belong to the loop that created them
+            self._in_flight = {}
+            self._loop = loop
+        flight_key = (platform, key, domain_key)
+        task = self._in_flight.get(flight_key)
+        if task is not None:
+            self.metrics["coalesced"] += 1
+        else:
+            self.metrics["misses"] += 1
+            task = asyncio.create_task(self._fetch_and_store(key, domain_key, fetch))
+            self._in_flight[flight_key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(flight_key, None))
+        # One caller giving up must not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(self, key: str, domain_key: str, fetch: Callable[[], Awaitable[AnalysisModel]]) -> AnalysisModel:
+        analysis = await fetch()
+        if analysis is not None and not getattr(analysis, "unavailable_reason", None):
+            entry = self.cache.get(key) or {}
+            entry[domain_key] = {"analysis": analysis.model_dump(mode="json"), "fetched_at": time.time()}
+            self.cache.set(key, entry)
+        return analysis
+
+    def invalidate(self, platform: str, username: str) -> bool:
+        """Drop every snapshot of one profile; returns True if there was one"""
+        key = self._key(platform, username)
+        existed = self.cache.get(key) is not None
+        self.cache.delete(key)
+        if existed:
+            self.metrics["refreshed"] += 1
+        return existed
+
+    def get_metrics(self) -> Dict:
+        return {**self.metrics, "in_flight": len(self._in_flight)}
+
+
+platform_snapshots = PlatformSnapshotStore.from_settings()
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from typing import Dict, List, Optional
+import httpx
+
+
+class TokenState:
+    """Rate-limit budget of one API token as last reported by the server"""
+
+    def __init__(self, token: str, limit: int):
+        self.token = token
+        self.limit = limit
+        self.remaining = limit
+        self.reset_at = 0.0
+        self.blocked_until = 0.0
+        self.in_flight = 0
+        self.requests = 0
+        self.rate_limited = 0
+
+    def available(self, now: float) -> int:
+        if now < self.blocked_until:
+            return 0
+        if self.reset_at and now >= self.reset_at:
+            # Window rolled over since the last response
+            self.remaining = self.limit
+            self.reset_at = 0.0
+        return self.remaining - self.in_flight
+
+
+class TokenPool:
+    """Routes each request to the token with the most remaining quota.
+
+    Budgets are updated from ``X-RateLimit-*`` headers. When every token is
+    down to its reserve, callers wait for the earliest reset (up to
+    ``max_wait`` seconds) instead of burning a request on a 403.
+    """
+
+    def __init__(self, tokens: List[str], reserve: int = 5, max_wait: float = 60.0):
+        # An empty token stands for unauthenticated access (60 requests/hour)
+        self.tokens = [TokenState(token, 5000 if token else 60) for token in (tokens or [""])]
+        self.reserve = reserve
+        self.max_wait = max_wait
+
+    @classmethod
+    def from_settings(cls) -> "TokenPool":
+        from config.settings import settings
+        config = settings.get_github_config()
+        return cls(config["tokens"], reserve=config["token_reserve"], max_wait=config["token_max_wait"])
+
+    def _best(self, now: float) -> TokenState:
+        return max(self.tokens, key=lambda state: state.available(now))
+
+    async def acquire(self) -> TokenState:
+        deadline = time.time() + self.max_wait
+        while True:
+            now = time.time()
+            best = self._best(now)
+            if best.available(now) > self.reserve or now >= deadline:
+                best.in_flight += 1
+                best.requests += 1
+                return best
+
+            resume_at = min(max(state.reset_at, state.blocked_until) for state in self.tokens)
+            wait = min(resume_at, deadline) - now
+            await asyncio.sleep(wait if wait > 0 else 1.0)
+
+    def release(self, state: TokenState, response: Optional[httpx.Response] = None) -> bool:
+        """Record the outcome of a request; returns True if it was rate limited"""
+        state.in_flight = max(0, state.in_flight - 1)
+        if response is None:
+            return False
+
+        headers = response.headers
+        try:
+            if "x-ratelimit-limit" in headers:
+                state.limit = int(headers["x-ratelimit-limit"])
+            if "x-ratelimit-remaining" in headers:
+                state.remaining = int(headers["x-ratelimit-remaining"])
+            if "x-ratelimit-reset" in headers:
+                state.reset_at = float(headers["x-ratelimit-reset"])
+        except ValueError:
+            pass
+
+        if response.status_code in (403, 429) and (state.remaining == 0 or "retry-after" in headers):
+            state.rate_limited += 1
+            if "retry-after" in headers:
+                try:
+                    state.blocked_until = time.time() + float(headers["retry-after"])
+                except ValueError:
+                    state.blocked_until = time.time() + 60
+            return True
+        return False
+
+    def get_metrics(self) -> List[Dict]:
+        now = time.time()
+        return [
+            {
+                "token": f"...{state.token[-4:]}" if state.token else "anonymous",
+                "limit": state.limit,
+                "remaining": state.remaining,
+                "reset_in": max(0, int(state.reset_at - now)) if state.reset_at else None,
+                "in_flight": state.in_flight,
+                "requests": state.requests,
+                "rate_limited": state.rate_limited
+            }
+            for state in self.tokens
+        ]
+
+
+github_token_pool = TokenPool.from_settings()
@@ -0,0 +1,81 @@
+from typing import Optional, Set
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+
+# Leading bytes of the document formats the resume parser understands
+PDF_MAGIC = b"%PDF-"
+ZIP_MAGIC = b"PK\x03\x04"
+OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+SNIFF_BYTES = 8192
+# Room for multipart boundaries and part headers around the file itself
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadTooLarge(ValueError):
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Upload exceeds the {round(max_bytes / (1024 * 1024), 1):g} MB limit")
+        self.max_bytes = max_bytes
+
+
+def sniff_document_type(head: bytes) -> Optional[str]:
+    """Document type from the first bytes of a file: pdf, docx, doc, txt or None"""
+    if head.lstrip(b"\x00\t\n\r ").startswith(PDF_MAGIC):
+        return "pdf"
+    if head.startswith(ZIP_MAGIC):
+        # Office Open XML packages start with [Content_Types].xml or word/ entries
+        return "docx" if b"word/" in head or b"[Content_Types].xml" in head else None
+    if head.startswith(OLE_MAGIC):
+        return "doc"
+    if b"\x00" in head:
+        return None
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # The sniff window may cut a multi-byte character in half
+        if e.start < len(head) - 3:
+            return None
+    return "txt"
+
+
+class UploadLimitMiddleware:
+    """Caps the request body of upload endpoints while it is received.
+
+    Starlette's multipart parser spools the whole file part before the
+    endpoint runs, so the limit has to hold at the ASGI ``receive`` stream:
+    a declared Content-Length over it is refused without reading, and a
+    body sent without one (chunked) fails with 413 at the first message
+    past it. The endpoint still checks the size of the file part itself.
+    """
+
+    def __init__(self, app, paths: Set[str], max_bytes: Optional[int] = None):
+        self.app = app
+        self.paths = paths
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+        max_bytes = self.max_bytes
+        if max_bytes is None:
+            from config.settings import settings
+            max_bytes = settings.get_upload_config()["max_bytes"]
+        limit = max_bytes + MULTIPART_OVERHEAD
+        declared = dict(scope["headers"]).get(b"content-length", b"")
+        if declared.isdigit() and int(declared) > limit:
+            response = JSONResponse(status_code=413, content={"detail": str(UploadTooLarge(max_bytes))})
+            await response(scope, receive, send)
+            return
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Re-raised as is by FastAPI's body parsing and rendered by its exception handler
+                    raise HTTPException(status_code=413, detail=str(UploadTooLarge(max_bytes)))
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,264 @@
+"""Benchmark the single-pass lxml page analyzer against the BeautifulSoup sweeps.
+
+The legacy class below is the ProjectService heuristics as they were before
+the switch (minus the LLM call): one html.parser tree plus a separate
+find_all sweep per heuristic and a full str(soup) re-serialization.
+
+Run from the repository root:
+
+    python benchmarks/bench_html_analyzer.py [--sections 400] [--repeat 5]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Dict, List
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from app.services.project_service import ProjectService
+from app.utils.html_analyzer import analyze_html
+
+
+class LegacyPageHeuristics:
+    def _detect_technologies(self, soup: BeautifulSoup, html_content: str) -> List[str]:
+        technologies = []
+
+        script_tags = soup.find_all('script', src=True)
+        for script in script_tags:
+            src = script.get('src', '').lower()
+            if 'react' in src:
+                technologies.append('React')
+            elif 'angular' in src:
+                technologies.append('Angular')
+            elif 'vue' in src:
+                technologies.append('Vue.js')
+            elif 'jquery' in src:
+                technologies.append('jQuery')
+            elif 'bootstrap' in src:
+                technologies.append('Bootstrap')
+
+        if 'next.js' in html_content.lower() or '_next' in html_content:
+            technologies.append('Next.js')
+        if 'nuxt' in html_content.lower():
+            technologies.append('Nuxt.js')
+        if 'tailwind' in html_content.lower():
+            technologies.append('TailwindCSS')
+
+        meta_generator = soup.find('meta', attrs={'name': 'generator'})
+        if meta_generator:
+            generator = meta_generator.get('content', '').lower()
+            if 'wordpress' in generator:
+                technologies.append('WordPress')
+            elif 'django' in generator:
+                technologies.append('Django')
+            elif 'flask' in generator:
+                technologies.append('Flask')
+
+        return list(set(technologies))
+
+    def _check_responsiveness(self, soup: BeautifulSoup) -> float:
+        score = 0.0
+
+        viewport_meta = soup.find('meta', attrs={'name': 'viewport'})
+        if viewport_meta:
+            score += 30
+
+        media_queries = soup.find_all('style')
+        for style in media_queries:
+            if '@media' in style.get_text():
+                score += 20
+                break
+
+        responsive_classes = ['responsive', 'mobile', 'tablet', 'desktop', 'col-', 'row-']
+        html_content = str(soup).lower()
+        for cls in responsive_classes:
+            if cls in html_content:
+                score += 10
+                break
+
+        if soup.find_all('img', {'class': lambda x: x and 'responsive' in x}):
+            score += 20
+
+        bootstrap_grid = soup.find_all(class_=lambda x: x and any(
+            grid_class in x for grid_class in ['col-', 'row', 'container']
+        ))
+        if bootstrap_grid:
+            score += 20
+
+        return min(100, score)
+
+    def _analyze_seo(self, soup: BeautifulSoup) -> float:
+        score = 0.0
+
+        title = soup.find('title')
+        if title and title.get_text().strip():
+            score += 20
+
+        meta_description = soup.find('meta', attrs={'name': 'description'})
+        if meta_description and meta_description.get('content'):
+            score += 20
+
+        h1_tags = soup.find_all('h1')
+        if h1_tags:
+            score += 15
+
+        alt_images = soup.find_all('img', alt=True)
+        total_images = soup.find_all('img')
+        if total_images and len(alt_images) / len(total_images) > 0.5:
+            score += 15
+
+        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
+        if meta_keywords:
+            score += 10
+
+        canonical = soup.find('link', attrs={'rel': 'canonical'})
+        if canonical:
+            score += 10
+
+        structured_data = soup.find_all('script', type='application/ld+json')
+        if structured_data:
+            score += 10
+
+        return min(100, score)
+
+    def _analyze_performance(self, elapsed: float, soup: BeautifulSoup) -> float:
+        score = 100.0
+
+        if elapsed > 3:
+            score -= 30
+        elif elapsed > 1:
+            score -= 15
+
+        script_tags = soup.find_all('script')
+        if len(script_tags) > 10:
+            score -= 20
+
+        css_links = soup.find_all('link', rel='stylesheet')
+        if len(css_links) > 5:
+            score -= 10
+
+        images = soup.find_all('img')
+        large_images = [img for img in images if img.get('src') and not any(
+            size in img.get('src', '') for size in ['thumb', 'small', 'compressed']
+        )]
+        if len(large_images) > 10:
+            score -= 15
+
+        inline_styles = soup.find_all(style=True)
+        if len(inline_styles) > 20:
+            score -= 10
+
+        return max(0, score)
+
+    def _count_errors(self, soup: BeautifulSoup) -> int:
+        errors = 0
+
+        broken_images = soup.find_all('img', src=lambda x: not x or x.startswith('data:') == False)
+        errors += len([img for img in broken_images if not img.get('src')])
+
+        broken_links = soup.find_all('a', href=lambda x: not x or x == '#')
+        errors += len(broken_links)
+
+        missing_alt = soup.find_all('img', alt=lambda x: not x)
+        errors += len(missing_alt)
+
+        return errors
+
+    def run(self, html: str) -> Dict:
+        soup = BeautifulSoup(html, 'html.parser')
+        return {
+            "technologies": sorted(self._detect_technologies(soup, html)),
+            "responsiveness": self._check_responsiveness(soup),
+            "seo": self._analyze_seo(soup),
+            "performance": self._analyze_performance(0.5, soup),
+            "errors": self._count_errors(soup)
+        }
+
+
+class _Elapsed:
+    def __init__(self, seconds: float):
+        self.elapsed = type("Elapsed", (), {"total_seconds": lambda _self: seconds})()
+
+
+def run_single_pass(service: ProjectService, html: str) -> Dict:
+    page = analyze_html(html)
+
+    async def score():
+        return {
+            "technologies": sorted(await service._detect_technologies(page)),
+            "responsiveness": await service._check_responsiveness(page),
+            "seo": await service._analyze_seo(page),
+            "performance": await service._analyze_performance(_Elapsed(0.5), page),
+            "errors": await service._count_errors(page)
+        }
+    return asyncio.run(score())
+
+
+def build_landing_page(sections: int) -> str:
+    """Heavy synthetic landing page: many scripts, grid sections, images and links"""
+    parts: List[str] = [
+        "<!DOCTYPE html><html><head><title>Acme Launch</title>",
+        '<meta name="viewport" content="width=device-width, initial-scale=1">',
+        '<meta name="description" content="Landing page">',
+        '<meta name="generator" content="WordPress 6.4">',
+        '<link rel="canonical" href="https://acme.example/">',
+        '<style>.hero{color:red} @media (max-width: 600px){.hero{color:blue}}</style>'
+    ]
+    parts += [f'<link rel="stylesheet" href="/css/{i}.css">' for i in range(8)]
+    parts += [f'<script src="/js/vendor/jquery-{i}.min.js"></script>' for i in range(12)]
+    parts.append('<script type="application/ld+json">{"@type": "Organization"}</script></head><body>')
+    for i in range(sections):
+        alt = ' alt="feature"' if i % 3 else ""
+        href = "#" if i % 7 == 0 else f"/feature/{i}"
+        parts.append(
+            f'<section class="container row-{i}"><div class="col-md-6" style="padding:{i}px">'
+            f'<h2>Feature {i}</h2><p>Lorem ipsum dolor sit amet {i}, consectetur adipiscing elit.</p>'
+            f'<img src="/img/feature-{i}.png" class="img-responsive"{alt}>'
+            f'<a href="{href}">More</a></div></section>'
+        )
+    parts.append("<h1>Acme</h1></body></html>")
+    return "".join(parts)
+
+
+def time_it(func, html: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(html)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    legacy = LegacyPageHeuristics()
+    service = ProjectService()
+
+    for sections in (20, args.sections, args.sections * 5):
+        html = build_landing_page(sections)
+        legacy_result = legacy.run(html)
+        single_pass_result = run_single_pass(service, html)
+
+        legacy_time = time_it(legacy.run, html, args.repeat)
+        single_pass_time = time_it(analyze_html, html, args.repeat)
+
+        print(f"page: {len(html) / 1024:.0f} KB ({sections} sections)")
+        print(f"  BeautifulSoup multi-sweep: {legacy_time * 1000:8.1f} ms")
+        print(f"  lxml single pass:          {single_pass_time * 1000:8.1f} ms  ({legacy_time / single_pass_time:.1f}x faster)")
+        print(f"  identical scores:          {legacy_result == single_pass_result}")
+        if legacy_result != single_pass_result:
+            print(f"    legacy:      {legacy_result}")
+            print(f"    single pass: {single_pass_result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark event-loop lag while resumes are parsed inline vs in the process pool.
+
+A ticker task sleeps in short intervals and records how late each wake-up
+is; that lateness is what every WebSocket, SSE stream and analysis on the
+worker sees. A burst of concurrent PDF uploads is then parsed the old way
+(``parse_pdf_resume`` called directly in the coroutine) and the new way
+(``run_in_process`` on the documents pool).
+
+Run from the repository root:
+
+    python benchmarks/bench_parse_offload.py [--uploads 8] [--pages 30]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from app.utils.process_pool import run_in_process, shutdown_process_pool
+from app.utils.resume_parser import parse_pdf_resume
+
+TICK = 0.005
+
+
+def build_resume_pdf(pages: int, lines_per_page: int = 50) -> bytes:
+    """Multi-page text PDF; each page is a content stream of Tj lines"""
+    page_ids = [3 + 2 * i for i in range(pages)]
+    font_id = 3 + 2 * pages
+    objects = {
+        1: "<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{' '.join(f'{pid} 0 R' for pid in page_ids)}] /Count {pages} >>",
+        font_id: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    }
+    for number, page_id in enumerate(page_ids):
+        lines = "".join(
+            f"(Page {number + 1} line {line}: Built distributed Python services with FastAPI and PostgreSQL) Tj 0 -14 Td "
+            for line in range(lines_per_page)
+        )
+        stream = f"BT /F1 10 Tf 40 780 Td {lines}ET"
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {page_id + 1} 0 R >>"
+        )
+        objects[page_id + 1] = f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream"
+
+    pdf = b"%PDF-1.4\n"
+    offsets = {}
+    for number in sorted(objects):
+        offsets[number] = len(pdf)
+        pdf += f"{number} 0 obj\n{objects[number]}\nendobj\n".encode()
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    pdf += "".join(f"{offsets[number]:010d} 00000 n \n" for number in sorted(objects)).encode()
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return pdf
+
+
+async def measure_lag(burst) -> List[float]:
+    lags: List[float] = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            expected = time.perf_counter() + TICK
+            await asyncio.sleep(TICK)
+            lags.append(max(0.0, time.perf_counter() - expected))
+
+    ticking = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK * 4)
+    await burst()
+    done.set()
+    await ticking
+    return lags
+
+
+def summarize(label: str, lags: List[float], elapsed: float):
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(
+        f"  {label:<16} wall {elapsed * 1000:8.1f} ms   loop lag median {statistics.median(lags_ms):7.2f} ms"
+        f"   p99 {p99:8.2f} ms   max {lags_ms[-1]:8.2f} ms"
+    )
+
+
+async def run(uploads: int, pages: int):
+    content = build_resume_pdf(pages)
+    print(f"{uploads} concurrent uploads of a {pages}-page PDF ({len(content) / 1024:.0f} KB)")
+
+    async def inline_burst():
+        async def parse():
+            return parse_pdf_resume(content)
+        await asyncio.gather(*[parse() for _ in range(uploads)])
+
+    async def pooled_burst():
+        await asyncio.gather(*[run_in_process(parse_pdf_resume, content, pool="documents") for _ in range(uploads)])
+
+    # Start the pool's workers so process spawn time is not measured
+    await run_in_process(parse_pdf_resume, content, pool="documents")
+
+    for label, burst in (("inline", inline_burst), ("process pool", pooled_burst)):
+        started = time.perf_counter()
+        lags = await measure_lag(burst)
+        summarize(label, lags, time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uploads", type=int, default=8)
+    parser.add_argument("--pages", type=int, default=30)
+    args = parser.parse_args()
+    try:
+        asyncio.run(run(args.uploads, args.pages))
+    finally:
+        shutdown_process_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Benchmark page-incremental PDF extraction against the all-pages PyPDF2 loop.
+
+The legacy function below is ``parse_pdf_resume`` as it was before: every
+page through PyPDF2 with repeated string concatenation, pdfplumber only if
+PyPDF2 is not installed. The current parser probes the first page, picks
+the extractor per document and stops at the character budget.
+
+The built-in corpus covers the shapes resumes come in: one and two page
+text PDFs, a long CV with publication appendices, and a design-tool export
+whose glyphs are placed one by one (PyPDF2 runs its words together). Point
+``--corpus`` at a directory of real resume PDFs to run on those instead.
+
+Run from the repository root:
+
+    python benchmarks/bench_pdf_extraction.py [--corpus DIR] [--repeat 3]
+"""
+import argparse
+import glob
+import io
+import os
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from app.utils.resume_parser import parse_pdf_resume, score_text_quality, select_pdf_extractor
+
+EXPERIENCE = [
+    "Senior Backend Engineer, Acme Corp (2019 - present)",
+    "Built distributed Python services with FastAPI, PostgreSQL and Kafka",
+    "Led the migration of billing to an event-sourced architecture",
+    "Mentored six engineers and ran the on-call rotation"
+]
+
+
+def legacy_parse_pdf_resume(content: bytes) -> str:
+    import PyPDF2
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+    text = ""
+    for page in pdf_reader.pages:
+        text += page.extract_text() + "\n"
+    return text.strip()
+
+
+def text_page(lines: List[str]) -> str:
+    return "BT /F1 10 Tf 40 760 Td " + "".join(f"({line}) Tj 0 -14 Td " for line in lines) + "ET"
+
+
+def glyph_page(lines: List[str]) -> str:
+    from pdfminer.fontmetrics import FONT_METRICS
+    widths = FONT_METRICS["Helvetica"][1]
+    parts = []
+    for row, line in enumerate(lines):
+        x = 40.0
+        for char in line:
+            if char != " ":
+                parts.append(f"1 0 0 1 {x:.2f} {760 - row * 14} Tm ({char}) Tj ")
+            x += widths.get(char, 556) * 10 / 1000 if char != " " else 5
+    return "BT /F1 10 Tf " + "".join(parts) + "ET"
+
+
+def build_pdf(streams: List[str]) -> bytes:
+    page_ids = [4 + 2 * i for i in range(len(streams))]
+    objects = {
+        1: "<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{' '.join(f'{pid} 0 R' for pid in page_ids)}] /Count {len(streams)} >>",
+        3: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    }
+    for page_id, stream in zip(page_ids, streams):
+        objects[page_id] = (
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>"
+        )
+        objects[page_id + 1] = f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream"
+    pdf = b"%PDF-1.4\n"
+    offsets = {}
+    for number in sorted(objects):
+        offsets[number] = len(pdf)
+        pdf += f"{number} 0 obj\n{objects[number]}\nendobj\n".encode()
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    pdf += "".join(f"{offsets[number]:010d} 00000 n \n" for number in sorted(objects)).encode()
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return pdf
+
+
+def built_in_corpus() -> Dict[str, bytes]:
+    page = EXPERIENCE * 12
+    appendix = [f"[{i}] J. Doe et al. Scalable stream processing for billing systems. Proc. Conference {i}" for i in range(50)]
+    return {
+        "one-page": build_pdf([text_page(page)]),
+        "two-page": build_pdf([text_page(page)] * 2),
+        "cv-with-appendix (40p)": build_pdf([text_page(page)] * 3 + [text_page(appendix)] * 37),
+        "design-export (2p)": build_pdf([glyph_page(EXPERIENCE * 6)] * 2)
+    }
+
+
+def load_corpus(directory: str) -> Dict[str, bytes]:
+    corpus = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.pdf"))):
+        with open(path, "rb") as handle:
+            corpus[os.path.basename(path)] = handle.read()
+    return corpus
+
+
+def time_it(func, content: bytes, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(content)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", help="directory of resume PDFs (default: built-in synthetic corpus)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else built_in_corpus()
+    print(f"{'document':<26}{'legacy ms':>10}{'new ms':>9}{'chars':>16}{'quality':>14}  extractor")
+    for name, content in corpus.items():
+        legacy_text = legacy_parse_pdf_resume(content)
+        new_text = parse_pdf_resume(content)
+        extractor, pages = select_pdf_extractor(content)
+        pages.close()
+
+        legacy_time = time_it(legacy_parse_pdf_resume, content, args.repeat)
+        new_time = time_it(parse_pdf_resume, content, args.repeat)
+        print(
+            f"{name:<26}{legacy_time * 1000:10.1f}{new_time * 1000:9.1f}"
+            f"{len(legacy_text):8d} -> {len(new_text):<6d}"
+            f"{score_text_quality(legacy_text):6.2f} -> {score_text_quality(new_text):.2f}  {extractor}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -47,4 +47,147 @@ class Settings:
         """Get the default model name"""
         return os.getenv("DEFAULT_MODEL", self.default_model)
 
+    def get_http_config(self) -> Dict[str, Any]:
+        """Get connection pool and timeout policy for the shared HTTP client"""
+        return {
+            "http2": os.getenv("HTTP2_ENABLED", "true").lower() == "true",
+            "max_connections": int(os.getenv("HTTP_MAX_CONNECTIONS", 100)),
+            "max_keepalive_connections": int(os.getenv("HTTP_MAX_KEEPALIVE", 20)),
+            "max_connections_per_host": int(os.getenv("HTTP_MAX_PER_HOST", 10)),
+            "keepalive_expiry": float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 30.0)),
+            "connect_timeout": float(os.getenv("HTTP_CONNECT_TIMEOUT", 5.0)),
+            "read_timeout": float(os.getenv("HTTP_READ_TIMEOUT", 15.0)),
+            "pool_timeout": float(os.getenv("HTTP_POOL_TIMEOUT", 10.0)),
+            "connect_retries": int(os.getenv("HTTP_CONNECT_RETRIES", 1)),
+            "page_max_bytes": int(os.getenv("HTTP_PAGE_MAX_BYTES", 2 * 1024 * 1024)),
+            "user_agent": os.getenv("HTTP_USER_AGENT", "HiringAgent/1.0")
+        }
+
+    def get_resilience_config(self) -> Dict[str, Any]:
+        """Get per-host circuit breaker and retry budget policy for external calls"""
+        return {
+            "failure_threshold": int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", 5)),
+            "open_seconds": float(os.getenv("CIRCUIT_OPEN_SECONDS", 30)),
+            "half_open_max": int(os.getenv("CIRCUIT_HALF_OPEN_MAX", 1)),
+            "max_retries": int(os.getenv("HTTP_MAX_RETRIES", 2)),
+            "retry_ratio": float(os.getenv("HTTP_RETRY_RATIO", 0.2)),
+            "retry_min_per_second": float(os.getenv("HTTP_RETRY_MIN_PER_SECOND", 1.0)),
+            "backoff_base": float(os.getenv("HTTP_RETRY_BACKOFF", 0.2)),
+            "backoff_max": float(os.getenv("HTTP_RETRY_BACKOFF_MAX", 2.0)),
+            "max_hosts": int(os.getenv("CIRCUIT_MAX_HOSTS", 1000))
+        }
+
+    def get_github_config(self) -> Dict[str, Any]:
+        """Get GitHub API tokens, rate-limit scheduling, paging and scoring options"""
+        tokens = [t.strip() for t in os.getenv("GITHUB_TOKENS", "").split(",") if t.strip()]
+        single_token = os.getenv("GITHUB_TOKEN")
+        if single_token and single_token not in tokens:
+            tokens.append(single_token)
+        return {
+            "tokens": tokens,
+            "token_reserve": int(os.getenv("GITHUB_TOKEN_RESERVE", 5)),
+            "token_max_wait": float(os.getenv("GITHUB_TOKEN_MAX_WAIT", 60.0)),
+            "max_repo_pages": int(os.getenv("GITHUB_MAX_REPO_PAGES", 10)),
+            "page_concurrency": int(os.getenv("GITHUB_PAGE_CONCURRENCY", 4)),
+            "deep_inspection": os.getenv("GITHUB_DEEP_INSPECTION", "false").lower() == "true",
+            "deep_inspection_repos": int(os.getenv("GITHUB_DEEP_INSPECTION_REPOS", 5)),
+            "deep_inspection_concurrency": int(os.getenv("GITHUB_DEEP_INSPECTION_CONCURRENCY", 6)),
+            "llm_scoring": os.getenv("GITHUB_LLM_SCORING", "false").lower() == "true",
+            "code_sampling": os.getenv("GITHUB_CODE_SAMPLING", "false").lower() == "true",
+            "code_sampling_repos": int(os.getenv("GITHUB_CODE_SAMPLING_REPOS", 1)),
+            "code_sampling_max_bytes": int(os.getenv("GITHUB_CODE_SAMPLING_MAX_BYTES", 20 * 1024 * 1024))
+        }
+
+    def get_project_config(self) -> Dict[str, Any]:
+        """Get concurrency, deadline, page-weight and caching options for live project evaluation"""
+        return {
+            "concurrency": int(os.getenv("PROJECT_CONCURRENCY", 4)),
+            "per_host_concurrency": int(os.getenv("PROJECT_PER_HOST_CONCURRENCY", 2)),
+            # Kept below the 60s per-stage timeout of the workflow so partial results survive
+            "stage_deadline": float(os.getenv("PROJECT_STAGE_DEADLINE", 50.0)),
+            "page_weight": os.getenv("PROJECT_PAGE_WEIGHT", "false").lower() == "true",
+            "page_weight_concurrency": int(os.getenv("PROJECT_PAGE_WEIGHT_CONCURRENCY", 6)),
+            "page_weight_max_resources": int(os.getenv("PROJECT_PAGE_WEIGHT_MAX_RESOURCES", 40)),
+            # Cached analyses are served as-is for this long, then revalidated with a conditional GET
+            "analysis_cache_ttl": float(os.getenv("PROJECT_CACHE_TTL", 6 * 3600))
+        }
+
+    def get_twitter_config(self) -> Dict[str, Any]:
+        """Get timeline window, classification sample and user lookup batching for Twitter analysis"""
+        return {
+            "timeline_max_tweets": int(os.getenv("TWITTER_TIMELINE_MAX_TWEETS", 300)),
+            "timeline_days": int(os.getenv("TWITTER_TIMELINE_DAYS", 180)),
+            "classification_sample": int(os.getenv("TWITTER_CLASSIFICATION_SAMPLE", 50)),
+            "lookup_window": float(os.getenv("TWITTER_LOOKUP_WINDOW", 0.05)),
+            "lookup_batch_size": int(os.getenv("TWITTER_LOOKUP_BATCH_SIZE", 100)),
+            "user_cache_ttl": float(os.getenv("TWITTER_USER_CACHE_TTL", 24 * 3600)),
+            "missing_user_cache_ttl": float(os.getenv("TWITTER_MISSING_USER_CACHE_TTL", 3600))
+        }
+
+    def get_medium_config(self) -> Dict[str, Any]:
+        """Get RSS feed limits for Medium analysis"""
+        return {
+            "feed_max_items": int(os.getenv("MEDIUM_FEED_MAX_ITEMS", 10))
+        }
+
+    def get_scraper_config(self) -> Dict[str, Any]:
+        """Get per-host backoff after login walls and bot blocks on scraped sites"""
+        return {
+            "block_backoff": float(os.getenv("SCRAPER_BLOCK_BACKOFF", 60)),
+            "block_backoff_max": float(os.getenv("SCRAPER_BLOCK_BACKOFF_MAX", 3600))
+        }
+
+    def get_snapshot_config(self) -> Dict[str, Any]:
+        """Get how long platform analyses stay fresh for reuse across analyses, per platform"""
+        return {
+            "github": float(os.getenv("SNAPSHOT_TTL_GITHUB", 24 * 3600)),
+            "twitter": float(os.getenv("SNAPSHOT_TTL_TWITTER", 6 * 3600)),
+            "medium": float(os.getenv("SNAPSHOT_TTL_MEDIUM", 24 * 3600))
+        }
+
+    def get_negative_cache_config(self) -> Dict[str, Any]:
+        """Get retention and optional Bloom filter sizing for known-missing profiles"""
+        return {
+            "ttl": float(os.getenv("NEGATIVE_CACHE_TTL", 24 * 3600)),
+            "bloom": os.getenv("NEGATIVE_CACHE_BLOOM", "false").lower() == "true",
+            "bloom_capacity": int(os.getenv("NEGATIVE_CACHE_BLOOM_CAPACITY", 100000)),
+            "bloom_error_rate": float(os.getenv("NEGATIVE_CACHE_BLOOM_ERROR_RATE", 0.01))
+        }
+
+    def get_prefetch_config(self) -> Dict[str, Any]:
+        """Get whether resume upload prefetches platform data, and how long unused prefetches live"""
+        return {
+            "enabled": os.getenv("PREFETCH_ON_UPLOAD", "false").lower() == "true",
+            "ttl": float(os.getenv("PREFETCH_TTL", 300)),
+            "max_entries": int(os.getenv("PREFETCH_MAX_ENTRIES", 200))
+        }
+
+    def get_upload_config(self) -> Dict[str, Any]:
+        """Get the size limit for uploaded resumes and LinkedIn exports"""
+        return {
+            "max_bytes": int(os.getenv("UPLOAD_MAX_BYTES", 10 * 1024 * 1024))
+        }
+
+    def get_resume_parser_config(self) -> Dict[str, Any]:
+        """Get the PDF text budget and the first-page quality that avoids the slower extractor"""
+        return {
+            "pdf_char_budget": int(os.getenv("RESUME_PDF_CHAR_BUDGET", 20000)),
+            "pdf_quality_threshold": float(os.getenv("RESUME_PDF_QUALITY_THRESHOLD", 0.9))
+        }
+
+    def get_process_pool_config(self) -> Dict[str, Any]:
+        """Get sizing of the shared process pools for CPU-bound work and the upload parse timeout"""
+        return {
+            "max_workers": int(os.getenv("PROCESS_POOL_WORKERS", min(4, os.cpu_count() or 1))),
+            "document_workers": int(os.getenv("DOCUMENT_PARSE_WORKERS", min(2, os.cpu_count() or 1))),
+            "document_parse_timeout": float(os.getenv("DOCUMENT_PARSE_TIMEOUT", 30))
+        }
+
+    def get_cache_config(self) -> Dict[str, Any]:
+        """Get location and retention of the persistent response cache"""
+        return {
+            "path": os.getenv("CACHE_PATH", str(self.config_dir.parent / ".cache" / "hiring_agent.db")),
+            "http_max_age": float(os.getenv("HTTP_CACHE_MAX_AGE", 7 * 24 * 3600))
+        }
+
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,83 @@
+import os
+
+# Services build their ChatOpenAI client on construction; offline tests never call it
+if not os.environ.get("OPENAI_API_KEY"):
+    os.environ["OPENAI_API_KEY"] = "test-key"
+
+import gzip
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import pytest
+
+FIXTURE_SITES = Path(__file__).parent / "fixtures" / "sites"
+
+class FixtureSiteHandler(BaseHTTPRequestHandler):
+    """Local stand-in for a candidate's hosting.
+
+    Serves tests/fixtures/sites, gzips JavaScript, rejects HEAD for images
+    (as some CDNs do) and honours single byte ranges.
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def _resolve(self):
+        path = self.path.split("?", 1)[0].lstrip("/")
+        target = FIXTURE_SITES / path
+        if target.is_dir():
+            target = target / "index.html"
+        return target if target.is_file() else None
+
+    def _respond(self, send_body: bool):
+        self.server.requests.append((self.command, self.path))
+        target = self._resolve()
+        if target is None:
+            self.send_error(404)
+            return
+        if self.command == "HEAD" and "/img/" in self.path:
+            self.send_error(405)
+            return
+
+        body = target.read_bytes()
+        content_types = {".html": "text/html; charset=utf-8", ".js": "application/javascript",
+                         ".css": "text/css", ".png": "image/png"}
+        headers = {"Content-Type": content_types.get(target.suffix, "application/octet-stream")}
+        status = 200
+        if target.suffix == ".js" and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        match = re.match(r"bytes=(\d+)-(\d+)$", self.headers.get("Range", ""))
+        if match and self.command == "GET":
+            start, end = int(match.group(1)), min(int(match.group(2)), len(body) - 1)
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+            body = body[start:end + 1]
+            status = 206
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+@pytest.fixture
+def fixture_site_server():
+    """Serve the fixture sites over HTTP on a random local port"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureSiteHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
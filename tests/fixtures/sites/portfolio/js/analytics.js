@@ -0,0 +1 @@
+window.track = function () {};
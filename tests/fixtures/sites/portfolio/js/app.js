@@ -0,0 +1,400 @@
+function handler0(event) { return event.target.value + 0; }
+function handler1(event) { return event.target.value + 1; }
+function handler2(event) { return event.target.value + 2; }
+function handler3(event) { return event.target.value + 3; }
+function handler4(event) { return event.target.value + 4; }
+function handler5(event) { return event.target.value + 5; }
+function handler6(event) { return event.target.value + 6; }
+function handler7(event) { return event.target.value + 7; }
+function handler8(event) { return event.target.value + 8; }
+function handler9(event) { return event.target.value + 9; }
+function handler10(event) { return event.target.value + 10; }
+function handler11(event) { return event.target.value + 11; }
+function handler12(event) { return event.target.value + 12; }
+function handler13(event) { return event.target.value + 13; }
+function handler14(event) { return event.target.value + 14; }
+function handler15(event) { return event.target.value + 15; }
+function handler16(event) { return event.target.value + 16; }
+function handler17(event) { return event.target.value + 17; }
+function handler18(event) { return event.target.value + 18; }
+function handler19(event) { return event.target.value + 19; }
+function handler20(event) { return event.target.value + 20; }
+function handler21(event) { return event.target.value + 21; }
+function handler22(event) { return event.target.value + 22; }
+function handler23(event) { return event.target.value + 23; }
+function handler24(event) { return event.target.value + 24; }
+function handler25(event) { return event.target.value + 25; }
+function handler26(event) { return event.target.value + 26; }
+function handler27(event) { return event.target.value + 27; }
+function handler28(event) { return event.target.value + 28; }
+function handler29(event) { return event.target.value + 29; }
+function handler30(event) { return event.target.value + 30; }
+function handler31(event) { return event.target.value + 31; }
+function handler32(event) { return event.target.value + 32; }
+function handler33(event) { return event.target.value + 33; }
+function handler34(event) { return event.target.value + 34; }
+function handler35(event) { return event.target.value + 35; }
+function handler36(event) { return event.target.value + 36; }
+function handler37(event) { return event.target.value + 37; }
+function handler38(event) { return event.target.value + 38; }
+function handler39(event) { return event.target.value + 39; }
+function handler40(event) { return event.target.value + 40; }
+function handler41(event) { return event.target.value + 41; }
+function handler42(event) { return event.target.value + 42; }
+function handler43(event) { return event.target.value + 43; }
+function handler44(event) { return event.target.value + 44; }
+function handler45(event) { return event.target.value + 45; }
+function handler46(event) { return event.target.value + 46; }
+function handler47(event) { return event.target.value + 47; }
+function handler48(event) { return event.target.value + 48; }
+function handler49(event) { return event.target.value + 49; }
+function handler50(event) { return event.target.value + 50; }
+function handler51(event) { return event.target.value + 51; }
+function handler52(event) { return event.target.value + 52; }
+function handler53(event) { return event.target.value + 53; }
+function handler54(event) { return event.target.value + 54; }
+function handler55(event) { return event.target.value + 55; }
+function handler56(event) { return event.target.value + 56; }
+function handler57(event) { return event.target.value + 57; }
+function handler58(event) { return event.target.value + 58; }
+function handler59(event) { return event.target.value + 59; }
+function handler60(event) { return event.target.value + 60; }
+function handler61(event) { return event.target.value + 61; }
+function handler62(event) { return event.target.value + 62; }
+function handler63(event) { return event.target.value + 63; }
+function handler64(event) { return event.target.value + 64; }
+function handler65(event) { return event.target.value + 65; }
+function handler66(event) { return event.target.value + 66; }
+function handler67(event) { return event.target.value + 67; }
+function handler68(event) { return event.target.value + 68; }
+function handler69(event) { return event.target.value + 69; }
+function handler70(event) { return event.target.value + 70; }
+function handler71(event) { return event.target.value + 71; }
+function handler72(event) { return event.target.value + 72; }
+function handler73(event) { return event.target.value + 73; }
+function handler74(event) { return event.target.value + 74; }
+function handler75(event) { return event.target.value + 75; }
+function handler76(event) { return event.target.value + 76; }
+function handler77(event) { return event.target.value + 77; }
+function handler78(event) { return event.target.value + 78; }
+function handler79(event) { return event.target.value + 79; }
+function handler80(event) { return event.target.value + 80; }
+function handler81(event) { return event.target.value + 81; }
+function handler82(event) { return event.target.value + 82; }
+function handler83(event) { return event.target.value + 83; }
+function handler84(event) { return event.target.value + 84; }
+function handler85(event) { return event.target.value + 85; }
+function handler86(event) { return event.target.value + 86; }
+function handler87(event) { return event.target.value + 87; }
+function handler88(event) { return event.target.value + 88; }
+function handler89(event) { return event.target.value + 89; }
+function handler90(event) { return event.target.value + 90; }
+function handler91(event) { return event.target.value + 91; }
+function handler92(event) { return event.target.value + 92; }
+function handler93(event) { return event.target.value + 93; }
+function handler94(event) { return event.target.value + 94; }
+function handler95(event) { return event.target.value + 95; }
+function handler96(event) { return event.target.value + 96; }
+function handler97(event) { return event.target.value + 97; }
+function handler98(event) { return event.target.value + 98; }
+function handler99(event) { return event.target.value + 99; }
+function handler100(event) { return event.target.value + 100; }
+function handler101(event) { return event.target.value + 101; }
+function handler102(event) { return event.target.value + 102; }
+function handler103(event) { return event.target.value + 103; }
+function handler104(event) { return event.target.value + 104; }
+function handler105(event) { return event.target.value + 105; }
+function handler106(event) { return event.target.value + 106; }
+function handler107(event) { return event.target.value + 107; }
+function handler108(event) { return event.target.value + 108; }
+function handler109(event) { return event.target.value + 109; }
+function handler110(event) { return event.target.value + 110; }
+function handler111(event) { return event.target.value + 111; }
+function handler112(event) { return event.target.value + 112; }
+function handler113(event) { return event.target.value + 113; }
+function handler114(event) { return event.target.value + 114; }
+function handler115(event) { return event.target.value + 115; }
+function handler116(event) { return event.target.value + 116; }
+function handler117(event) { return event.target.value + 117; }
+function handler118(event) { return event.target.value + 118; }
+function handler119(event) { return event.target.value + 119; }
+function handler120(event) { return event.target.value + 120; }
+function handler121(event) { return event.target.value + 121; }
+function handler122(event) { return event.target.value + 122; }
+function handler123(event) { return event.target.value + 123; }
+function handler124(event) { return event.target.value + 124; }
+function handler125(event) { return event.target.value + 125; }
+function handler126(event) { return event.target.value + 126; }
+function handler127(event) { return event.target.value + 127; }
+function handler128(event) { return event.target.value + 128; }
+function handler129(event) { return event.target.value + 129; }
+function handler130(event) { return event.target.value + 130; }
+function handler131(event) { return event.target.value + 131; }
+function handler132(event) { return event.target.value + 132; }
+function handler133(event) { return event.target.value + 133; }
+function handler134(event) { return event.target.value + 134; }
+function handler135(event) { return event.target.value + 135; }
+function handler136(event) { return event.target.value + 136; }
+function handler137(event) { return event.target.value + 137; }
+function handler138(event) { return event.target.value + 138; }
+function handler139(event) { return event.target.value + 139; }
+function handler140(event) { return event.target.value + 140; }
+function handler141(event) { return event.target.value + 141; }
+function handler142(event) { return event.target.value + 142; }
+function handler143(event) { return event.target.value + 143; }
+function handler144(event) { return event.target.value + 144; }
+function handler145(event) { return event.target.value + 145; }
+function handler146(event) { return event.target.value + 146; }
+function handler147(event) { return event.target.value + 147; }
+function handler148(event) { return event.target.value + 148; }
+function handler149(event) { return event.target.value + 149; }
+function handler150(event) { return event.target.value + 150; }
+function handler151(event) { return event.target.value + 151; }
+function handler152(event) { return event.target.value + 152; }
+function handler153(event) { return event.target.value + 153; }
+function handler154(event) { return event.target.value + 154; }
+function handler155(event) { return event.target.value + 155; }
+function handler156(event) { return event.target.value + 156; }
+function handler157(event) { return event.target.value + 157; }
+function handler158(event) { return event.target.value + 158; }
+function handler159(event) { return event.target.value + 159; }
+function handler160(event) { return event.target.value + 160; }
+function handler161(event) { return event.target.value + 161; }
+function handler162(event) { return event.target.value + 162; }
+function handler163(event) { return event.target.value + 163; }
+function handler164(event) { return event.target.value + 164; }
+function handler165(event) { return event.target.value + 165; }
+function handler166(event) { return event.target.value + 166; }
+function handler167(event) { return event.target.value + 167; }
+function handler168(event) { return event.target.value + 168; }
+function handler169(event) { return event.target.value + 169; }
+function handler170(event) { return event.target.value + 170; }
+function handler171(event) { return event.target.value + 171; }
+function handler172(event) { return event.target.value + 172; }
+function handler173(event) { return event.target.value + 173; }
+function handler174(event) { return event.target.value + 174; }
+function handler175(event) { return event.target.value + 175; }
+function handler176(event) { return event.target.value + 176; }
+function handler177(event) { return event.target.value + 177; }
+function handler178(event) { return event.target.value + 178; }
+function handler179(event) { return event.target.value + 179; }
+function handler180(event) { return event.target.value + 180; }
+function handler181(event) { return event.target.value + 181; }
+function handler182(event) { return event.target.value + 182; }
+function handler183(event) { return event.target.value + 183; }
+function handler184(event) { return event.target.value + 184; }
+function handler185(event) { return event.target.value + 185; }
+function handler186(event) { return event.target.value + 186; }
+function handler187(event) { return event.target.value + 187; }
+function handler188(event) { return event.target.value + 188; }
+function handler189(event) { return event.target.value + 189; }
+function handler190(event) { return event.target.value + 190; }
+function handler191(event) { return event.target.value + 191; }
+function handler192(event) { return event.target.value + 192; }
+function handler193(event) { return event.target.value + 193; }
+function handler194(event) { return event.target.value + 194; }
+function handler195(event) { return event.target.value + 195; }
+function handler196(event) { return event.target.value + 196; }
+function handler197(event) { return event.target.value + 197; }
+function handler198(event) { return event.target.value + 198; }
+function handler199(event) { return event.target.value + 199; }
+function handler200(event) { return event.target.value + 200; }
+function handler201(event) { return event.target.value + 201; }
+function handler202(event) { return event.target.value + 202; }
+function handler203(event) { return event.target.value + 203; }
+function handler204(event) { return event.target.value + 204; }
+function handler205(event) { return event.target.value + 205; }
+function handler206(event) { return event.target.value + 206; }
+function handler207(event) { return event.target.value + 207; }
+function handler208(event) { return event.target.value + 208; }
+function handler209(event) { return event.target.value + 209; }
+function handler210(event) { return event.target.value + 210; }
+function handler211(event) { return event.target.value + 211; }
+function handler212(event) { return event.target.value + 212; }
+function handler213(event) { return event.target.value + 213; }
+function handler214(event) { return event.target.value + 214; }
+function handler215(event) { return event.target.value + 215; }
+function handler216(event) { return event.target.value + 216; }
+function handler217(event) { return event.target.value + 217; }
+function handler218(event) { return event.target.value + 218; }
+function handler219(event) { return event.target.value + 219; }
+function handler220(event) { return event.target.value + 220; }
+function handler221(event) { return event.target.value + 221; }
+function handler222(event) { return event.target.value + 222; }
+function handler223(event) { return event.target.value + 223; }
+function handler224(event) { return event.target.value + 224; }
+function handler225(event) { return event.target.value + 225; }
+function handler226(event) { return event.target.value + 226; }
+function handler227(event) { return event.target.value + 227; }
+function handler228(event) { return event.target.value + 228; }
+function handler229(event) { return event.target.value + 229; }
+function handler230(event) { return event.target.value + 230; }
+function handler231(event) { return event.target.value + 231; }
+function handler232(event) { return event.target.value + 232; }
+function handler233(event) { return event.target.value + 233; }
+function handler234(event) { return event.target.value + 234; }
+function handler235(event) { return event.target.value + 235; }
+function handler236(event) { return event.target.value + 236; }
+function handler237(event) { return event.target.value + 237; }
+function handler238(event) { return event.target.value + 238; }
+function handler239(event) { return event.target.value + 239; }
+function handler240(event) { return event.target.value + 240; }
+function handler241(event) { return event.target.value + 241; }
+function handler242(event) { return event.target.value + 242; }
+function handler243(event) { return event.target.value + 243; }
+function handler244(event) { return event.target.value + 244; }
+function handler245(event) { return event.target.value + 245; }
+function handler246(event) { return event.target.value + 246; }
+function handler247(event) { return event.target.value + 247; }
+function handler248(event) { return event.target.value + 248; }
+function handler249(event) { return event.target.value + 249; }
+function handler250(event) { return event.target.value + 250; }
+function handler251(event) { return event.target.value + 251; }
+function handler252(event) { return event.target.value + 252; }
+function handler253(event) { return event.target.value + 253; }
+function handler254(event) { return event.target.value + 254; }
+function handler255(event) { return event.target.value + 255; }
+function handler256(event) { return event.target.value + 256; }
+function handler257(event) { return event.target.value + 257; }
+function handler258(event) { return event.target.value + 258; }
+function handler259(event) { return event.target.value + 259; }
+function handler260(event) { return event.target.value + 260; }
+function handler261(event) { return event.target.value + 261; }
+function handler262(event) { return event.target.value + 262; }
+function handler263(event) { return event.target.value + 263; }
+function handler264(event) { return event.target.value + 264; }
+function handler265(event) { return event.target.value + 265; }
+function handler266(event) { return event.target.value + 266; }
+function handler267(event) { return event.target.value + 267; }
+function handler268(event) { return event.target.value + 268; }
+function handler269(event) { return event.target.value + 269; }
+function handler270(event) { return event.target.value + 270; }
+function handler271(event) { return event.target.value + 271; }
+function handler272(event) { return event.target.value + 272; }
+function handler273(event) { return event.target.value + 273; }
+function handler274(event) { return event.target.value + 274; }
+function handler275(event) { return event.target.value + 275; }
+function handler276(event) { return event.target.value + 276; }
+function handler277(event) { return event.target.value + 277; }
+function handler278(event) { return event.target.value + 278; }
+function handler279(event) { return event.target.value + 279; }
+function handler280(event) { return event.target.value + 280; }
+function handler281(event) { return event.target.value + 281; }
+function handler282(event) { return event.target.value + 282; }
+function handler283(event) { return event.target.value + 283; }
+function handler284(event) { return event.target.value + 284; }
+function handler285(event) { return event.target.value + 285; }
+function handler286(event) { return event.target.value + 286; }
+function handler287(event) { return event.target.value + 287; }
+function handler288(event) { return event.target.value + 288; }
+function handler289(event) { return event.target.value + 289; }
+function handler290(event) { return event.target.value + 290; }
+function handler291(event) { return event.target.value + 291; }
+function handler292(event) { return event.target.value + 292; }
+function handler293(event) { return event.target.value + 293; }
+function handler294(event) { return event.target.value + 294; }
+function handler295(event) { return event.target.value + 295; }
+function handler296(event) { return event.target.value + 296; }
+function handler297(event) { return event.target.value + 297; }
+function handler298(event) { return event.target.value + 298; }
+function handler299(event) { return event.target.value + 299; }
+function handler300(event) { return event.target.value + 300; }
+function handler301(event) { return event.target.value + 301; }
+function handler302(event) { return event.target.value + 302; }
+function handler303(event) { return event.target.value + 303; }
+function handler304(event) { return event.target.value + 304; }
+function handler305(event) { return event.target.value + 305; }
+function handler306(event) { return event.target.value + 306; }
+function handler307(event) { return event.target.value + 307; }
+function handler308(event) { return event.target.value + 308; }
+function handler309(event) { return event.target.value + 309; }
+function handler310(event) { return event.target.value + 310; }
+function handler311(event) { return event.target.value + 311; }
+function handler312(event) { return event.target.value + 312; }
+function handler313(event) { return event.target.value + 313; }
+function handler314(event) { return event.target.value + 314; }
+function handler315(event) { return event.target.value + 315; }
+function handler316(event) { return event.target.value + 316; }
+function handler317(event) { return event.target.value + 317; }
+function handler318(event) { return event.target.value + 318; }
+function handler319(event) { return event.target.value + 319; }
+function handler320(event) { return event.target.value + 320; }
+function handler321(event) { return event.target.value + 321; }
+function handler322(event) { return event.target.value + 322; }
+function handler323(event) { return event.target.value + 323; }
+function handler324(event) { return event.target.value + 324; }
+function handler325(event) { return event.target.value + 325; }
+function handler326(event) { return event.target.value + 326; }
+function handler327(event) { return event.target.value + 327; }
+function handler328(event) { return event.target.value + 328; }
+function handler329(event) { return event.target.value + 329; }
+function handler330(event) { return event.target.value + 330; }
+function handler331(event) { return event.target.value + 331; }
+function handler332(event) { return event.target.value + 332; }
+function handler333(event) { return event.target.value + 333; }
+function handler334(event) { return event.target.value + 334; }
+function handler335(event) { return event.target.value + 335; }
+function handler336(event) { return event.target.value + 336; }
+function handler337(event) { return event.target.value + 337; }
+function handler338(event) { return event.target.value + 338; }
+function handler339(event) { return event.target.value + 339; }
+function handler340(event) { return event.target.value + 340; }
+function handler341(event) { return event.target.value + 341; }
+function handler342(event) { return event.target.value + 342; }
+function handler343(event) { return event.target.value + 343; }
+function handler344(event) { return event.target.value + 344; }
+function handler345(event) { return event.target.value + 345; }
+function handler346(event) { return event.target.value + 346; }
+function handler347(event) { return event.target.value + 347; }
+function handler348(event) { return event.target.value + 348; }
+function handler349(event) { return event.target.value + 349; }
+function handler350(event) { return event.target.value + 350; }
+function handler351(event) { return event.target.value + 351; }
+function handler352(event) { return event.target.value + 352; }
+function handler353(event) { return event.target.value + 353; }
+function handler354(event) { return event.target.value + 354; }
+function handler355(event) { return event.target.value + 355; }
+function handler356(event) { return event.target.value + 356; }
+function handler357(event) { return event.target.value + 357; }
+function handler358(event) { return event.target.value + 358; }
+function handler359(event) { return event.target.value + 359; }
+function handler360(event) { return event.target.value + 360; }
+function handler361(event) { return event.target.value + 361; }
+function handler362(event) { return event.target.value + 362; }
+function handler363(event) { return event.target.value + 363; }
+function handler364(event) { return event.target.value + 364; }
+function handler365(event) { return event.target.value + 365; }
+function handler366(event) { return event.target.value + 366; }
+function handler367(event) { return event.target.value + 367; }
+function handler368(event) { return event.target.value + 368; }
+function handler369(event) { return event.target.value + 369; }
+function handler370(event) { return event.target.value + 370; }
+function handler371(event) { return event.target.value + 371; }
+function handler372(event) { return event.target.value + 372; }
+function handler373(event) { return event.target.value + 373; }
+function handler374(event) { return event.target.value + 374; }
+function handler375(event) { return event.target.value + 375; }
+function handler376(event) { return event.target.value + 376; }
+function handler377(event) { return event.target.value + 377; }
+function handler378(event) { return event.target.value + 378; }
+function handler379(event) { return event.target.value + 379; }
+function handler380(event) { return event.target.value + 380; }
+function handler381(event) { return event.target.value + 381; }
+function handler382(event) { return event.target.value + 382; }
+function handler383(event) { return event.target.value + 383; }
+function handler384(event) { return event.target.value + 384; }
+function handler385(event) { return event.target.value + 385; }
+function handler386(event) { return event.target.value + 386; }
+function handler387(event) { return event.target.value + 387; }
+function handler388(event) { return event.target.value + 388; }
+function handler389(event) { return event.target.value + 389; }
+function handler390(event) { return event.target.value + 390; }
+function handler391(event) { return event.target.value + 391; }
+function handler392(event) { return event.target.value + 392; }
+function handler393(event) { return event.target.value + 393; }
+function handler394(event) { return event.target.value + 394; }
+function handler395(event) { return event.target.value + 395; }
+function handler396(event) { return event.target.value + 396; }
+function handler397(event) { return event.target.value + 397; }
+function handler398(event) { return event.target.value + 398; }
+function handler399(event) { return event.target.value + 399; }
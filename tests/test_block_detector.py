@@ -0,0 +1,88 @@
+import httpx
+import pytest
+from app.services.linkedin_service import LinkedInService
+from app.services.medium_service import MediumService
+from app.utils.block_detector import BlockTracker, classify_response
+from app.utils.cache import PersistentCache
+
+HTML = httpx.Headers({"content-type": "text/html; charset=utf-8"})
+
+def test_classify_response():
+    assert classify_response(999, HTML, b"<html></html>") == "bot_block"
+    assert classify_response(429, httpx.Headers(), b"") == "rate_limited"
+    assert classify_response(200, HTML, b"<html>", "https://www.linkedin.com/authwall?trk=x") == "login_wall"
+    assert classify_response(200, HTML, b"<title>Just a moment...</title>") == "bot_block"
+    assert classify_response(403, httpx.Headers({"cf-mitigated": "challenge"}), b"") == "bot_block"
+    assert classify_response(200, HTML, b"   ") == "empty"
+    # Usable pages, missing profiles and feeds mentioning captchas are not blocks
+    assert classify_response(200, HTML, b"<html><head><title>Jane Doe</title>") is None
+    assert classify_response(404, HTML, b"<html>Not found</html>") is None
+    assert classify_response(200, httpx.Headers({"content-type": "text/xml"}), b"<rss>captcha</rss>") is None
+
+def test_block_tracker_backs_off_per_host():
+    tracker = BlockTracker(base_backoff=60, max_backoff=100)
+    tracker.record("https://www.linkedin.com/in/a", "bot_block")
+    tracker.record("https://www.linkedin.com/in/b", "bot_block")
+
+    assert 60 < tracker.backoff_remaining("https://www.linkedin.com/in/c") <= 100
+    assert tracker.backoff_remaining("https://medium.com/feed/@a") == 0
+
+    tracker.record("https://medium.com/feed/@a", None)
+    tracker.record("https://medium.com/feed/@b", "rate_limited", retry_after=500)
+    metrics = tracker.get_metrics()
+    assert metrics["www.linkedin.com"]["block_rate"] == 1.0 and metrics["www.linkedin.com"]["skipped"] == 1
+    # Retry-After wins over a shorter computed backoff
+    assert metrics["medium.com"]["block_rate"] == 0.5 and metrics["medium.com"]["backoff_remaining"] > 400
+
+@pytest.mark.asyncio
+async def test_linkedin_login_wall_skips_parsing_and_llm():
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path.startswith("/in/"):
+            return httpx.Response(302, headers={"location": "https://www.linkedin.com/authwall?sessionRedirect=x"})
+        return httpx.Response(200, headers={"content-type": "text/html"}, text="<html><body>Sign in</body></html>")
+
+    service = LinkedInService(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), tracker=BlockTracker())
+
+    async def unexpected(*args):
+        raise AssertionError("blocked page reached the model")
+
+    service._analyze_posts = unexpected
+    analysis = await service.analyze_profile("https://www.linkedin.com/in/jane", "Machine Learning")
+    assert analysis.unavailable_reason == "login_wall"
+    assert analysis.domain_relevance_score == 0.0
+
+    # The host is backing off: no request at all for the next candidate
+    again = await service.analyze_profile("https://www.linkedin.com/in/john", "Machine Learning")
+    assert again.unavailable_reason == "backoff"
+    assert requests == ["/in/jane", "/authwall"]
+
+@pytest.mark.asyncio
+async def test_medium_captcha_is_not_parsed_or_cached():
+    def handler(request):
+        return httpx.Response(
+            403, headers={"content-type": "text/html", "retry-after": "120"},
+            text="<html><head><title>Just a moment...</title></head><body>challenge-platform</body></html>"
+        )
+
+    cache = PersistentCache("medium_feed", path=":memory:")
+    tracker = BlockTracker(base_backoff=1)
+    service = MediumService(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), cache=cache, tracker=tracker)
+
+    analysis = await service.analyze_profile("@jane", "Machine Learning")
+    assert analysis.unavailable_reason == "bot_block" and analysis.articles_count == 0
+    assert cache.get("jane") is None
+    assert tracker.get_metrics()["medium.com"]["backoff_remaining"] > 100
+
+def test_block_tracker_forgets_idle_hosts_first():
+    tracker = BlockTracker(base_backoff=60, max_backoff=100, max_hosts=2)
+    tracker.record("https://blocked.example/a", "bot_block")
+    for index in range(3):
+        tracker.record(f"https://site{index}.example/", None)
+
+    assert list(tracker.hosts) == ["blocked.example", "site2.example"]
+    summary = tracker.get_summary()
+    assert summary["hosts"] == 2 and summary["evicted"] == 2
+    assert list(summary["backing_off"]) == ["blocked.example"]
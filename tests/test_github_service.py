@@ -0,0 +1,356 @@
+import pytest
+import asyncio
+import io
+import tarfile
+import time
+import httpx
+from datetime import datetime, timezone
+from app.services.github_service import WEEK_SECONDS, GitHubService, RepoAggregator, shift_weekly_commits
+from app.utils.cache import ConditionalHTTPCache, PersistentCache
+from app.utils.token_pool import TokenPool
+from app.utils.github_scoring import domain_keywords, score_code_quality, score_domain_relevance, tokenize
+from app.utils.code_sampler import sample_repository_code
+
+def github_stub(requests_seen):
+    """Mock GitHub API that honours If-None-Match"""
+    def handler(request: httpx.Request):
+        requests_seen.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"', "x-ratelimit-remaining": "4999"})
+        if request.url.path.endswith("/repos"):
+            body = [{"name": "api", "language": "Python", "size": 120, "stargazers_count": 3}]
+        else:
+            body = {"login": "octo", "public_repos": 1, "followers": 7, "following": 2}
+        return httpx.Response(200, json=body, headers={"etag": '"v1"'})
+    return handler
+
+@pytest.mark.asyncio
+async def test_conditional_cache_replays_body_on_304():
+    """A revalidated response looks like the original 200 to callers"""
+    seen = []
+    cache = ConditionalHTTPCache(PersistentCache("http", path=":memory:"))
+    async with httpx.AsyncClient(transport=httpx.MockTransport(github_stub(seen))) as client:
+        first = await cache.get(client, "https://api.github.com/users/octo")
+        second = await cache.get(client, "https://api.github.com/users/octo")
+
+    assert first.json() == second.json()
+    assert second.status_code == 200
+    assert second.headers["x-cache"] == "HIT"
+    assert second.headers["x-ratelimit-remaining"] == "4999"
+    assert "if-none-match" not in seen[0].headers
+    assert seen[1].headers["if-none-match"] == '"v1"'
+    assert cache.stats == {"hits": 1, "misses": 1, "stored": 1}
+
+@pytest.mark.asyncio
+async def test_analyze_profile_uses_cache_on_repeat(monkeypatch):
+    """Re-analysing a profile only issues conditional requests"""
+    seen = []
+    cache = ConditionalHTTPCache(PersistentCache("http", path=":memory:"))
+
+    async def fixed_score(*args):
+        return 60.0
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(github_stub(seen))) as client:
+        service = GitHubService(client=client, cache=cache)
+        monkeypatch.setattr(service, "_analyze_code_quality", fixed_score)
+        monkeypatch.setattr(service, "_analyze_domain_relevance", fixed_score)
+
+        first = await service.analyze_profile("octo", "Backend")
+        second = await service.analyze_profile("octo", "Backend")
+
+    assert first == second
+    assert second.followers == 7
+    assert second.languages == {"Python": 1}
+    assert cache.stats["hits"] == 2
+
+def rate_limit_headers(remaining, reset_in=3600):
+    return {
+        "x-ratelimit-limit": "5000",
+        "x-ratelimit-remaining": str(remaining),
+        "x-ratelimit-reset": str(int(time.time() + reset_in))
+    }
+
+@pytest.mark.asyncio
+async def test_token_pool_routes_to_token_with_most_quota():
+    """Each acquire picks the token with the largest remaining budget"""
+    pool = TokenPool(["token-aaaa", "token-bbbb"])
+    first = await pool.acquire()
+    pool.release(first, httpx.Response(200, headers=rate_limit_headers(100)))
+    second = await pool.acquire()
+    pool.release(second, httpx.Response(200, headers=rate_limit_headers(4000)))
+
+    chosen = await pool.acquire()
+    assert chosen.token == second.token
+    metrics = {m["token"]: m for m in pool.get_metrics()}
+    assert metrics[f"...{first.token[-4:]}"]["remaining"] == 100
+    assert metrics[f"...{second.token[-4:]}"]["in_flight"] == 1
+
+@pytest.mark.asyncio
+async def test_token_pool_waits_for_reset_when_exhausted():
+    """Requests are delayed until the window resets instead of failing"""
+    pool = TokenPool(["token-aaaa"], reserve=0, max_wait=5)
+    state = await pool.acquire()
+    pool.release(state, httpx.Response(403, headers=rate_limit_headers(0, reset_in=1.5)))
+
+    started = time.time()
+    state = await pool.acquire()
+    assert time.time() - started >= 0.2
+    assert state.available(time.time()) > 0
+
+@pytest.mark.asyncio
+async def test_api_get_retries_rate_limited_request_on_another_token():
+    """A 403 with an exhausted budget is retried with the next best token"""
+    used = []
+
+    def handler(request: httpx.Request):
+        token = request.headers["authorization"]
+        used.append(token)
+        if token == "token token-aaaa":
+            return httpx.Response(403, headers=rate_limit_headers(0))
+        return httpx.Response(200, json={"login": "octo"}, headers=rate_limit_headers(4999))
+
+    pool = TokenPool(["token-aaaa", "token-bbbb"])
+    cache = ConditionalHTTPCache(PersistentCache("http", path=":memory:"))
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = GitHubService(client=client, cache=cache, token_pool=pool)
+        user_data = await service._get_user_data(client, "octo")
+
+    assert user_data == {"login": "octo"}
+    assert used == ["token token-aaaa", "token token-bbbb"]
+
+@pytest.mark.asyncio
+async def test_get_repositories_follows_link_header_and_aggregates_all_pages():
+    """Every page up to the cap is folded into the totals, not just the first 100 repos"""
+    requested_pages = []
+
+    def handler(request: httpx.Request):
+        page = int(request.url.params["page"])
+        requested_pages.append(page)
+        repos = [
+            {
+                "name": f"repo-{page}-{i}",
+                "language": "Go" if page == 3 else "Python",
+                "size": 10,
+                "stargazers_count": 1,
+                "updated_at": f"2024-0{page}-{i + 10:02d}T00:00:00Z"
+            }
+            for i in range(5)
+        ]
+        last = "https://api.github.com/user/1/repos?sort=updated&per_page=100&page=4"
+        return httpx.Response(200, json=repos, headers={"link": f'<{last}>; rel="last"'})
+
+    cache = ConditionalHTTPCache(PersistentCache("http", path=":memory:"))
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = GitHubService(client=client, cache=cache, token_pool=TokenPool([]))
+        service.config = {**service.config, "max_repo_pages": 3, "page_concurrency": 2}
+        aggregate = await service._get_repositories(client, "octo")
+
+    assert sorted(requested_pages) == [1, 2, 3]
+    assert aggregate.truncated
+    assert aggregate.count == 15
+    assert aggregate.total_size == 150
+    assert aggregate.total_stars == 15
+    assert aggregate.languages == {"Python": 10, "Go": 5}
+    assert aggregate.recent_repos[0]["name"] == "repo-3-4"
+
+def test_repo_aggregator_keeps_only_most_recent_repos():
+    """Memory is bounded by `keep`, regardless of how many repos are streamed in"""
+    aggregate = RepoAggregator(keep=3)
+    for page in range(10):
+        aggregate.add_page([{"name": f"r{page}", "updated_at": f"2024-01-{page + 10}", "size": 1}, None])
+
+    assert aggregate.count == 10
+    assert [repo["name"] for repo in aggregate.recent_repos] == ["r9", "r8", "r7"]
+
+def inspection_stub(requests_seen, in_flight, peak):
+    async def handler(request: httpx.Request):
+        path = request.url.path
+        requests_seen.append(path)
+        in_flight.append(path)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.005)
+        in_flight.remove(path)
+        if path.endswith("/readme"):
+            return httpx.Response(200, json={"size": 2048})
+        if path.endswith("/languages"):
+            return httpx.Response(200, json={"Python": 40000, "Shell": 1000})
+        if path.endswith("/contents"):
+            return httpx.Response(200, json=[{"name": "tests"}, {"name": ".github"}, {"name": "setup.py"}])
+        if path.endswith("/contents/.github/workflows"):
+            return httpx.Response(200, json=[{"name": "ci.yml"}])
+        if path.endswith("/stats/participation"):
+            return httpx.Response(200, json={"owner": [0] * 49 + [1, 2, 3]})
+        return httpx.Response(404)
+    return handler
+
+@pytest.mark.asyncio
+async def test_deep_inspection_collects_signals_under_concurrency_limit():
+    """Top repos get README/language/test/CI/activity signals, cached by pushed_at"""
+    seen, in_flight, peak = [], [], []
+    inspection_cache = PersistentCache("repo_inspection", path=":memory:")
+    cache = ConditionalHTTPCache(PersistentCache("http", path=":memory:"))
+    repos = [{"name": f"r{i}", "full_name": f"octo/r{i}", "pushed_at": "2024-05-01"} for i in range(3)]
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(inspection_stub(seen, in_flight, peak))) as client:
+        service = GitHubService(client=client, cache=cache, token_pool=TokenPool([]), inspection_cache=inspection_cache)
+        service.config = {**service.config, "deep_inspection_concurrency": 2}
+        await service._inspect_repositories(client, repos)
+        first_pass_requests = len(seen)
+
+        repeat = [dict(repo) for repo in repos]
+        await service._inspect_repositories(client, repeat)
+        streak = await service._calculate_contribution_streak(client, "octo", repos)
+
+    inspection = repos[0]["inspection"]
+    assert inspection["has_readme"] and inspection["has_tests"] and inspection["has_ci"]
+    assert inspection["language_bytes"] == {"Python": 40000, "Shell": 1000}
+    assert inspection["commits_last_year"] == 6
+    assert max(peak) <= 2
+    assert len(seen) == first_pass_requests
+    assert repeat[2]["inspection"] == inspection
+    assert streak == 21
+
+@pytest.mark.asyncio
+async def test_inspection_with_pending_stats_is_not_cached():
+    seen, in_flight, peak = [], [], []
+    stub = inspection_stub(seen, in_flight, peak)
+    computing = [True]
+
+    async def handler(request: httpx.Request):
+        if request.url.path.endswith("/stats/participation") and computing[0]:
+            return httpx.Response(202, json={})
+        return await stub(request)
+
+    inspection_cache = PersistentCache("repo_inspection", path=":memory:")
+    repos = [{"name": "api", "full_name": "octo/api", "pushed_at": "2024-05-01"}]
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = GitHubService(client=client, token_pool=TokenPool([]), inspection_cache=inspection_cache)
+        await service._inspect_repositories(client, repos)
+        assert repos[0]["inspection"]["has_readme"] and repos[0]["inspection"]["weekly_commits"] == []
+        assert inspection_cache.get("octo/api@2024-05-01") is None
+
+        # The next analysis asks again and caches the computed stats
+        computing[0] = False
+        await service._inspect_repositories(client, repos)
+
+    assert repos[0]["inspection"]["commits_last_year"] == 6
+    assert inspection_cache.get("octo/api@2024-05-01")["commits_last_year"] == 6
+
+@pytest.mark.asyncio
+async def test_cached_commit_activity_is_shifted_to_the_current_week():
+    assert shift_weekly_commits([1, 2, 3, 4], inspected_at=0, now=2.5 * WEEK_SECONDS) == [3, 4, 0, 0]
+    assert shift_weekly_commits([1, 2], inspected_at=0, now=10 * WEEK_SECONDS) == [0, 0]
+
+    inspection_cache = PersistentCache("repo_inspection", path=":memory:")
+    inspection_cache.set("octo/old@2024-01-01", {"has_readme": True, "weekly_commits": [5, 5] + [0] * 46 + [5, 5, 5, 5], "commits_last_year": 30})
+    # Inspected six weeks ago; the repository has not been pushed to since
+    inspection_cache._connect().execute("UPDATE cache SET stored_at = ?", (time.time() - 6 * WEEK_SECONDS,))
+    repos = [{"name": "old", "full_name": "octo/old", "pushed_at": "2024-01-01"}]
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(500))) as client:
+        service = GitHubService(client=client, token_pool=TokenPool([]), inspection_cache=inspection_cache)
+        await service._inspect_repositories(client, repos)
+        streak = await service._calculate_contribution_streak(client, "octo", repos)
+
+    assert repos[0]["inspection"]["weekly_commits"][-6:] == [0] * 6
+    # The oldest two weeks fell out of the year
+    assert repos[0]["inspection"]["commits_last_year"] == 20
+    assert streak == 0
+
+def test_local_quality_score_rewards_maintained_original_repos():
+    """Licensed, documented, recent original work outscores a stale archived fork"""
+    now = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    maintained = {
+        "name": "payments-api", "description": "Payment service", "license": {"key": "mit"},
+        "topics": ["api", "fastapi", "payments"], "fork": False, "archived": False,
+        "stargazers_count": 120, "pushed_at": "2024-05-20T00:00:00Z", "language": "Python",
+        "inspection": {"has_readme": True, "has_tests": True, "has_ci": True}
+    }
+    stale_fork = {
+        "name": "dotfiles", "description": None, "license": None, "topics": [], "fork": True,
+        "archived": True, "stargazers_count": 0, "pushed_at": "2019-01-01T00:00:00Z", "language": None
+    }
+
+    assert score_code_quality([maintained], now) > 90
+    assert score_code_quality([stale_fork], now) < 20
+    assert score_code_quality([], now) == 0.0
+
+def test_domain_relevance_uses_keyword_overlap():
+    """Repos matching the JD domain (directly or via related terms) raise relevance"""
+    repos = [
+        {"name": "pytorch-image-classifier", "description": "CNN model", "language": "Python"},
+        {"name": "dotfiles", "description": "my config", "language": "Shell"}
+    ]
+    assert score_domain_relevance(repos, "Machine Learning") == 50.0
+    assert score_domain_relevance(repos, "Mobile Development") == 0.0
+
+def test_hyphenated_keywords_match_across_separators():
+    assert "react-native" in domain_keywords("Mobile") and "smart-contract" in domain_keywords("Blockchain")
+    for text in ["React Native", "react-native-maps", "react_native"]:
+        assert "react-native" in tokenize(text)
+    assert "smart-contract" in tokenize("Smart contract audits")
+    assert "open-source" in tokenize("Open source maintainer")
+
+def build_tarball(files):
+    """Local stand-in for a codeload archive: gzip tar wrapped in '<repo>-<ref>/'"""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for path, content in files.items():
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo(f"repo-main/{path}")
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+def tarball_transport(payload):
+    async def handler(request: httpx.Request):
+        async def body():
+            for start in range(0, len(payload), 1024):
+                yield payload[start:start + 1024]
+        return httpx.Response(200, content=body(), headers={"content-type": "application/x-gzip"})
+    return httpx.MockTransport(handler)
+
+@pytest.mark.asyncio
+async def test_code_sampling_computes_static_metrics_from_tarball():
+    """Source files are sampled from the streamed archive and measured locally"""
+    payload = build_tarball({
+        "app/main.py": "# entrypoint\ndef main():\n    return run()\n\ndef run():\n    return 1\n",
+        "app/util.js": "// helpers\nfunction add(a, b) {\n  return a + b;\n}\n",
+        "tests/test_main.py": "def test_main():\n    assert True\n",
+        "node_modules/lib/index.js": "function ignored() {}\n",
+        "README.md": "# docs\n"
+    })
+    async with httpx.AsyncClient(transport=tarball_transport(payload)) as client:
+        metrics = await sample_repository_code(client, "https://codeload.github.com/octo/repo/tar.gz/main")
+
+    assert metrics["files_sampled"] == 3
+    assert metrics["source_files_seen"] == 3
+    assert metrics["test_file_ratio"] == round(1 / 3, 3)
+    assert metrics["functions_per_file"] == round(4 / 3, 2)
+    assert 0 < metrics["comment_density"] < 0.5
+    assert not metrics["truncated"]
+
+@pytest.mark.asyncio
+async def test_code_sampling_stops_at_byte_cap():
+    """A large archive is cut off at the cap and whatever was sampled is kept"""
+    files = {f"src/module_{i}.py": f"def f{i}():\n    return {i}\n" + "x = 1\n" * 400 for i in range(200)}
+    payload = build_tarball(files)
+    async with httpx.AsyncClient(transport=tarball_transport(payload)) as client:
+        metrics = await sample_repository_code(
+            client, "https://codeload.github.com/octo/repo/tar.gz/main", max_bytes=len(payload) // 4, max_files=5
+        )
+
+    assert metrics["truncated"]
+    assert metrics["bytes_read"] == len(payload) // 4
+    assert 0 < metrics["source_files_seen"] < 200
+    assert metrics["files_sampled"] == 5
+
+def test_parse_repository_url():
+    from app.services.github_service import parse_repository_url
+
+    assert parse_repository_url("https://github.com/octo/shop-api") == ("octo", "shop-api")
+    assert parse_repository_url("github.com/octo/shop-api.git") == ("octo", "shop-api")
+    assert parse_repository_url("https://www.github.com/octo/site.github.io/blob/main/README.md") == ("octo", "site.github.io")
+    assert parse_repository_url("https://github.com/octo") is None
+    assert parse_repository_url("https://github.com/topics/python") is None
+    assert parse_repository_url("https://octo.github.io/shop") is None
@@ -0,0 +1,61 @@
+import pytest
+import asyncio
+import httpx
+from app.utils.http_client import HostLimitedTransport, HTTPClientManager
+
+@pytest.mark.asyncio
+async def test_host_limited_transport_caps_per_host_concurrency():
+    """Requests to one host never exceed the per-host cap, other hosts are unaffected"""
+    in_flight = {}
+    peak = {}
+
+    async def handler(request: httpx.Request):
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200, text="ok")
+
+    transport = HostLimitedTransport(httpx.MockTransport(handler), max_per_host=2)
+    async with httpx.AsyncClient(transport=transport) as client:
+        urls = ["https://a.example/"] * 6 + ["https://b.example/"] * 3
+        responses = await asyncio.gather(*[client.get(url) for url in urls])
+
+    assert all(r.status_code == 200 for r in responses)
+    assert peak["a.example"] == 2
+    assert peak["b.example"] == 2
+    assert transport.in_flight() == {}
+
+@pytest.mark.asyncio
+async def test_host_limited_transport_drops_idle_host_semaphores():
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request):
+        if request.url.host == "slow.example":
+            await release.wait()
+        return httpx.Response(200, text="ok")
+
+    transport = HostLimitedTransport(httpx.MockTransport(handler), max_per_host=2, max_hosts=2)
+    async with httpx.AsyncClient(transport=transport) as client:
+        slow = asyncio.create_task(client.get("https://slow.example/"))
+        await asyncio.sleep(0.01)
+        for index in range(4):
+            await client.get(f"https://site{index}.example/")
+        assert transport.tracked_hosts() <= 2 and transport.in_flight() == {"slow.example": 1}
+        release.set()
+        await slow
+
+@pytest.mark.asyncio
+async def test_client_manager_reuses_client_within_loop():
+    """The manager hands out one pooled client until it is closed"""
+    client_manager = HTTPClientManager()
+    await client_manager.start()
+    first = client_manager.get_client()
+    assert client_manager.get_client() is first
+    assert client_manager.get_stats()["active"]
+
+    await client_manager.close()
+    assert first.is_closed
+    assert client_manager.get_client() is not first
+    await client_manager.close()
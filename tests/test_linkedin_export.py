@@ -0,0 +1,135 @@
+import io
+import zipfile
+import httpx
+import pytest
+from app.services.linkedin_service import LinkedInService
+from app.utils.linkedin_export import parse_linkedin_export
+
+EXPORT_FILES = {
+    "Profile.csv": "First Name,Last Name,Headline,Summary\nJane,Doe,ML Engineer,Building pytorch models\n",
+    "Positions.csv": (
+        "Company Name,Title,Description,Location,Started On,Finished On\n"
+        'Acme,Machine Learning Engineer,"Trained neural ranking models, shipped to prod",Remote,Jan 2021,\n'
+        "Shop,Store Manager,Managed staff,Berlin,Mar 2017,Dec 2020\n"
+    ),
+    "Certifications.csv": "Name,Url,Authority,Started On,Finished On\nTensorFlow Developer,,Google,2022,\n",
+    "Endorsement_Received_Info.csv": (
+        "Endorsement Date,Skill Name,Endorser First Name,Endorser Last Name,Endorsement Status\n"
+        "2023/01/01,Machine Learning,A,B,ACCEPTED\n2023/01/02,Machine Learning,C,D,ACCEPTED\n"
+        "2023/01/03,Python,E,F,ACCEPTED\n2023/01/04,Sales,G,H,REJECTED\n"
+    ),
+    "Skills.csv": "Name\nPython\nPyTorch\nLeadership\n",
+    "Connections.csv": (
+        "Notes:\n\"When exporting your connection data, you may notice that some of the email addresses are missing.\"\n\n"
+        "First Name,Last Name,URL,Email Address,Company,Position,Connected On\n"
+        "A,B,https://www.linkedin.com/in/a,,X,Y,01 Jan 2023\nC,D,https://www.linkedin.com/in/c,,X,Y,02 Jan 2023\n"
+    ),
+    "Shares.csv": (
+        "Date,ShareLink,ShareCommentary,SharedUrl,MediaUrl,Visibility\n"
+        '2024-01-01,https://lnkd.in/1,"New post on pytorch model distillation",,,MEMBER_NETWORK\n'
+        '2024-02-01,https://lnkd.in/2,"Happy to share I started a new job!",,,MEMBER_NETWORK\n'
+    )
+}
+
+PROFILE_LINES = [
+    "Contact", "www.linkedin.com/in/jane", "Top Skills", "PyTorch", "Kubernetes",
+    "Jane Doe", "Machine Learning Engineer at Acme", "Berlin, Germany", "Experience", "Acme",
+    "Machine Learning Engineer", "January 2021 - Present (3 years)", "Page 1 of 1"
+]
+
+def build_export_zip(files=EXPORT_FILES) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, text in files.items():
+            archive.writestr(f"Basic_LinkedInDataExport_05-01-2024/{name}", text)
+    return buffer.getvalue()
+
+def build_profile_pdf(lines) -> bytes:
+    """Single-page PDF with one text line per entry"""
+    text = "BT /F1 11 Tf 14 TL 50 780 Td " + " ".join(f"({line}) Tj T*" for line in lines) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        "/Resources << /Font << /F1 5 0 R >> >> >>",
+        f"<< /Length {len(text)} >>\nstream\n{text}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    ]
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return pdf
+
+def test_parse_data_export_zip():
+    export = parse_linkedin_export(build_export_zip())
+
+    assert export["source"] == "data_export"
+    assert export["headline"] == "ML Engineer"
+    assert [position["company"] for position in export["positions"]] == ["Acme", "Shop"]
+    assert export["positions"][0]["description"] == "Trained neural ranking models, shipped to prod"
+    assert export["certifications"] == ["TensorFlow Developer (Google)"]
+    # Sorted by endorsement count, rejected endorsements dropped
+    assert export["endorsements"] == ["Machine Learning", "Python"]
+    assert export["skills"] == ["Python", "PyTorch", "Leadership"]
+    # The free-text preamble of Connections.csv is skipped
+    assert export["connections"] == 2
+    assert len(export["posts"]) == 2
+
+def test_parse_profile_pdf():
+    export = parse_linkedin_export(build_profile_pdf(PROFILE_LINES))
+
+    assert export["source"] == "profile_pdf"
+    assert export["skills"] == ["PyTorch", "Kubernetes"]
+    assert export["headline"] == "Machine Learning Engineer at Acme"
+    assert export["positions"] == [{
+        "title": "Machine Learning Engineer",
+        "company": "Acme",
+        "description": "",
+        "started_on": "January 2021",
+        "finished_on": "Present"
+    }]
+
+def test_parse_export_from_path(tmp_path):
+    path = tmp_path / "export.zip"
+    path.write_bytes(build_export_zip())
+
+    assert parse_linkedin_export(str(path))["headline"] == "ML Engineer"
+
+def test_export_upload_is_size_limited(monkeypatch):
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    monkeypatch.setenv("UPLOAD_MAX_BYTES", "4096")
+    # Declared length is within the multipart allowance, so the endpoint has to stop it
+    response = TestClient(app).post("/api/linkedin-export", files={"file": ("export.zip", b"PK\x03\x04" + b"0" * 8000)})
+
+    assert response.status_code == 413
+
+def test_parse_rejects_other_files():
+    with pytest.raises(ValueError):
+        parse_linkedin_export(b"First Name,Last Name\n")
+
+def test_analyze_export_scores_without_requests():
+    def handler(request):
+        raise AssertionError(f"unexpected request to {request.url}")
+
+    service = LinkedInService(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    analysis = service.analyze_export(parse_linkedin_export(build_export_zip()), "Machine Learning")
+
+    assert analysis.source == "data_export"
+    assert analysis.technical_posts_count == 1 and analysis.domain_relevant_posts == 1
+    assert analysis.connections == 2
+    assert analysis.certifications == ["TensorFlow Developer (Google)"]
+    # Half the posts and positions, the certification, and two of three needed skills match
+    assert analysis.domain_relevance_score == 60.0
+
+    pdf_analysis = service.analyze_export(parse_linkedin_export(build_profile_pdf(PROFILE_LINES)), "Machine Learning")
+    # No posts in the PDF: the position and one of two skills carry the score
+    assert pdf_analysis.technical_posts_count == 0
+    assert pdf_analysis.domain_relevance_score == 83.3
@@ -0,0 +1,75 @@
+import pytest
+import httpx
+from app.services.medium_service import MediumService
+from app.utils.cache import PersistentCache
+from app.utils.feed_parser import stream_feed_items
+
+def build_feed(items, build_date="Mon, 06 May 2024 10:00:00 GMT"):
+    head = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+        f'<channel><title>Stories by Jane</title><lastBuildDate>{build_date}</lastBuildDate>'
+    )
+    body = [
+        f'<item><title>Post {i}</title><link>https://medium.com/@jane/post-{i}</link>'
+        f'<category>python</category><category>ml</category><pubDate>Mon, 0{i % 9 + 1} Apr 2024</pubDate>'
+        f'<content:encoded><![CDATA[<h3>Post {i}</h3><p>Training <b>models</b> at scale, part {i}.</p>'
+        f'{"<p>filler</p>" * 200}]]></content:encoded></item>'
+        for i in range(items)
+    ]
+    return [head.encode()] + [item.encode() for item in body] + [b"</channel></rss>"]
+
+class FeedStream(httpx.AsyncByteStream):
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.sent = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+def feed_transport(feeds, streams):
+    def handler(request):
+        stream = FeedStream(feeds["chunks"])
+        streams.append(stream)
+        return httpx.Response(200, headers={"content-type": "text/xml"}, stream=stream)
+    return httpx.MockTransport(handler)
+
+@pytest.mark.asyncio
+async def test_feed_parsing_stops_after_max_items():
+    streams = []
+    async with httpx.AsyncClient(transport=feed_transport({"chunks": build_feed(50)}, streams)) as client:
+        feed = await stream_feed_items(client, "https://medium.com/feed/@jane", max_items=3)
+
+    assert [item["title"] for item in feed["items"]] == ["Post 0", "Post 1", "Post 2"]
+    assert feed["items"][0]["categories"] == ["python", "ml"]
+    assert feed["items"][0]["excerpt"].startswith("Post 0 Training models at scale")
+    assert feed["last_build_date"] == "Mon, 06 May 2024 10:00:00 GMT"
+    assert streams[0].sent == 4
+
+@pytest.mark.asyncio
+async def test_medium_analysis_cached_per_user_on_build_date(monkeypatch):
+    """An unchanged feed is abandoned after lastBuildDate; each domain costs one LLM call"""
+    streams = []
+    feeds = {"chunks": build_feed(12)}
+    llm_calls = []
+
+    async def fake_relevance(articles, domain):
+        llm_calls.append((len(articles), domain))
+        return {"domain_relevant": 2, "total_claps": 0, "followers": 0, "relevance_score": 80.0}
+
+    async with httpx.AsyncClient(transport=feed_transport(feeds, streams)) as client:
+        service = MediumService(client=client, cache=PersistentCache("medium_feed", path=":memory:"))
+        monkeypatch.setattr(service, "_analyze_articles", fake_relevance)
+
+        first = await service.analyze_profile("@jane", "Machine Learning")
+        repeat = await service.analyze_profile("jane", "Machine Learning")
+        other_domain = await service.analyze_profile("jane", "Backend")
+        feeds["chunks"] = build_feed(12, build_date="Tue, 07 May 2024 10:00:00 GMT")
+        await service.analyze_profile("jane", "Machine Learning")
+
+    assert first.articles_count == 10 and first.domain_relevance_score == 80.0
+    assert repeat.articles_count == 10 and other_domain.articles_count == 10
+    assert streams[1].sent == 1 and streams[2].sent == 1
+    assert llm_calls == [(10, "Machine Learning"), (10, "Backend"), (10, "Machine Learning")]
@@ -0,0 +1,89 @@
+import pytest
+import httpx
+from app.services.github_service import GitHubService
+from app.services.project_service import ProjectService
+from app.utils.cache import ConditionalHTTPCache, PersistentCache
+from app.utils.negative_cache import BloomFilter, NegativeCache
+from app.utils.token_pool import TokenPool
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"user-{i}")
+
+    assert all(f"user-{i}" in bloom for i in range(1000))
+    false_positives = sum(1 for i in range(1000, 11000) if f"user-{i}" in bloom)
+    assert false_positives < 300
+
+def test_negative_cache_skips_store_for_unknown_keys(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = NegativeCache("missing", bloom_capacity=1000, path=path)
+    cache.mark_missing("@Ghost-User")
+
+    assert cache.is_missing("ghost-user")
+    assert not cache.is_missing("octocat")
+    assert cache.get_metrics()["bloom_skips"] == 1
+
+    # A new process rebuilds its filter from the persisted entries
+    reloaded = NegativeCache("missing", bloom_capacity=1000, path=path)
+    assert reloaded.is_missing("GHOST-USER")
+
+    expired = NegativeCache("missing", max_age=1e-9, path=path)
+    assert not expired.is_missing("ghost-user")
+
+def test_case_sensitive_negative_cache_keeps_url_paths_apart():
+    urls = NegativeCache("missing_urls", path=":memory:", case_sensitive=True)
+    urls.mark_missing("https://host.example/Foo")
+
+    assert urls.is_missing("https://host.example/Foo")
+    assert not urls.is_missing("https://host.example/foo")
+
+@pytest.mark.asyncio
+async def test_missing_github_user_short_circuits_analysis():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        return httpx.Response(404, json={"message": "Not Found"})
+
+    missing = NegativeCache("missing_github_users", path=":memory:")
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = GitHubService(
+            client=client,
+            cache=ConditionalHTTPCache(PersistentCache("http", path=":memory:")),
+            token_pool=TokenPool([]),
+            missing_users=missing
+        )
+
+        async def unexpected(*args):
+            raise AssertionError("scored a profile that does not exist")
+
+        service._analyze_project_complexity = unexpected
+        first = await service.analyze_profile("ghost", "Backend")
+        requests_after_first = len(seen)
+        second = await service.analyze_profile("Ghost", "Backend")
+
+    assert first.unavailable_reason == second.unavailable_reason == "not_found"
+    assert "/users/ghost" in seen
+    # The repeat is answered from the negative cache without a request
+    assert len(seen) == requests_after_first
+
+@pytest.mark.asyncio
+async def test_gone_project_url_is_not_fetched_again():
+    seen = []
+
+    def handler(request):
+        seen.append(str(request.url))
+        return httpx.Response(404, headers={"content-type": "text/html"}, text="<html><head><title>404</title></head></html>")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = ProjectService(
+            client=client,
+            analysis_cache=PersistentCache("project_analysis", path=":memory:"),
+            missing_urls=NegativeCache("missing_project_urls", path=":memory:", case_sensitive=True)
+        )
+        first = await service.evaluate_project({"name": "Old", "url": "https://old.example/app/"})
+        second = await service.evaluate_project({"name": "Old", "url": "https://old.example/app?utm_source=cv"})
+
+    assert not first.is_live and not second.is_live
+    assert len(seen) == 1
@@ -0,0 +1,70 @@
+import pytest
+import httpx
+from app.utils.page_fetcher import fetch_page
+
+class CountingStream(httpx.AsyncByteStream):
+    """Response body that records how many chunks were actually pulled"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.sent = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+def streaming_client(stream, status_code=200, content_type="text/html; charset=utf-8"):
+    def handler(request):
+        return httpx.Response(status_code, headers={"content-type": content_type}, stream=stream)
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+@pytest.mark.asyncio
+async def test_fetch_page_stops_at_byte_ceiling():
+    """A huge page is cut at the cap without pulling the rest of the body"""
+    stream = CountingStream([b"<html><body>" + b"x" * 1024] * 1000)
+    async with streaming_client(stream) as client:
+        page = await fetch_page(client, "https://big.example/", max_bytes=4096)
+
+    assert page.truncated
+    assert len(page.content) == 4096
+    assert stream.sent < 10
+    assert page.text.startswith("<html><body>")
+
+@pytest.mark.asyncio
+async def test_fetch_page_skips_non_html_content():
+    """A video link is abandoned after the headers"""
+    stream = CountingStream([b"\x00" * 65536] * 100)
+    async with streaming_client(stream, content_type="video/mp4") as client:
+        page = await fetch_page(client, "https://cdn.example/demo.mp4")
+
+    assert not page.is_html
+    assert page.content == b""
+    assert stream.sent == 0
+    assert page.status_code == 200
+
+@pytest.mark.asyncio
+async def test_fetch_page_head_fast_path():
+    """Head-only fetches stop once the head has closed, even across chunk boundaries"""
+    chunks = [
+        b"<html><head><title>Site</title><meta name='viewport' content='width=device-width'></he",
+        b"ad><body>",
+        b"<p>" + b"y" * 4096 + b"</p>" * 50
+    ]
+    stream = CountingStream(chunks)
+    async with streaming_client(stream) as client:
+        page = await fetch_page(client, "https://site.example/", head_only=True)
+
+    assert page.head_only and not page.truncated
+    assert stream.sent == 2
+    assert "<title>Site</title>" in page.text
+
+@pytest.mark.asyncio
+async def test_fetch_page_reads_only_head_of_error_pages():
+    stream = CountingStream([b"<html><head><title>Not found</title></head>", b"<body>" + b"z" * 4096])
+    async with streaming_client(stream, status_code=404) as client:
+        page = await fetch_page(client, "https://gone.example/", error_head_only=True)
+
+    assert page.status_code == 404
+    assert page.head_only
+    assert stream.sent == 1
@@ -0,0 +1,72 @@
+import pytest
+import httpx
+from app.utils.cache import PersistentCache
+from app.utils.html_analyzer import analyze_html
+from app.utils.page_weight import measure_page_weight, probe_resource
+from tests.conftest import FIXTURE_SITES
+
+def site_url(server, path=""):
+    return f"http://127.0.0.1:{server.server_address[1]}/{path}"
+
+@pytest.mark.asyncio
+async def test_probe_resource_uses_head_and_ranged_get_fallback(fixture_site_server):
+    async with httpx.AsyncClient() as client:
+        script = await probe_resource(client, site_url(fixture_site_server, "portfolio/js/app.js"))
+        image = await probe_resource(client, site_url(fixture_site_server, "portfolio/img/hero.png"))
+
+    assert script["method"] == "HEAD" and script["encoding"] == "gzip"
+    assert 0 < script["bytes"] < (FIXTURE_SITES / "portfolio/js/app.js").stat().st_size
+    assert script["ttfb"] is not None
+    # HEAD is rejected for images, the one-byte range reveals the full size
+    assert image["method"] == "GET"
+    assert image["bytes"] == (FIXTURE_SITES / "portfolio/img/hero.png").stat().st_size
+    assert ("GET", "/portfolio/img/hero.png") in fixture_site_server.requests
+
+@pytest.mark.asyncio
+async def test_measure_page_weight_against_fixture_site(fixture_site_server):
+    page_url = site_url(fixture_site_server, "portfolio/index.html")
+    html = (FIXTURE_SITES / "portfolio/index.html").read_text()
+    page = analyze_html(html)
+    cache = PersistentCache("subresource_probe", path=":memory:")
+
+    async with httpx.AsyncClient() as client:
+        weight = await measure_page_weight(client, page_url, page["resources"], len(html), concurrency=2, cache=cache)
+        requests_before = len(fixture_site_server.requests)
+        again = await measure_page_weight(client, page_url, page["resources"], len(html), cache=cache)
+
+    # app.js and hero.png are referenced twice but probed once (a query string is a distinct URL)
+    assert weight["resources_probed"] == 7
+    assert weight["failed"] == 1
+    assert weight["render_blocking"] == 2
+    assert weight["bytes_by_type"]["image"] == (FIXTURE_SITES / "portfolio/img/hero.png").stat().st_size
+    assert weight["compressed_text_resources"] == 2
+    assert weight["uncompressed_text_resources"] == 1
+    assert weight["total_bytes"] > len(html) + weight["bytes_by_type"]["image"]
+    # Successful probes are served from the per-URL cache, the failed one is retried
+    assert again["cache_hits"] == 6
+    assert len(fixture_site_server.requests) - requests_before == 1
+    assert again["total_bytes"] == weight["total_bytes"]
+
+@pytest.mark.asyncio
+async def test_project_performance_uses_measured_page_weight(fixture_site_server, monkeypatch):
+    from app.services.project_service import ProjectService
+
+    async def no_llm(project, page):
+        return 50.0
+
+    async with httpx.AsyncClient() as client:
+        service = ProjectService(
+            client=client,
+            probe_cache=PersistentCache("subresource_probe", path=":memory:"),
+            analysis_cache=PersistentCache("project_analysis", path=":memory:")
+        )
+        service.config = {**service.config, "page_weight": True}
+        monkeypatch.setattr(service, "_analyze_complexity", no_llm)
+        analysis = await service.evaluate_project({
+            "name": "portfolio", "url": site_url(fixture_site_server, "portfolio/")
+        })
+
+    assert analysis.is_live
+    assert analysis.page_weight["resources_probed"] == 7
+    # One uncompressed stylesheet and one broken image
+    assert analysis.performance_score == 85
@@ -0,0 +1,104 @@
+import pytest
+import asyncio
+import httpx
+from app.services.github_service import GitHubService
+from app.utils.cache import ConditionalHTTPCache, PersistentCache
+from app.utils.negative_cache import NegativeCache
+from app.utils.prefetch import MISS, PrefetchCache, prefetch_key, prefetch_resume_profiles
+from app.utils.token_pool import TokenPool
+
+@pytest.mark.asyncio
+async def test_prefetch_is_shared_and_expires_unused():
+    cache = PrefetchCache(ttl=0.05)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"user": "octo"}
+
+    assert cache.start(prefetch_key("github", "@Octo"), fetch)
+    assert not cache.start(prefetch_key("github", "octo"), fetch)
+    # Joins the running fetch, then reuses its result
+    assert await cache.get(prefetch_key("github", "octo")) == {"user": "octo"}
+    assert await cache.get(prefetch_key("github", "OCTO")) == {"user": "octo"}
+    assert await cache.get(prefetch_key("twitter", "octo")) is MISS
+    assert len(calls) == 1
+
+    await asyncio.sleep(0.06)
+    assert await cache.get(prefetch_key("github", "octo")) is MISS
+
+    async def broken():
+        raise RuntimeError("upstream down")
+
+    cache.start(prefetch_key("medium", "jane"), broken)
+    assert await cache.get(prefetch_key("medium", "jane")) is MISS
+    assert cache.get_metrics() == {"started": 2, "used": 2, "expired": 1, "failed": 1, "skipped": 1, "entries": 0}
+
+@pytest.mark.asyncio
+async def test_github_analysis_reuses_prefetched_collection():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        if request.url.path == "/users/octo":
+            return httpx.Response(200, json={"login": "octo", "public_repos": 1, "followers": 5, "following": 0})
+        if request.url.path == "/users/octo/repos":
+            return httpx.Response(200, json=[{
+                "name": "api", "full_name": "octo/api", "language": "Python", "size": 10,
+                "stargazers_count": 2, "updated_at": "2024-01-01T00:00:00Z", "pushed_at": "2024-01-01T00:00:00Z"
+            }])
+        return httpx.Response(200, json=[])
+
+    prefetch = PrefetchCache(ttl=60)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = GitHubService(
+            client=client,
+            cache=ConditionalHTTPCache(PersistentCache("http", path=":memory:")),
+            token_pool=TokenPool([]),
+            missing_users=NegativeCache("missing_github_users", path=":memory:"),
+            prefetch=prefetch
+        )
+        service.config = {**service.config, "llm_scoring": False, "deep_inspection": False, "code_sampling": False}
+
+        async def complexity(repos):
+            return 40.0
+
+        service._analyze_project_complexity = complexity
+        prefetch.start(prefetch_key("github", "octo"), lambda: service.collect_profile("octo"))
+        await asyncio.sleep(0.05)
+        requests_after_prefetch = len(seen)
+        analysis = await service.analyze_profile("octo", "Backend")
+
+    assert "/users/octo" in seen
+    # Scoring ran entirely on the prefetched data
+    assert len(seen) == requests_after_prefetch
+    assert analysis.followers == 5 and analysis.languages == {"Python": 1}
+    assert analysis.unavailable_reason is None
+    assert prefetch.get_metrics()["used"] == 1
+
+class RecordingPrefetch:
+    def __init__(self):
+        self.keys = []
+
+    def start(self, key, fetch):
+        self.keys.append(key)
+        return True
+
+def test_resume_prefetch_uses_profile_usernames_and_project_links():
+    cache = RecordingPrefetch()
+    scheduled = prefetch_resume_profiles([
+        {"platform": "github", "url": "https://github.com/jane-doe/billing-service"},
+        {"platform": "github", "url": "https://github.com/jane-doe"},
+        {"platform": "medium", "url": "https://medium.com/@jane.doe"},
+        {"platform": "linkedin", "url": "https://linkedin.com/in/janedoe"}
+    ], [
+        {"name": "Portfolio", "url": "https://Jane.dev/Work/?utm_source=cv"},
+        {"name": "Billing", "url": "https://github.com/jane-doe/billing-service"},
+        {"name": "Idea"}
+    ], cache=cache)
+
+    assert scheduled == cache.keys == [
+        ("github", "jane-doe"), ("medium", "jane.doe"),
+        ("project", "https://jane.dev/Work"), ("project", "https://github.com/jane-doe/billing-service")
+    ]
@@ -0,0 +1,70 @@
+import pytest
+import asyncio
+import os
+import time
+from concurrent.futures.process import BrokenProcessPool
+from app.utils.process_pool import get_process_pool_metrics, run_in_process, shutdown_process_pool
+
+def slow_square(value, seconds):
+    time.sleep(seconds)
+    return value * value
+
+@pytest.mark.asyncio
+async def test_run_in_process_times_out_and_recycles_stuck_pool():
+    try:
+        assert await run_in_process(slow_square, 3, 0, pool="test", timeout=10) == 9
+
+        started = time.perf_counter()
+        with pytest.raises(asyncio.TimeoutError):
+            await run_in_process(slow_square, 3, 30, pool="test", timeout=0.5)
+        # The caller is released at the deadline, not when the worker finishes
+        assert time.perf_counter() - started < 5
+        metrics = get_process_pool_metrics()
+        assert metrics["timeouts"] >= 1 and metrics["recycled"] >= 1
+
+        # A fresh pool replaces the one whose worker was stuck
+        assert await run_in_process(slow_square, 4, 0, pool="test", timeout=10) == 16
+    finally:
+        shutdown_process_pool()
+
+def crash_once(marker):
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    return "parsed"
+
+def crash():
+    os._exit(1)
+
+@pytest.mark.asyncio
+async def test_crashed_worker_pool_is_replaced_and_the_call_retried(tmp_path):
+    try:
+        # The first attempt kills its worker; the retry runs on a fresh pool
+        assert await run_in_process(crash_once, str(tmp_path / "crashed"), pool="test", timeout=10) == "parsed"
+
+        with pytest.raises(BrokenProcessPool):
+            await run_in_process(crash, pool="test", timeout=10)
+        # A job that crashes every time does not take later calls down with it
+        assert await run_in_process(slow_square, 5, 0, pool="test", timeout=10) == 25
+        assert get_process_pool_metrics()["broken"] >= 3
+    finally:
+        shutdown_process_pool()
+
+@pytest.mark.asyncio
+async def test_timeout_lets_other_jobs_on_the_stuck_pool_finish(monkeypatch):
+    monkeypatch.setenv("PROCESS_POOL_WORKERS", "2")
+    try:
+        recycled = get_process_pool_metrics()["recycled"]
+        neighbour = asyncio.create_task(run_in_process(slow_square, 6, 1.5, pool="test", timeout=10))
+        await asyncio.sleep(0.2)
+        with pytest.raises(asyncio.TimeoutError):
+            await run_in_process(slow_square, 3, 30, pool="test", timeout=0.5)
+
+        # The stuck pool stays up for the parse still running on it
+        assert get_process_pool_metrics()["retiring"] == 1
+        assert await neighbour == 36
+        await asyncio.sleep(0.1)
+        metrics = get_process_pool_metrics()
+        assert metrics["retiring"] == 0 and metrics["recycled"] == recycled + 1
+    finally:
+        shutdown_process_pool()
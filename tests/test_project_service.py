@@ -0,0 +1,293 @@
+import pytest
+import asyncio
+import httpx
+from app.models.schemas import ProjectAnalysis
+from app.services.project_service import ProjectService
+from app.utils.cache import PersistentCache, normalize_url
+
+def fake_analysis(project):
+    return ProjectAnalysis(
+        project_name=project["name"],
+        is_live=True,
+        url=project["url"],
+        technologies=[],
+        complexity_score=50.0,
+        responsiveness_score=50.0,
+        seo_score=50.0,
+        performance_score=50.0,
+        error_count=0
+    )
+
+@pytest.mark.asyncio
+async def test_evaluate_projects_runs_concurrently_with_per_host_limit(monkeypatch):
+    """Projects overlap in time but never exceed the per-host cap"""
+    in_flight = {}
+    peak = {}
+
+    async def fake_evaluate(project):
+        host = project["url"].split("/")[2]
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.05)
+        in_flight[host] -= 1
+        return fake_analysis(project)
+
+    service = ProjectService()
+    service.config = {"concurrency": 4, "per_host_concurrency": 1, "stage_deadline": 5}
+    monkeypatch.setattr(service, "evaluate_project", fake_evaluate)
+    projects = [{"name": f"p{i}", "url": f"https://{'a' if i < 3 else 'b'}.example/{i}"} for i in range(5)]
+
+    started = asyncio.get_running_loop().time()
+    analyses = await service.evaluate_projects(projects)
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert [a.project_name for a in analyses] == ["p0", "p1", "p2", "p3", "p4"]
+    assert peak == {"a.example": 1, "b.example": 1}
+    assert elapsed < 0.05 * 5
+
+@pytest.mark.asyncio
+async def test_evaluate_projects_keeps_completed_results_at_deadline(monkeypatch):
+    """A slow project is dropped at the deadline instead of discarding everything"""
+    async def fake_evaluate(project):
+        await asyncio.sleep(10 if project["name"] == "slow" else 0.01)
+        return fake_analysis(project)
+
+    service = ProjectService()
+    monkeypatch.setattr(service, "evaluate_project", fake_evaluate)
+    projects = [
+        {"name": "fast", "url": "https://fast.example"},
+        {"name": "slow", "url": "https://slow.example"},
+        {"name": "also-fast", "url": "https://other.example"}
+    ]
+
+    analyses = await service.evaluate_projects(projects, deadline=0.2)
+
+    assert [a.project_name for a in analyses] == ["fast", "also-fast"]
+
+SAMPLE_PAGE = """<!DOCTYPE html><html><head><title> Portfolio </title>
+<meta name="viewport" content="width=device-width">
+<meta name="description" content="My work">
+<meta name="generator" content="WordPress 6.4">
+<link rel="canonical" href="https://me.example/">
+<link rel="stylesheet" href="/site.css">
+<style>@media (max-width: 600px) { body { margin: 0 } }</style>
+<script src="/js/react.production.min.js"></script>
+<script>window.__state = "<h1>not a heading</h1>"</script>
+<script type="application/ld+json">{}</script>
+</head><body><div class="container"><h1>Hello</h1>
+<img src="/img/hero.png" alt="hero" class="img-responsive">
+<img src="" alt="">
+<a href="#">top</a><a href="/about">About</a>
+<p style="color: red">Tailwind fan</p></div></body></html>"""
+
+def test_analyze_html_collects_all_features_in_one_pass():
+    from app.utils.html_analyzer import analyze_html
+
+    page = analyze_html(SAMPLE_PAGE)
+
+    assert page["title"].strip() == "Portfolio"
+    assert page["script_srcs"] == ["/js/react.production.min.js"]
+    assert page["script_count"] == 3
+    assert page["ld_json_count"] == 1
+    assert page["generator"].startswith("wordpress")
+    assert page["h1_count"] == 1
+    assert page["img_count"] == 2 and page["img_with_alt"] == 2 and page["img_missing_alt"] == 1
+    assert page["img_missing_src"] == 1 and page["broken_links"] == 1
+    assert page["style_has_media_query"] and page["responsive_images"] and page["grid_classes"]
+    assert page["mentions"]["tailwind"] and not page["mentions"]["nuxt"]
+    assert "Hello" in page["text_preview"] and "__state" not in page["text_preview"]
+
+@pytest.mark.asyncio
+async def test_page_scores_from_single_pass_features():
+    from app.utils.html_analyzer import analyze_html
+
+    service = ProjectService()
+    page = analyze_html(SAMPLE_PAGE)
+
+    assert sorted(await service._detect_technologies(page)) == ["React", "TailwindCSS", "WordPress"]
+    assert await service._check_responsiveness(page) == 100
+    assert await service._analyze_seo(page) == 90
+    assert await service._count_errors(page) == 3
+
+def test_analyze_html_tolerates_empty_and_broken_markup():
+    from app.utils.html_analyzer import analyze_html
+
+    assert analyze_html("")["img_count"] == 0
+    assert analyze_html("<div><img src='a.png'<p>unclosed")["title"] == ""
+
+@pytest.mark.asyncio
+async def test_evaluate_project_scores_streamed_page(monkeypatch):
+    """The project page is streamed through the capped fetcher and analyzed"""
+
+    async def no_llm(project, page):
+        return 50.0
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(
+        200, headers={"content-type": "text/html"}, text=SAMPLE_PAGE
+    ))
+    async with httpx.AsyncClient(transport=transport) as client:
+        service = ProjectService(client=client, analysis_cache=PersistentCache("project_analysis", path=":memory:"))
+        monkeypatch.setattr(service, "_analyze_complexity", no_llm)
+        analysis = await service.evaluate_project({"name": "site", "url": "https://me.example/"})
+
+    assert analysis.is_live
+    assert analysis.seo_score == 90
+    assert "React" in analysis.technologies
+
+def cached_service(client, monkeypatch, llm_calls):
+    async def counting_llm(project, page):
+        llm_calls.append(project["name"])
+        return 70.0
+
+    service = ProjectService(client=client, analysis_cache=PersistentCache("project_analysis", path=":memory:"))
+    monkeypatch.setattr(service, "_analyze_complexity", counting_llm)
+    return service
+
+@pytest.mark.asyncio
+async def test_project_analysis_cache_serves_fresh_hits_without_fetching(monkeypatch):
+    """A URL seen on an earlier resume is served from the cache, under the new project name"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, headers={"content-type": "text/html", "etag": '"v1"'}, text=SAMPLE_PAGE)
+
+    llm_calls = []
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = cached_service(client, monkeypatch, llm_calls)
+        first = await service.evaluate_project({"name": "Capstone", "url": "https://Bootcamp.example/capstone/"})
+        second = await service.evaluate_project({"name": "My capstone", "url": "https://bootcamp.example/capstone?utm_source=cv"})
+
+    assert len(requests) == 1 and llm_calls == ["Capstone"]
+    assert second.project_name == "My capstone"
+    assert second.complexity_score == first.complexity_score == 70.0
+    assert service.cache_stats == {"hits": 1, "revalidated": 0, "misses": 1}
+
+@pytest.mark.asyncio
+async def test_project_analysis_cache_revalidates_after_ttl(monkeypatch):
+    """Stale entries are revalidated with a conditional GET; a 304 skips re-scoring"""
+    version = {"etag": '"v1"'}
+    conditional = []
+
+    def handler(request):
+        conditional.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == version["etag"]:
+            return httpx.Response(304, headers={"etag": version["etag"]})
+        return httpx.Response(200, headers={"content-type": "text/html", "etag": version["etag"]}, text=SAMPLE_PAGE)
+
+    llm_calls = []
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = cached_service(client, monkeypatch, llm_calls)
+        service.config = {**service.config, "analysis_cache_ttl": 0}
+        project = {"name": "Site", "url": "https://me.example/"}
+        await service.evaluate_project(project)
+        revalidated = await service.evaluate_project(project)
+        version["etag"] = '"v2"'
+        changed = await service.evaluate_project(project)
+
+    assert conditional == [None, '"v1"', '"v1"']
+    assert revalidated.is_live and revalidated.seo_score == 90
+    assert changed.is_live
+    assert llm_calls == ["Site", "Site"]
+    assert service.cache_stats == {"hits": 0, "revalidated": 1, "misses": 2}
+
+@pytest.mark.asyncio
+async def test_prefetched_project_page_is_scored_without_fetching_again(monkeypatch):
+    """Upload prefetch fetches and parses the page; the model call waits for the analysis"""
+    from app.utils.prefetch import PrefetchCache, project_prefetch_key
+
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, headers={"content-type": "text/html"}, text=SAMPLE_PAGE)
+
+    llm_calls = []
+    prefetch = PrefetchCache(ttl=60)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = cached_service(client, monkeypatch, llm_calls)
+        service.prefetch = prefetch
+        key = project_prefetch_key("https://me.example/")
+        prefetch.start(key, lambda: service.collect_project("https://me.example/"))
+        assert (await prefetch.get(key))["status"] == "fetched"
+        assert len(requests) == 1 and llm_calls == []
+
+        analysis = await service.evaluate_project({"name": "Site", "url": "https://me.example"})
+
+    assert len(requests) == 1 and llm_calls == ["Site"]
+    assert analysis.is_live and analysis.seo_score == 90
+    assert prefetch.get_metrics()["used"] == 2
+
+def test_normalize_url_ignores_cosmetic_differences():
+    assert normalize_url("HTTPS://Jane.GitHub.io:443/Portfolio/?utm_source=cv&b=2&a=1#top") == "https://jane.github.io/Portfolio?a=1&b=2"
+    assert normalize_url("https://x.dev") == normalize_url("https://x.dev/#about")
+    assert normalize_url("https://x.dev/?reference=1") != normalize_url("https://x.dev/")
+
+def repository_stub(requests_seen, pushed_at):
+    def handler(request):
+        requests_seen.append(f"{request.url.host}{request.url.path}")
+        path = request.url.path
+        if path == "/repos/octo/shop-api":
+            return httpx.Response(200, json={
+                "full_name": "octo/shop-api", "description": "Inventory API", "language": "Python",
+                "stargazers_count": 12, "forks_count": 2, "topics": ["fastapi"], "license": {"spdx_id": "MIT"},
+                "pushed_at": pushed_at["value"], "homepage": "https://shop.example"
+            })
+        if path.endswith("/languages"):
+            return httpx.Response(200, json={"Python": 40000, "Dockerfile": 300})
+        if path.endswith("/contents"):
+            return httpx.Response(200, json=[{"name": "tests"}, {"name": ".travis.yml"}])
+        if path.endswith("/readme"):
+            return httpx.Response(200, json={"size": 1500})
+        return httpx.Response(404)
+    return handler
+
+@pytest.mark.asyncio
+async def test_github_repository_links_use_api_instead_of_scraping(monkeypatch):
+    """github.com repo links are scored from API metrics and never scraped"""
+    from app.services.github_service import GitHubService
+    from app.utils.cache import ConditionalHTTPCache
+    from app.utils.token_pool import TokenPool
+
+    seen = []
+    pushed_at = {"value": "2024-05-01T00:00:00Z"}
+    llm_calls = []
+    async with httpx.AsyncClient(transport=httpx.MockTransport(repository_stub(seen, pushed_at))) as client:
+        github_service = GitHubService(
+            client=client,
+            cache=ConditionalHTTPCache(PersistentCache("http", path=":memory:")),
+            token_pool=TokenPool([]),
+            inspection_cache=PersistentCache("repo_inspection", path=":memory:")
+        )
+        service = cached_service(client, monkeypatch, llm_calls)
+        service.github_service = github_service
+        service.config = {**service.config, "analysis_cache_ttl": 0}
+        project = {"name": "Shop API", "url": "https://github.com/octo/shop-api/tree/main/src"}
+
+        analysis = await service.evaluate_project(project)
+        unchanged = await service.evaluate_project(project)
+        pushed_at["value"] = "2024-06-01T00:00:00Z"
+        await service.evaluate_project(project)
+
+    assert all(host_path.startswith("api.github.com") for host_path in seen)
+    assert analysis.is_live and analysis.technologies == ["Python", "Dockerfile"]
+    assert analysis.repository["full_name"] == "octo/shop-api"
+    assert analysis.repository["inspection"]["has_tests"] and analysis.repository["inspection"]["has_ci"]
+    assert analysis.seo_score == analysis.responsiveness_score == 0.0
+    assert analysis.code_quality_score > 50
+    assert unchanged.complexity_score == 70.0
+    # Re-scored only after a new push
+    assert llm_calls == ["Shop API", "Shop API"]
+    assert service.cache_stats == {"hits": 0, "revalidated": 1, "misses": 2}
+
+def test_project_score_ignores_web_heuristics_for_repositories():
+    from app.agents.nodes import project_score
+
+    site = fake_analysis({"name": "site", "url": "https://site.example"})
+    repository = ProjectAnalysis(**{
+        **site.model_dump(), "complexity_score": 80.0, "performance_score": 0.0, "responsiveness_score": 0.0,
+        "seo_score": 0.0, "code_quality_score": 60.0, "repository": {"full_name": "octo/api"}
+    })
+
+    assert project_score(site) == 50.0
+    assert project_score(repository) == 70.0
@@ -0,0 +1,118 @@
+import pytest
+import asyncio
+import httpx
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from app.utils.resilience import (
+    CircuitOpenError, LLMCircuitCallback, ResilienceRegistry, ResilientTransport, OPEN, CLOSED
+)
+
+def registry(**kwargs):
+    options = {"failure_threshold": 3, "open_seconds": 0.2, "backoff_base": 0.001, "backoff_max": 0.002}
+    options.update(kwargs)
+    return ResilienceRegistry(**options)
+
+@pytest.mark.asyncio
+async def test_circuit_opens_fails_fast_and_recovers():
+    calls = []
+    healthy = {"up": False}
+
+    def handler(request):
+        calls.append(request.url.host)
+        if request.url.host == "down.example" and not healthy["up"]:
+            raise httpx.ConnectTimeout("upstream down", request=request)
+        return httpx.Response(200, text="ok")
+
+    breakers = registry(max_retries=0)
+    transport = ResilientTransport(httpx.MockTransport(handler), breakers)
+    async with httpx.AsyncClient(transport=transport) as client:
+        for _ in range(3):
+            with pytest.raises(httpx.ConnectTimeout):
+                await client.get("https://down.example/")
+        assert breakers.breaker("down.example").state == OPEN
+
+        # Open circuit: no request leaves the process
+        with pytest.raises(CircuitOpenError):
+            await client.get("https://down.example/")
+        assert len(calls) == 3
+        # Other hosts are unaffected
+        assert (await client.get("https://up.example/")).status_code == 200
+
+        await asyncio.sleep(0.25)
+        healthy["up"] = True
+        # Half-open trial succeeds and closes the circuit
+        assert (await client.get("https://down.example/")).status_code == 200
+        assert breakers.breaker("down.example").state == CLOSED
+
+    metrics = breakers.get_metrics()["down.example"]
+    assert metrics["fast_failed"] == 1 and metrics["opened"] == 1 and metrics["failures"] == 3
+
+@pytest.mark.asyncio
+async def test_retries_only_idempotent_requests_within_budget():
+    statuses = {"GET": [503, 200], "POST": [503, 200]}
+
+    def handler(request):
+        return httpx.Response(statuses[request.method].pop(0))
+
+    breakers = registry()
+    async with httpx.AsyncClient(transport=ResilientTransport(httpx.MockTransport(handler), breakers)) as client:
+        assert (await client.get("https://api.example/")).status_code == 200
+        assert (await client.post("https://api.example/")).status_code == 503
+
+    budget = breakers.budget("api.example")
+    assert budget.retries == 1
+
+    # An exhausted budget returns the failure instead of retrying
+    budget.balance = 0
+    budget.min_per_second = 0
+    async with httpx.AsyncClient(transport=ResilientTransport(httpx.MockTransport(lambda request: httpx.Response(502)), breakers)) as client:
+        assert (await client.get("https://api.example/")).status_code == 502
+    assert budget.denied == 1
+
+@pytest.mark.asyncio
+async def test_llm_calls_fail_fast_while_circuit_is_open():
+    breakers = registry()
+    callback = LLMCircuitCallback(breakers)
+    llm = FakeListChatModel(responses=["first", "second"], callbacks=[callback])
+
+    assert (await llm.ainvoke("hello")).content == "first"
+    for _ in range(3):
+        breakers.breaker(callback.host).record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        await llm.ainvoke("hello")
+
+    await asyncio.sleep(0.25)
+    # The rejected call never reached the model, so its next response is still unused
+    assert (await llm.ainvoke("hello")).content == "second"
+    assert breakers.breaker(callback.host).state == CLOSED
+
+@pytest.mark.asyncio
+async def test_timeouts_count_against_the_breaker_without_retrying():
+    attempts = []
+
+    def handler(request):
+        attempts.append(1)
+        raise httpx.ReadTimeout("no response", request=request)
+
+    breakers = registry(max_retries=2)
+    async with httpx.AsyncClient(transport=ResilientTransport(httpx.MockTransport(handler), breakers)) as client:
+        with pytest.raises(httpx.ReadTimeout):
+            await client.get("https://slow.example/")
+
+    # A hanging host costs one timeout per request, not one per attempt
+    assert len(attempts) == 1
+    assert breakers.get_metrics()["slow.example"]["failures"] == 1
+
+def test_idle_closed_hosts_are_evicted_and_summary_lists_only_open_circuits():
+    breakers = registry(max_hosts=3)
+    failing = breakers.breaker("down.example")
+    for _ in range(3):
+        failing.record_failure()
+    for index in range(5):
+        breakers.breaker(f"site{index}.example").record_success()
+
+    # The open circuit outlives healthy hosts seen after it
+    assert list(breakers.breakers) == ["down.example", "site3.example", "site4.example"]
+    summary = breakers.get_summary()
+    assert summary["hosts"] == 3 and summary["evicted"] == 3
+    assert list(summary["not_closed"]) == ["down.example"] and summary["not_closed"]["down.example"]["state"] == OPEN
@@ -0,0 +1,67 @@
+from pdfminer.fontmetrics import FONT_METRICS
+from app.utils.resume_parser import parse_pdf_resume, score_text_quality, select_pdf_extractor
+
+HELVETICA_WIDTHS = FONT_METRICS["Helvetica"][1]
+
+def text_lines(lines):
+    return "BT /F1 10 Tf 40 760 Td " + "".join(f"({line}) Tj 0 -14 Td " for line in lines) + "ET"
+
+def positioned_glyphs(lines):
+    """Every glyph placed on its own, as design-tool exports do; spaces are only gaps"""
+    parts = []
+    for row, line in enumerate(lines):
+        x = 40.0
+        for char in line:
+            if char != " ":
+                parts.append(f"1 0 0 1 {x:.2f} {760 - row * 14} Tm ({char}) Tj ")
+            x += HELVETICA_WIDTHS[char] * 10 / 1000 if char != " " else 5
+    return "BT /F1 10 Tf " + "".join(parts) + "ET"
+
+def build_pdf(streams) -> bytes:
+    page_ids = [4 + 2 * i for i in range(len(streams))]
+    objects = {
+        1: "<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{' '.join(f'{pid} 0 R' for pid in page_ids)}] /Count {len(streams)} >>",
+        3: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    }
+    for page_id, stream in zip(page_ids, streams):
+        objects[page_id] = (
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>"
+        )
+        objects[page_id + 1] = f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream"
+    pdf = b"%PDF-1.4\n"
+    offsets = {}
+    for number in sorted(objects):
+        offsets[number] = len(pdf)
+        pdf += f"{number} 0 obj\n{objects[number]}\nendobj\n".encode()
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    pdf += "".join(f"{offsets[number]:010d} 00000 n \n" for number in sorted(objects)).encode()
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return pdf
+
+LINES = ["Jane Doe", "Senior Backend Engineer building distributed Python services", "github.com/janedoe"]
+
+def test_score_text_quality():
+    assert score_text_quality("\n".join(LINES)) == 1.0
+    assert score_text_quality("SeniorBackendEngineerbuildingdistributedPythonservices") == 0.0
+    assert score_text_quality("(cid:12)(cid:7)(cid:44) Engineer") < 0.5
+    assert score_text_quality("   ") == 0.0
+
+def test_selects_extractor_from_first_page_quality():
+    name, pages = select_pdf_extractor(build_pdf([text_lines(LINES), text_lines(["Page two"])]))
+    assert name == "pypdf2"
+    assert [page.splitlines()[0] for page in pages] == ["Jane Doe", "Page two"]
+
+    # PyPDF2 runs individually placed glyphs together; pdfplumber rebuilds the words
+    designed = build_pdf([positioned_glyphs(LINES)])
+    name, pages = select_pdf_extractor(designed)
+    assert name == "pdfplumber"
+    assert "Senior Backend Engineer building" in parse_pdf_resume(designed)
+
+def test_stops_after_the_page_that_reaches_the_budget():
+    pdf = build_pdf([text_lines([f"Page {number} " + "experience " * 20]) for number in range(1, 9)])
+    text = parse_pdf_resume(pdf, char_budget=400)
+    assert "Page 2" in text and "Page 3" not in text
+    assert parse_pdf_resume(pdf, char_budget=10 ** 6).count("Page ") == 8
@@ -0,0 +1,141 @@
+import pytest
+import asyncio
+import httpx
+from app.models.schemas import GitHubAnalysis, Platform, SocialProfile, TwitterAnalysis
+from app.services.github_service import GitHubService
+from app.services.twitter_service import TwitterService, TwitterUserLookup
+from app.utils.cache import ConditionalHTTPCache, PersistentCache
+from app.utils.negative_cache import NegativeCache
+from app.utils.prefetch import PrefetchCache
+from app.utils.token_pool import TokenPool
+from app.utils.snapshot_store import PlatformSnapshotStore, profile_username
+
+def github_analysis(username, relevance=50.0, unavailable_reason=None):
+    return GitHubAnalysis(
+        username=username, public_repos_count=3, followers=1, following=0, total_commits=10,
+        repositories=[], languages={"Python": 3}, contribution_streak=2, code_quality_score=70.0,
+        project_complexity_score=40.0, domain_relevance_score=relevance, unavailable_reason=unavailable_reason
+    )
+
+def memory_store(ttl=3600):
+    return PlatformSnapshotStore(PersistentCache("platform_snapshots", path=":memory:"), {"github": ttl})
+
+def test_profile_username():
+    assert profile_username(SocialProfile(platform=Platform.GITHUB, url="https://github.com/Octo/")) == "Octo"
+    assert profile_username(SocialProfile(platform=Platform.MEDIUM, url="https://medium.com/@jane?source=x")) == "jane"
+    assert profile_username(SocialProfile(platform=Platform.TWITTER, url="https://x.com/jdoe")) == "jdoe"
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_fetch_and_later_ones_hit():
+    store = memory_store()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return github_analysis("octo")
+
+    results = await asyncio.gather(*[
+        store.get_or_fetch("github", name, "Backend", fetch, GitHubAnalysis) for name in ("octo", "Octo", "@octo")
+    ])
+    again = await store.get_or_fetch("github", "octo", " backend ", fetch, GitHubAnalysis)
+
+    assert len(calls) == 1
+    assert all(result == again for result in results)
+    assert store.get_metrics() == {"hits": 1, "misses": 1, "coalesced": 2, "refreshed": 0, "in_flight": 0}
+
+    # Another job domain scores relevance differently and is fetched on its own
+    await store.get_or_fetch("github", "octo", "Machine Learning", fetch, GitHubAnalysis)
+    assert len(calls) == 2
+
+@pytest.mark.asyncio
+async def test_stale_failed_and_refreshed_snapshots_are_refetched():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return github_analysis("octo", unavailable_reason="error" if len(calls) == 1 else None)
+
+    store = memory_store()
+    failed = await store.get_or_fetch("github", "octo", "Backend", fetch, GitHubAnalysis)
+    assert failed.unavailable_reason == "error"
+    await store.get_or_fetch("github", "octo", "Backend", fetch, GitHubAnalysis)
+    await store.get_or_fetch("github", "octo", "Backend", fetch, GitHubAnalysis)
+    assert len(calls) == 2
+
+    assert store.invalidate("github", "OCTO")
+    await store.get_or_fetch("github", "octo", "Backend", fetch, GitHubAnalysis)
+    assert len(calls) == 3
+
+    stale = memory_store(ttl=0)
+    await stale.get_or_fetch("github", "octo", "Backend", fetch, GitHubAnalysis)
+    await stale.get_or_fetch("github", "octo", "Backend", fetch, GitHubAnalysis)
+    assert len(calls) == 5
+
+@pytest.mark.asyncio
+async def test_failed_upstream_lookups_are_not_snapshotted(monkeypatch):
+    monkeypatch.setenv("TWITTER_BEARER_TOKEN", "token")
+
+    def unreachable(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    store = PlatformSnapshotStore(PersistentCache("platform_snapshots", path=":memory:"), {"github": 3600, "twitter": 3600})
+    async with httpx.AsyncClient(transport=httpx.MockTransport(unreachable)) as github_client, \
+            httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(503))) as twitter_client:
+        github = GitHubService(
+            client=github_client,
+            cache=ConditionalHTTPCache(PersistentCache("http", path=":memory:")),
+            token_pool=TokenPool([]),
+            missing_users=NegativeCache("missing_github_users", path=":memory:"),
+            prefetch=PrefetchCache()
+        )
+        twitter = TwitterService(
+            client=twitter_client,
+            user_lookup=TwitterUserLookup(
+                client=twitter_client,
+                cache=PersistentCache("twitter_users", path=":memory:"),
+                missing_cache=PersistentCache("twitter_users_missing", path=":memory:")
+            ),
+            prefetch=PrefetchCache()
+        )
+        github_result = await store.get_or_fetch(
+            "github", "octo", "Backend", lambda: github.analyze_profile("octo", "Backend"), GitHubAnalysis
+        )
+        twitter_result = await store.get_or_fetch(
+            "twitter", "jdoe", "Backend", lambda: twitter.analyze_profile("jdoe", "Backend"), TwitterAnalysis
+        )
+
+    assert github_result.unavailable_reason == twitter_result.unavailable_reason == "error"
+    assert store.cache.get(store._key("github", "octo")) is None
+    assert store.cache.get(store._key("twitter", "jdoe")) is None
+
+@pytest.mark.asyncio
+async def test_forced_refresh_drops_cached_twitter_users_and_prefetches(monkeypatch):
+    from app import main
+    from app.models.schemas import ProfileRefreshRequest
+    from app.utils.prefetch import prefetch_key
+
+    lookup = TwitterUserLookup(
+        cache=PersistentCache("twitter_users", path=":memory:"),
+        missing_cache=PersistentCache("twitter_users_missing", path=":memory:")
+    )
+    lookup.cache.set("jdoe", {"id": "1", "username": "jdoe", "public_metrics": {"followers_count": 10}})
+    prefetch = PrefetchCache(ttl=60)
+
+    async def stale():
+        return "stale collection"
+
+    prefetch.start(prefetch_key("twitter", "jdoe"), stale)
+    prefetch.start(prefetch_key("github", "octo"), stale)
+    monkeypatch.setattr(main, "twitter_user_lookup", lookup)
+    monkeypatch.setattr(main, "profile_prefetch", prefetch)
+    monkeypatch.setattr(main, "platform_snapshots", memory_store())
+    monkeypatch.setattr(main, "missing_github_users", NegativeCache("missing_github_users", path=":memory:"))
+
+    await main.refresh_profiles(ProfileRefreshRequest(social_profiles=[
+        SocialProfile(platform=Platform.TWITTER, url="https://x.com/JDoe"),
+        SocialProfile(platform=Platform.GITHUB, url="https://github.com/octo")
+    ]))
+
+    assert lookup.cache.get("jdoe") is None
+    assert prefetch.get_metrics()["entries"] == 0
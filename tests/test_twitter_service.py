@@ -0,0 +1,140 @@
+import pytest
+import asyncio
+import httpx
+from app.services.twitter_service import TimelineAggregator, TwitterService, TwitterUserLookup
+from app.utils.cache import PersistentCache
+
+def tweet(i, likes=0, impressions=0, kind=None, hours=24):
+    data = {
+        "id": str(i),
+        "text": f"tweet {i} about python",
+        "created_at": f"2024-05-{1 + i * hours // 24:02d}T{(i * hours) % 24:02d}:00:00.000Z",
+        "public_metrics": {"like_count": likes, "retweet_count": 0, "reply_count": 1, "quote_count": 0,
+                           "impression_count": impressions}
+    }
+    if kind:
+        data["referenced_tweets"] = [{"type": kind, "id": "0"}]
+    return data
+
+def memory_lookup(client, **kwargs):
+    return TwitterUserLookup(
+        client=client,
+        cache=PersistentCache("twitter_users", path=":memory:"),
+        missing_cache=PersistentCache("twitter_users_missing", path=":memory:"),
+        **kwargs
+    )
+
+def test_timeline_aggregator_computes_metrics_locally():
+    timeline = TimelineAggregator(sample_size=2)
+    timeline.add_page([tweet(0, likes=9, impressions=100), tweet(1, kind="replied_to", likes=4, impressions=100)])
+    timeline.add_page([tweet(2, kind="retweeted", likes=500), tweet(3, kind="quoted", likes=0, impressions=0)])
+
+    metrics = timeline.metrics(followers=1000)
+
+    assert metrics["tweets_analyzed"] == 4 and metrics["pages"] == 2
+    # Retweets are excluded from engagement: (10 + 5 + 1) interactions over 200 impressions
+    assert metrics["engagement_rate"] == 8.0
+    assert metrics["reply_ratio"] == 0.25 and metrics["retweet_ratio"] == 0.25 and metrics["quote_ratio"] == 0.25
+    assert metrics["median_gap_hours"] == 24.0
+    assert timeline.texts == ["tweet 0 about python", "tweet 1 about python"]
+
+@pytest.mark.asyncio
+async def test_timeline_paginates_up_to_window_and_classifies_once(monkeypatch):
+    monkeypatch.setenv("TWITTER_BEARER_TOKEN", "token")
+    timeline_requests = []
+
+    def handler(request):
+        if request.url.path == "/2/users/by":
+            return httpx.Response(200, json={"data": [
+                {"id": "42", "username": "Jane", "public_metrics": {"followers_count": 100}}
+            ]})
+        timeline_requests.append(dict(request.url.params))
+        page = int(request.url.params.get("pagination_token", "0"))
+        return httpx.Response(200, json={
+            "data": [tweet(page * 100 + i, likes=2, impressions=50, hours=1) for i in range(100)],
+            "meta": {"next_token": str(page + 1)}
+        })
+
+    classified = []
+
+    async def fake_classify(texts, domain):
+        classified.append(len(texts))
+        return {"technical_count": 30, "domain_relevant": 20, "relevance_score": 65.0}
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = TwitterService(client=client, user_lookup=memory_lookup(client))
+        service.config = {"timeline_max_tweets": 250, "timeline_days": 30, "classification_sample": 40}
+        monkeypatch.setattr(service, "_analyze_tweets", fake_classify)
+        analysis = await service.analyze_profile("jane", "Backend")
+
+    assert [params.get("pagination_token") for params in timeline_requests] == [None, "1", "2"]
+    assert timeline_requests[0]["max_results"] == "100" and "start_time" in timeline_requests[0]
+    assert analysis.activity["tweets_analyzed"] == 250
+    assert analysis.engagement_rate == 6.0
+    assert classified == [40]
+    assert analysis.domain_relevance_score == 65.0
+
+@pytest.mark.asyncio
+async def test_user_lookups_are_micro_batched_and_cached():
+    """Concurrent lookups share multi-user requests of at most 100 names"""
+    batches = []
+
+    def handler(request):
+        names = request.url.params["usernames"].split(",")
+        batches.append(len(names))
+        return httpx.Response(200, json={
+            "data": [{"id": name[4:], "username": name.upper()} for name in names if name != "ghost"],
+            "errors": [{"value": "ghost", "title": "Not Found Error"}] if "ghost" in names else []
+        })
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        lookup = memory_lookup(client, window=0.02)
+        names = [f"user{i}" for i in range(230)] + ["User7", "@user8", "ghost"]
+        users = await asyncio.gather(*[lookup.lookup(name) for name in names])
+        again = await asyncio.gather(lookup.lookup("user3"), lookup.lookup("ghost"))
+
+    assert sorted(batches) == [31, 100, 100]
+    assert users[7] == users[230] == {"id": "7", "username": "USER7"}
+    assert users[231]["id"] == "8"
+    assert users[-1] is None
+    assert again[0]["id"] == "3" and again[1] is None
+    assert lookup.metrics["requests"] == 3
+    assert lookup.metrics["cache_hits"] == 1 and lookup.metrics["negative_hits"] == 1
+
+@pytest.mark.asyncio
+async def test_failed_user_lookup_is_not_negatively_cached():
+    statuses = [429, 200]
+
+    def handler(request):
+        status = statuses.pop(0)
+        if status != 200:
+            return httpx.Response(status)
+        return httpx.Response(200, json={"data": [{"id": "1", "username": "jane"}]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        lookup = memory_lookup(client, window=0.01)
+        assert await lookup.lookup("jane") is None
+        assert await lookup.lookup("jane") == {"id": "1", "username": "jane"}
+
+@pytest.mark.asyncio
+async def test_invalid_handles_do_not_fail_the_shared_batch():
+    batches = []
+
+    def handler(request):
+        names = request.url.params["usernames"].split(",")
+        batches.append(names)
+        if "rejected" in names:
+            return httpx.Response(400, json={"errors": [{"message": "The `usernames` query parameter value is not valid"}]})
+        return httpx.Response(200, json={"data": [{"id": name, "username": name} for name in names]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        lookup = memory_lookup(client, window=0.02)
+        users = await asyncio.gather(*[lookup.lookup(name) for name in ["jane", "john.doe", "a" * 16, "rejected", "max"]])
+
+    # Malformed handles never reach the API and count as missing
+    assert users[1] is None and users[2] is None
+    assert lookup.is_known_missing("john.doe")
+    # A 400 for the batch falls back to one request per name
+    assert users[0]["id"] == "jane" and users[4]["id"] == "max" and users[3] is None
+    assert sorted(batches, key=len) == [["jane"], ["rejected"], ["max"], ["jane", "rejected", "max"]]
+    assert not lookup.is_known_missing("rejected")
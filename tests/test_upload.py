@@ -0,0 +1,57 @@
+import io
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+from docx import Document
+from app.utils.upload import MULTIPART_OVERHEAD, UploadLimitMiddleware, sniff_document_type
+
+def build_docx(paragraphs) -> bytes:
+    document = Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+def test_sniff_document_type_ignores_the_filename():
+    assert sniff_document_type(b"%PDF-1.7\n%\xe2\xe3") == "pdf"
+    assert sniff_document_type(build_docx(["Jane Doe"])[:8192]) == "docx"
+    assert sniff_document_type(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1\x00\x00") == "doc"
+    assert sniff_document_type("Jane Doe — Engineer\n".encode("utf-8")) == "txt"
+    assert sniff_document_type(b"\x89PNG\r\n\x1a\n\x00\x00") is None
+    assert sniff_document_type(b"PK\x03\x04not an office document") is None
+
+def limited_app(calls):
+    app = FastAPI()
+    app.add_middleware(UploadLimitMiddleware, paths={"/upload"}, max_bytes=1024)
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        calls.append(file.filename)
+        return {"size": len(await file.read())}
+
+    return app
+
+def multipart(content: bytes) -> bytes:
+    return (
+        b"--boundary\r\nContent-Disposition: form-data; name=\"file\"; filename=\"cv.txt\"\r\n\r\n"
+        + content + b"\r\n--boundary--\r\n"
+    )
+
+def test_upload_limit_counts_bodies_sent_without_content_length():
+    calls = []
+    client = TestClient(limited_app(calls))
+    headers = {"Content-Type": "multipart/form-data; boundary=boundary"}
+
+    def chunks(body):
+        for start in range(0, len(body), 16 * 1024):
+            yield body[start:start + 16 * 1024]
+
+    assert client.post("/upload", content=chunks(multipart(b"x" * 100)), headers=headers).json() == {"size": 100}
+    # Chunked, so only the bytes received can trip the limit
+    response = client.post("/upload", content=chunks(multipart(b"x" * (MULTIPART_OVERHEAD + 4096))), headers=headers)
+    assert response.status_code == 413 and calls == ["cv.txt"]
+
+def test_upload_limit_refuses_declared_oversized_bodies_up_front():
+    calls = []
+    response = TestClient(limited_app(calls)).post("/upload", files={"file": ("cv.txt", b"x" * (MULTIPART_OVERHEAD + 4096))})
+    assert response.status_code == 413 and calls == []